@@ -0,0 +1,131 @@
+# audio.py
+from collections import deque
+
+import pygame as pg
+
+
+class AudioManager:
+    """Plays sounds through a fixed budget of mixer channels.
+
+    - Looping sounds (engines) get reserved channels that one-shot sounds
+      never take, and are only started or stopped when their state changes.
+    - Each one-shot sound has a voice cap: past it, its oldest voice restarts.
+    - When no channel is free, a sound takes the channel of the oldest sound
+      with a lower priority, or is dropped.
+    - Triggers of the same sound within coalesce_ms of the last one are merged.
+    - At most max_calls mixer calls (play, stop) are made per second. Two
+      per reserved channel are kept for the loops, so a burst of one-shot
+      sounds never keeps an engine from starting or stopping.
+    """
+
+    def __init__(self, channels=8, reserved=2, max_calls=40):
+        pg.mixer.set_num_channels(channels)
+        pg.mixer.set_reserved(reserved)
+        self.reserved = reserved
+        self.channels = [pg.mixer.Channel(i) for i in range(channels)]
+        self.max_calls = max_calls
+        self.sounds = {}  # name -> (sound, priority, voices, coalesce_ms)
+        self.playing = {}  # channel index -> (priority, started, name)
+        self.loops = {}  # reserved channel index -> name of the loop playing on it
+        self.last_trigger = {}
+        self.calls = deque()  # times of the mixer calls of the last second
+        self.stats = {"calls": 0, "played": 0, "coalesced": 0, "capped": 0, "stolen": 0, "dropped": 0}
+
+    def add(self, name, sound, priority=0, voices=2, coalesce_ms=50):
+        self.sounds[name] = (sound, priority, voices, coalesce_ms)
+
+    def _budget(self, now, limit):
+        """Whether another mixer call fits in the last second's budget."""
+        while self.calls and now - self.calls[0] >= 1000:
+            self.calls.popleft()
+        return len(self.calls) < limit
+
+    def _spend(self, now):
+        self.calls.append(now)
+        self.stats["calls"] += 1
+
+    def _pick_channel(self, name, priority, voices):
+        busy = []
+        free = None
+        for i in range(self.reserved, len(self.channels)):
+            if self.channels[i].get_busy():
+                busy.append(i)
+            else:
+                self.playing.pop(i, None)
+                if free is None:
+                    free = i
+
+        # Voice cap: restart the oldest voice of this sound
+        own = [i for i in busy if i in self.playing and self.playing[i][2] == name]
+        if len(own) >= voices:
+            self.stats["capped"] += 1
+            return min(own, key=lambda i: self.playing[i][1])
+        if free is not None:
+            return free
+        # Take over the oldest sound of the lowest priority below this one
+        lower = [i for i in busy if self.playing.get(i, (priority,))[0] < priority]
+        if lower:
+            self.stats["stolen"] += 1
+            return min(lower, key=lambda i: self.playing[i][:2])
+        return None
+
+    def play(self, name, now=None):
+        """Trigger a one-shot sound. Returns whether the mixer was asked to play it."""
+        entry = self.sounds.get(name)
+        if entry is None or entry[0] is None:
+            return False
+        sound, priority, voices, coalesce_ms = entry
+        now = pg.time.get_ticks() if now is None else now
+        last = self.last_trigger.get(name)
+        if last is not None and now - last < coalesce_ms:
+            self.stats["coalesced"] += 1
+            return False
+        self.last_trigger[name] = now
+
+        # Budget first, so a dropped sound is never also counted as capped or stolen
+        channel = None
+        if self._budget(now, self.max_calls - 2 * self.reserved):
+            channel = self._pick_channel(name, priority, voices)
+        if channel is None:
+            self.stats["dropped"] += 1
+            return False
+        self._spend(now)
+        self.channels[channel].play(sound)
+        self.playing[channel] = (priority, now, name)
+        self.stats["played"] += 1
+        return True
+
+    def stop(self, name, now=None):
+        """Stop every voice of a one-shot sound."""
+        now = pg.time.get_ticks() if now is None else now
+        for i, (_, _, playing) in list(self.playing.items()):
+            if playing != name or i in self.loops:
+                continue
+            if not self.channels[i].get_busy():
+                del self.playing[i]
+            elif self._budget(now, self.max_calls - 2 * self.reserved):
+                self._spend(now)
+                self.channels[i].stop()
+                del self.playing[i]
+
+    def loop(self, name, voice, on, now=None):
+        """Keep the looping sound name playing on reserved channel voice while on is true."""
+        entry = self.sounds.get(name)
+        if entry is None or entry[0] is None or voice >= self.reserved:
+            return
+        if (self.loops.get(voice) == name) == bool(on):
+            return
+        now = pg.time.get_ticks() if now is None else now
+        if not self._budget(now, self.max_calls):
+            return  # tried again on the next call
+        self._spend(now)
+        channel = self.channels[voice]
+        if on:
+            channel.play(entry[0], loops=-1)
+            self.loops[voice] = name
+            self.playing[voice] = (entry[1], now, name)
+            self.stats["played"] += 1
+        else:
+            channel.stop()
+            del self.loops[voice]
+            self.playing.pop(voice, None)
@@ -0,0 +1,88 @@
+# bench_audio.py
+# Sound triggers of an army battle: every shot and every hit asks for a
+# sound. Plays them straight on the mixer (as before) and through
+# AudioManager, and counts the mixer calls per second and the sounds lost
+# because all channels were busy. Runs in real time, since channels only
+# free up as their sounds finish.
+#
+#   python bench_audio.py [--tanks 500] [--seconds 3]
+import argparse
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame as pg
+
+import config
+from audio import AudioManager
+
+TICK = 1 / 60
+
+
+def triggers(rng, tanks):
+    # Every tank fires once per reload; about one shot in five hits
+    shots = sum(rng.random() < 1 / config.ARMY["reload"] for _ in range(tanks))
+    return shots, sum(rng.random() < 0.2 for _ in range(shots))
+
+
+def run_direct(sounds, tanks, seconds):
+    rng = random.Random(1)
+    calls = lost = 0
+    start = time.perf_counter()
+    ticks = int(seconds / TICK)
+    for tick in range(ticks):
+        shots, hits = triggers(rng, tanks)
+        for name, count in (("shoot", shots), ("explosion", hits)):
+            for _ in range(count):
+                calls += 1
+                if sounds[name].play() is None:
+                    lost += 1
+        time.sleep(max(0, start + (tick + 1) * TICK - time.perf_counter()))
+    pg.mixer.stop()
+    return calls / seconds, lost
+
+
+def run_managed(sounds, tanks, seconds):
+    rng = random.Random(1)
+    audio = AudioManager(reserved=2)
+    audio.add("move", sounds["move"])
+    audio.add("shoot", sounds["shoot"], priority=1, voices=3, coalesce_ms=60)
+    audio.add("explosion", sounds["explosion"], priority=2, voices=3, coalesce_ms=100)
+    start = time.perf_counter()
+    ticks = int(seconds / TICK)
+    for tick in range(ticks):
+        shots, hits = triggers(rng, tanks)
+        now = int((time.perf_counter() - start) * 1000)
+        for name, count in (("shoot", shots), ("explosion", hits)):
+            for _ in range(count):
+                audio.play(name, now)
+        # Two player engines switching on and off every half second
+        audio.loop("move", 0, tick // 30 % 2, now)
+        audio.loop("move", 1, tick // 45 % 2, now)
+        time.sleep(max(0, start + (tick + 1) * TICK - time.perf_counter()))
+    pg.mixer.stop()
+    return audio.stats["calls"] / seconds, audio.stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark mixer use with and without AudioManager")
+    parser.add_argument("--tanks", type=int, default=500)
+    parser.add_argument("--seconds", type=float, default=3)
+    args = parser.parse_args()
+
+    pg.mixer.init()
+    pg.init()
+    sounds = {name: pg.mixer.Sound(f"assets/{path}") for name, path in
+              (("move", "tank-move.mp3"), ("shoot", "tank-shots.mp3"), ("explosion", "tank-hits.mp3"))}
+    pg.mixer.set_num_channels(8)
+    rate, lost = run_direct(sounds, args.tanks, args.seconds)
+    print(f"direct        {rate:8.0f} mixer calls/s, {lost} sounds lost to busy channels")
+    rate, stats = run_managed(sounds, args.tanks, args.seconds)
+    print(f"AudioManager  {rate:8.0f} mixer calls/s, " + ", ".join(f"{key} {value}" for key, value in stats.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# bench_bullets.py
+# Holding the fire key: how many Bullet objects can be built per second when
+# each one draws its own surface (as before) and when all of them share the
+# images of bullet_atlas. Also times drawing 2,000 of them.
+#
+#   python bench_bullets.py [--bullets 20000] [--draw 2000]
+import argparse
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg
+
+import config
+from game_objects import Bullet, bullet_atlas, bullet_image
+
+
+class DrawnBullet(Bullet):
+    # The same bullet, but with its own freshly drawn surface
+    def __init__(self, x, y, direction):
+        super().__init__(x, y, direction)
+        self.image = bullet_image(self.base_color)
+
+
+def spawn(make, count):
+    start = time.perf_counter()
+    bullets = [make(random.randrange(config.SCREEN_WIDTH), random.randrange(config.SCREEN_HEIGHT), 1)
+               for _ in range(count)]
+    return count / (time.perf_counter() - start), bullets
+
+
+def draw(screen, bullets, rounds=20):
+    group = pg.sprite.Group(bullets)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        screen.fill(config.LIGHT_CORAL)
+        group.draw(screen)
+    return (time.perf_counter() - start) / rounds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark bullet construction")
+    parser.add_argument("--bullets", type=int, default=20000)
+    parser.add_argument("--draw", type=int, default=2000)
+    args = parser.parse_args()
+
+    pg.init()
+    screen = pg.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+    start = time.perf_counter()
+    bullet_atlas.load()
+    print(f"atlas build        {(time.perf_counter() - start) * 1000:7.3f} ms ({len(bullet_atlas.colors)} images)")
+
+    for name, make in (("own surface", DrawnBullet), ("shared atlas", Bullet)):
+        rate, bullets = spawn(make, args.bullets)
+        frame = draw(screen, bullets[:args.draw])
+        print(f"{name:<18} {rate:9.0f} bullets/s  draw {frame * 1000:6.2f} ms for {args.draw}")
+
+
+if __name__ == "__main__":
+    main()
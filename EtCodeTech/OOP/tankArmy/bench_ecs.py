@@ -0,0 +1,115 @@
+# bench_ecs.py
+# Army battle workload: 500 tanks and a steady 5,000 bullets in flight.
+# Compares the sprite classes of game_objects.py (per-object update and
+# groupcollide per team) with the NumPy ECS world of ecs.py.
+#
+#   python bench_ecs.py [--tanks 500] [--bullets 5000] [--ticks 300]
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame as pg
+
+import config
+from ecs import World
+from game_objects import Tank, bullet_atlas
+
+HEALTH = 30000  # nobody dies, so the workload stays the same for every tick
+
+
+def positions(rng, tanks):
+    half = tanks // 2
+    x = np.concatenate((rng.uniform(0, 200, half), rng.uniform(config.SCREEN_WIDTH - 264, config.SCREEN_WIDTH - 64, tanks - half)))
+    return x, rng.uniform(0, config.SCREEN_HEIGHT - 64, tanks), half
+
+
+def run_sprites(screen, tanks, bullets, ticks):
+    rng = np.random.default_rng(1)
+    xs, ys, half = positions(rng, tanks)
+    teams = [pg.sprite.Group(), pg.sprite.Group()]
+    shots = [pg.sprite.Group(), pg.sprite.Group()]
+    army = []
+    for i, (x, y) in enumerate(zip(xs.tolist(), ys.tolist())):
+        team = 0 if i < half else 1
+        tank = Tank(int(x), int(y), "assets/tanker64.png" if team == 0 else "assets/tankers64.png", 1 - 2 * team)
+        tank.health = HEALTH
+        teams[team].add(tank)
+        army.append((team, tank))
+    everything = pg.sprite.Group(*teams)
+
+    update = render = 0.0
+    for _ in range(ticks):
+        start = time.perf_counter()
+        # Top up the bullets in flight by letting random tanks fire
+        missing = bullets - len(shots[0]) - len(shots[1])
+        for i in rng.integers(0, tanks, max(0, missing)).tolist():
+            team, tank = army[i]
+            bullet = tank.shoot()
+            shots[team].add(bullet)
+            everything.add(bullet)
+        for team in teams:
+            for tank in team:
+                tank.move(tank.speed_x, tank.speed_y)
+        shots[0].update()
+        shots[1].update()
+        for team in (0, 1):
+            hits = pg.sprite.groupcollide(shots[team], teams[1 - team], True, False)
+            for victims in hits.values():
+                victims[0].take_damage(20)
+        middle = time.perf_counter()
+        screen.fill(config.LIGHT_CORAL)
+        everything.draw(screen)
+        update += middle - start
+        render += time.perf_counter() - middle
+    return update / ticks, render / ticks
+
+
+def run_ecs(screen, tanks, bullets, ticks):
+    rng = np.random.default_rng(1)
+    xs, ys, half = positions(rng, tanks)
+    world = World(config.SCREEN_WIDTH, config.SCREEN_HEIGHT, seed=1)
+    world.add_tanks(xs[:half], ys[:half], 0, 1, health=HEALTH)
+    world.add_tanks(xs[half:], ys[half:], 1, -1, health=HEALTH)
+    tank_images = [pg.image.load(path).convert_alpha() for path in ("assets/tanker64.png", "assets/tankers64.png")]
+    bullet_images = bullet_atlas.load()
+
+    update = render = 0.0
+    for _ in range(ticks):
+        start = time.perf_counter()
+        missing = bullets - world.bullets.count
+        world.tanks.trigger[rng.integers(0, tanks, max(0, missing))] = True
+        world.update()
+        middle = time.perf_counter()
+        screen.fill(config.LIGHT_CORAL)
+        t, b = world.tanks, world.bullets
+        live = np.flatnonzero(t.alive[:t.count])
+        screen.blits(list(zip([tank_images[team] for team in t.team[live].tolist()],
+                              zip(t.x[live].astype(int).tolist(), t.y[live].astype(int).tolist()))), False)
+        screen.blits(list(zip([bullet_images[color] for color in b.color[:b.count].tolist()],
+                              zip(b.x[:b.count].astype(int).tolist(), b.y[:b.count].astype(int).tolist()))), False)
+        update += middle - start
+        render += time.perf_counter() - middle
+    return update / ticks, render / ticks
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sprites vs ECS for tank armies")
+    parser.add_argument("--tanks", type=int, default=500)
+    parser.add_argument("--bullets", type=int, default=5000)
+    parser.add_argument("--ticks", type=int, default=300)
+    args = parser.parse_args()
+
+    pg.init()
+    screen = pg.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+    print(f"{args.tanks} tanks, {args.bullets} bullets, {args.ticks} ticks")
+    for name, run in (("sprites", run_sprites), ("ecs", run_ecs)):
+        update, render = run(screen, args.tanks, args.bullets, args.ticks)
+        print(f"{name:<8} update {update * 1000:6.2f} ms  render {render * 1000:6.2f} ms  "
+              f"total {(update + render) * 1000:6.2f} ms/frame ({1 / (update + render):5.0f} FPS)")
+
+
+if __name__ == "__main__":
+    main()
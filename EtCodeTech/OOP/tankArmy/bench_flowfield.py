@@ -0,0 +1,75 @@
+# bench_flowfield.py
+# Flow fields on the tankArmy battlefield: full rebuild of a team's field,
+# incremental repair when a wall appears or disappears, and the cost of
+# steering 1,000 units by looking up their cell.
+#
+#   python bench_flowfield.py [--units 1000] [--cell 20] [--walls 12] [--rounds 50]
+import argparse
+import random
+import time
+
+import numpy as np
+
+import config
+from flowfield import FlowField, FlowFields
+
+
+def timed(function, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        function()
+    return (time.perf_counter() - start) / rounds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark flow-field pathfinding")
+    parser.add_argument("--units", type=int, default=1000)
+    parser.add_argument("--cell", type=int, default=config.FLOW_CELL)
+    parser.add_argument("--walls", type=int, default=12)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    flow = FlowFields(config.SCREEN_WIDTH, config.SCREEN_HEIGHT, args.cell, config.ARMY["tank_size"])
+    for _ in range(args.walls):
+        flow.add_wall((rng.randrange(100, 700), rng.randrange(0, 560), rng.randrange(10, 30), rng.randrange(40, 200)))
+    flow.set_goal(0, [config.ARMY["goals"][0]])
+    flow.set_goal(1, [config.ARMY["goals"][1]])
+    print(f"grid {flow.cols}x{flow.rows} cells of {args.cell}px, {args.walls} walls")
+
+    rebuild = timed(lambda: FlowField(flow, flow.goals[0]), args.rounds)
+    print(f"full rebuild        {rebuild * 1000:8.3f} ms per team")
+
+    flow.field(0)
+    flow.field(1)
+    walls = [(rng.randrange(100, 700), rng.randrange(0, 560), 20, rng.randrange(40, 120)) for _ in range(args.rounds)]
+    start = time.perf_counter()
+    for wall in walls:
+        flow.add_wall(wall)
+    added = (time.perf_counter() - start) / len(walls) / 2
+    start = time.perf_counter()
+    for wall in walls:
+        flow.remove_wall(wall)
+    removed = (time.perf_counter() - start) / len(walls) / 2
+    print(f"repair, wall added  {added * 1000:8.3f} ms per team")
+    print(f"repair, wall gone   {removed * 1000:8.3f} ms per team")
+
+    units = np.random.default_rng(1)
+    x = units.uniform(0, config.SCREEN_WIDTH, args.units).astype(np.float32)
+    y = units.uniform(0, config.SCREEN_HEIGHT, args.units).astype(np.float32)
+    field = flow.field(0)
+    lookup = timed(lambda: flow.directions(0, x, y), args.rounds * 20)
+    print(f"lookup, vectorized  {lookup * 1e6:8.1f} us per frame for {args.units} units "
+          f"({lookup * 1e9 / args.units:.0f} ns per unit)")
+
+    def one_by_one():
+        for ux, uy in zip(x.tolist(), y.tolist()):
+            field.lookup(ux, uy)
+
+    single = timed(one_by_one, args.rounds)
+    print(f"lookup, per unit    {single * 1e6:8.1f} us per frame for {args.units} units "
+          f"({single * 1e9 / args.units:.0f} ns per unit)")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,4 +6,36 @@ SCREEN_HEIGHT = 600
 WHITE = (255, 255, 255)
 LIGHT_CORAL = WHITE
 TANK_SPEED = 5
-BULLET_SPEED = 10
\ No newline at end of file
+BULLET_SPEED = 10
+
+# Battle modes. Both run on the same ECS world (ecs.py); they only differ in
+# how many tanks each team has, their size and who drives them.
+DUEL = {
+    "tanks_per_team": 1,
+    "players": 2,  # the first tank of team 1 and team 2 is keyboard controlled
+    "tank_size": (64, 64),
+    "bullet_size": (30, 30),
+    "bullet_speed": BULLET_SPEED * 2,
+    "reload": 0,  # frames between shots
+    "health": 100,
+    "team_names": ("Tank 1", "Tank 2"),
+}
+ARMY = {
+    "tanks_per_team": 250,
+    "players": 0,
+    "tank_size": (24, 24),
+    "bullet_size": (8, 8),
+    "bullet_speed": 4,
+    "reload": 30,
+    "health": 500,
+    "team_names": ("Team 1", "Team 2"),
+    # Two walls with gaps between each army and the middle. The AI finds its
+    # way through them to the front line of its team (flowfield.py).
+    "walls": [(290, 0, 20, 200), (290, 280, 20, 120), (290, 480, 20, 120),
+              (490, 0, 20, 120), (490, 200, 20, 120), (490, 400, 20, 200)],
+    "goals": [(330, 0, 40, 600), (430, 0, 40, 600)],
+}
+FLOW_CELL = 20  # size in pixels of a flow-field grid cell
+WALL_COLOR = (90, 90, 90)
+MODES = {"duel": DUEL, "army": ARMY}
+BULLET_DAMAGE = 20
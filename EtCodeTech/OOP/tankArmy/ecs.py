@@ -0,0 +1,290 @@
+# ecs.py
+import numpy as np
+
+
+class Table:
+    """Component storage: one contiguous NumPy column per component.
+
+    Rows [0, count) are in use. Systems work on whole column slices at once
+    instead of looping over objects.
+    """
+
+    def __init__(self, capacity, **columns):
+        self.dtypes = columns  # component name -> dtype
+        self.count = 0
+        self.allocate(capacity)
+
+    def allocate(self, capacity):
+        self.capacity = capacity
+        for name, dtype in self.dtypes.items():
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+
+    def __len__(self):
+        return self.count
+
+    def reserve(self, extra):
+        if self.count + extra <= self.capacity:
+            return
+        old = {name: getattr(self, name) for name in self.dtypes}
+        capacity = self.capacity
+        while capacity < self.count + extra:
+            capacity *= 2
+        self.allocate(capacity)
+        for name, column in old.items():
+            getattr(self, name)[:self.count] = column[:self.count]
+
+    def add(self, n=1, **values):
+        """Append n rows; components not given start at zero. Returns the first row index."""
+        self.reserve(n)
+        start = self.count
+        rows = slice(start, start + n)
+        for name in self.dtypes:
+            getattr(self, name)[rows] = values.get(name, 0)
+        self.count += n
+        return start
+
+    def compact(self, keep):
+        """Drop the rows where keep is False, keeping the rest contiguous and in order."""
+        kept = int(np.count_nonzero(keep))
+        if kept == self.count:
+            return
+        for name in self.dtypes:
+            column = getattr(self, name)
+            column[:kept] = column[:self.count][keep]
+        self.count = kept
+
+
+class World:
+    """All tanks and bullets of a battle, updated by the systems below.
+
+    Tanks keep their row for the whole battle (players hold on to their tank
+    index); destroyed tanks are only marked dead. Bullet rows are compacted
+    every tick by the cleanup system.
+    """
+
+    def __init__(self, width, height, tank_size=(64, 64), bullet_size=(30, 30), bullet_speed=20,
+                 bullet_damage=20, teams=2, palette=6, seed=None):
+        self.width = width
+        self.height = height
+        self.tank_size = tank_size
+        self.bullet_size = bullet_size
+        self.bullet_speed = bullet_speed
+        self.bullet_damage = bullet_damage
+        self.teams = teams
+        self.palette = palette  # number of bullet colors
+        self.rng = np.random.default_rng(seed)
+        self.scores = np.zeros(teams, dtype=np.int64)
+        self.tick = 0
+        self.walls = np.zeros((0, 4), dtype=np.float32)  # x, y, width, height
+        self.flow = None  # flowfield.FlowFields steering the AI tanks, if any
+
+        self.tanks = Table(
+            64,
+            x=np.float32, y=np.float32, vx=np.float32, vy=np.float32,
+            health=np.int16, team=np.uint8, facing=np.int8,  # 1 for right, -1 for left
+            cooldown=np.int16, reload=np.int16,  # frames until next shot, frames between shots
+            trigger=bool, alive=bool, ai=bool,
+        )
+        self.bullets = Table(
+            1024,
+            x=np.float32, y=np.float32, vx=np.float32, vy=np.float32,
+            team=np.uint8, color=np.uint8,
+        )
+
+    def add_tanks(self, x, y, team, facing, health=100, reload=0, ai=False):
+        """Add len(x) tanks of one team. Returns the index of the first one."""
+        return self.tanks.add(len(x), x=x, y=y, team=team, facing=facing, health=health,
+                              reload=reload, alive=True, ai=ai)
+
+    def add_wall(self, rect):
+        """Walls stop tanks and bullets; the flow fields route the AI around them."""
+        self.walls = np.vstack((self.walls, np.asarray(rect, dtype=np.float32)))
+        if self.flow is not None:
+            self.flow.add_wall(tuple(rect))
+
+    def alive_tanks(self, team=None):
+        tanks = self.tanks
+        alive = tanks.alive[:tanks.count]
+        if team is not None:
+            alive = alive & (tanks.team[:tanks.count] == team)
+        return int(np.count_nonzero(alive))
+
+    def update(self):
+        """Run one tick of every system. Returns the number of bullets that hit a tank."""
+        ai_system(self)
+        movement_system(self)
+        firing_system(self)
+        hit = damage_system(self)
+        cleanup_system(self, hit)
+        self.tick += 1
+        return int(np.count_nonzero(hit))
+
+
+def ai_system(world, turn_chance=1 / 30, speed=2):
+    # AI tanks always pull the trigger. With flow fields they drive along
+    # their team's field and patrol up and down once at the goal.
+    tanks = world.tanks
+    n = tanks.count
+    ai = tanks.ai[:n] & tanks.alive[:n]
+    tanks.trigger[:n] |= ai
+    if world.flow is not None:
+        width, height = world.tank_size
+        at_goal = ai.copy()
+        for team in range(world.teams):
+            units = np.flatnonzero(ai & (tanks.team[:n] == team))
+            if len(units) == 0:
+                continue
+            vectors = world.flow.directions(team, tanks.x[units] + width / 2, tanks.y[units] + height / 2)
+            moving = vectors.any(axis=1)
+            steered = units[moving]
+            tanks.vx[steered] = vectors[moving, 0] * speed
+            tanks.vy[steered] = vectors[moving, 1] * speed
+            at_goal[steered] = False
+        tanks.vx[:n][at_goal] = 0
+        turning = np.flatnonzero(at_goal & (world.rng.random(n) < turn_chance))
+        tanks.vy[turning] = speed * world.rng.integers(-1, 2, len(turning))
+        return
+
+    # Without them, now and then pick a new heading: mostly towards the enemy,
+    # sometimes back, up or down. Guns only point forward, so tanks that
+    # crossed the middle of the battlefield fall back.
+    turning = np.flatnonzero(ai & (world.rng.random(n) < turn_chance))
+    if len(turning):
+        rng = world.rng
+        facing = tanks.facing[turning]
+        crossed = facing * (tanks.x[turning] + world.tank_size[0] / 2 - world.width / 2) > 0
+        forward = np.where(crossed, rng.uniform(-1, -0.5, len(turning)), rng.uniform(-0.5, 1, len(turning)))
+        tanks.vx[turning] = facing * speed * forward
+        tanks.vy[turning] = speed * rng.integers(-1, 2, len(turning))
+
+
+def movement_system(world):
+    tanks = world.tanks
+    n = tanks.count
+    alive = tanks.alive[:n]
+    width, height = world.tank_size
+    x, y = tanks.x[:n], tanks.y[:n]
+    # Tanks stay inside the battlefield and out of walls; x and y are moved
+    # one after the other so tanks slide along walls
+    new_x = np.clip(x + tanks.vx[:n] * alive, 0, world.width - width)
+    if len(world.walls):
+        new_x = np.where(overlaps_walls(world, new_x, y, width, height), x, new_x)
+    x[:] = new_x
+    new_y = np.clip(y + tanks.vy[:n] * alive, 0, world.height - height)
+    if len(world.walls):
+        new_y = np.where(overlaps_walls(world, x, new_y, width, height), y, new_y)
+    y[:] = new_y
+
+    bullets = world.bullets
+    m = bullets.count
+    bullets.x[:m] += bullets.vx[:m]
+    bullets.y[:m] += bullets.vy[:m]
+
+
+def firing_system(world):
+    """Tanks whose trigger is pulled and whose gun is reloaded fire one bullet.
+    Triggers are released afterwards. Returns the indices of the tanks that fired."""
+    tanks = world.tanks
+    n = tanks.count
+    cooldown = tanks.cooldown[:n]
+    np.maximum(cooldown - 1, 0, out=cooldown)
+    ready = tanks.trigger[:n] & tanks.alive[:n] & (cooldown == 0)
+    tanks.trigger[:n] = False
+    shooters = np.flatnonzero(ready)
+    if len(shooters) == 0:
+        return shooters
+
+    tanks.cooldown[shooters] = tanks.reload[shooters]
+    facing = tanks.facing[shooters]
+    tank_w, tank_h = world.tank_size
+    bullet_w, bullet_h = world.bullet_size
+    # Bullet centred on the front edge of the tank, like Tank.shoot()
+    world.bullets.add(
+        len(shooters),
+        x=tanks.x[shooters] + np.where(facing > 0, tank_w, 0) - bullet_w / 2,
+        y=tanks.y[shooters] + (tank_h - bullet_h) / 2,
+        vx=facing * world.bullet_speed,
+        team=tanks.team[shooters],
+        color=world.rng.integers(0, world.palette, len(shooters)),
+    )
+    return shooters
+
+
+def damage_system(world):
+    """Bullets hit tanks of other teams. Returns a mask of the bullets that hit.
+
+    Broad phase is sort-and-sweep on x: the enemy tanks are sorted by x once,
+    and each bullet only checks the tanks whose x range overlaps its own.
+    """
+    bullets, tanks = world.bullets, world.tanks
+    m = bullets.count
+    hit = np.zeros(m, dtype=bool)
+    targets = np.flatnonzero(tanks.alive[:tanks.count])
+    if m == 0 or len(targets) == 0:
+        return hit
+    tank_w, tank_h = world.tank_size
+    bullet_w, bullet_h = world.bullet_size
+
+    for team in range(world.teams):
+        shots = np.flatnonzero(bullets.team[:m] == team)
+        victims = targets[tanks.team[targets] != team]
+        if len(shots) == 0 or len(victims) == 0:
+            continue
+        order = np.argsort(tanks.x[victims], kind="stable")
+        victims = victims[order]
+        victim_x = tanks.x[victims]
+        shot_x = bullets.x[shots]
+        # Rects overlap on x when victim_x - bullet_w < shot_x < victim_x + tank_w
+        first = np.searchsorted(victim_x, shot_x - tank_w, side="right")
+        last = np.searchsorted(victim_x, shot_x + bullet_w, side="left")
+        counts = last - first
+        total = int(counts.sum())
+        if total == 0:
+            continue
+
+        # One row per (bullet, candidate tank) pair
+        pair_shot = np.repeat(np.arange(len(shots)), counts)
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        pair_victim = victims[np.repeat(first, counts) + offsets]
+        dy = bullets.y[shots[pair_shot]] - tanks.y[pair_victim]
+        overlap = (dy > -bullet_h) & (dy < tank_h)
+        if not overlap.any():
+            continue
+
+        # A bullet damages only the first tank it touches
+        pair_shot, pair_victim = pair_shot[overlap], pair_victim[overlap]
+        pair_shot, first_pair = np.unique(pair_shot, return_index=True)
+        np.subtract.at(tanks.health, pair_victim[first_pair], world.bullet_damage)
+        hit[shots[pair_shot]] = True
+        world.scores[team] += len(pair_shot)
+    return hit
+
+
+def cleanup_system(world, hit):
+    """Remove bullets that hit or left the screen and mark destroyed tanks dead.
+    Returns the indices of the tanks destroyed this tick."""
+    bullets = world.bullets
+    m = bullets.count
+    x = bullets.x[:m]
+    keep = ~hit & (x + world.bullet_size[0] >= 0) & (x <= world.width)
+    if len(world.walls):
+        keep &= ~overlaps_walls(world, x, bullets.y[:m], *world.bullet_size)
+    bullets.compact(keep)
+
+    tanks = world.tanks
+    n = tanks.count
+    health = tanks.health[:n]
+    np.maximum(health, 0, out=health)
+    destroyed = np.flatnonzero(tanks.alive[:n] & (health == 0))
+    tanks.alive[destroyed] = False
+    tanks.vx[destroyed] = 0
+    tanks.vy[destroyed] = 0
+    return destroyed
+
+
+def overlaps_walls(world, x, y, width, height):
+    """Mask of the rects (x, y, width, height) that overlap any wall."""
+    inside = np.zeros(len(x), dtype=bool)
+    for wall_x, wall_y, wall_w, wall_h in world.walls.tolist():
+        inside |= (x < wall_x + wall_w) & (x + width > wall_x) & (y < wall_y + wall_h) & (y + height > wall_y)
+    return inside
@@ -0,0 +1,238 @@
+# flowfield.py
+import heapq
+import math
+
+import numpy as np
+
+INF = math.inf
+DIAGONAL = math.sqrt(2)
+# (dx, dy, cost) of the 8 neighbours of a cell
+NEIGHBOURS = [(-1, 0, 1), (1, 0, 1), (0, -1, 1), (0, 1, 1),
+              (-1, -1, DIAGONAL), (1, -1, DIAGONAL), (-1, 1, DIAGONAL), (1, 1, DIAGONAL)]
+
+
+class FlowFields:
+    """Flow-field pathfinding over a coarse grid of the battlefield, one field per team.
+
+    Each team has a goal (a set of cells). Its field is built once with
+    Dijkstra from the goal and cached: an integration field (distance to the
+    goal) and a direction field (unit vector to the next cell on the way).
+    Units only look up the vector of the cell they are in, whatever their
+    number. Fields are updated only when something changes: a new goal
+    rebuilds that team's field, adding or removing a wall repairs every
+    cached field incrementally.
+    """
+
+    def __init__(self, width, height, cell=20, clearance=(0, 0)):
+        self.cell = cell
+        self.cols = math.ceil(width / cell)
+        self.rows = math.ceil(height / cell)
+        # Walls are grown by this much (the size of a unit) so that paths keep
+        # units from scraping along them
+        self.clearance = clearance
+        self.blocked = bytearray(self.cols * self.rows)
+        self.walls = []
+        self.goals = {}  # team -> goal cells
+        self.fields = {}  # team -> FlowField, built on first use
+        self.rebuilds = 0
+        self.repairs = 0
+
+    def cells_in(self, rect, grow=(0, 0)):
+        x, y, width, height = rect
+        x -= grow[0] / 2
+        y -= grow[1] / 2
+        first_col = max(0, int(x // self.cell))
+        first_row = max(0, int(y // self.cell))
+        last_col = min(self.cols - 1, int(math.ceil((x + width + grow[0]) / self.cell)) - 1)
+        last_row = min(self.rows - 1, int(math.ceil((y + height + grow[1]) / self.cell)) - 1)
+        return [row * self.cols + col
+                for row in range(first_row, last_row + 1) for col in range(first_col, last_col + 1)]
+
+    def add_wall(self, rect):
+        self.walls.append(rect)
+        added = [i for i in self.cells_in(rect, self.clearance) if not self.blocked[i]]
+        for i in added:
+            self.blocked[i] = 1
+        if added:
+            for field in self.fields.values():
+                field.block(added)
+                self.repairs += 1
+
+    def remove_wall(self, rect):
+        self.walls.remove(rect)
+        # A cell stays blocked when another wall still covers it
+        covered = set()
+        for wall in self.walls:
+            covered.update(self.cells_in(wall, self.clearance))
+        freed = [i for i in self.cells_in(rect, self.clearance) if self.blocked[i] and i not in covered]
+        for i in freed:
+            self.blocked[i] = 0
+        if freed:
+            for field in self.fields.values():
+                field.unblock(freed)
+                self.repairs += 1
+
+    def set_goal(self, team, rects):
+        goal = set()
+        for rect in rects:
+            goal.update(self.cells_in(rect))
+        if goal != self.goals.get(team):
+            self.goals[team] = goal
+            self.fields.pop(team, None)
+
+    def field(self, team):
+        field = self.fields.get(team)
+        if field is None:
+            field = self.fields[team] = FlowField(self, self.goals[team])
+            self.rebuilds += 1
+        return field
+
+    def directions(self, team, x, y):
+        """Unit vectors (n, 2) towards the team's goal for points x, y in pixels."""
+        return self.field(team).lookup(x, y)
+
+
+class FlowField:
+    """Integration and direction field of one goal. Built by FlowFields."""
+
+    def __init__(self, grid, goal):
+        self.grid = grid
+        self.goal = goal
+        self.build()
+
+    def build(self):
+        grid = self.grid
+        size = grid.cols * grid.rows
+        self.distance = [INF] * size
+        self.parent = [-1] * size  # next cell on the way to the goal; itself for goal cells
+        heap = []
+        for i in self.goal:
+            if not grid.blocked[i]:
+                self.distance[i] = 0
+                self.parent[i] = i
+                heap.append((0, i))
+        heapq.heapify(heap)
+        self.search(heap)
+        self.update_vectors()
+
+    def passable(self, i, j):
+        """Whether a unit can step from cell i to the neighbouring cell j: no
+        walls on j, and diagonal steps may not cut the corner of a wall."""
+        grid = self.grid
+        blocked, cols = grid.blocked, grid.cols
+        if blocked[j]:
+            return False
+        row, col = divmod(i, cols)
+        next_row, next_col = divmod(j, cols)
+        if row != next_row and col != next_col:
+            return not (blocked[row * cols + next_col] or blocked[next_row * cols + col])
+        return True
+
+    def neighbours(self, i):
+        cols, rows = self.grid.cols, self.grid.rows
+        row, col = divmod(i, cols)
+        for dx, dy, cost in NEIGHBOURS:
+            x, y = col + dx, row + dy
+            if 0 <= x < cols and 0 <= y < rows:
+                yield y * cols + x, cost
+
+    def search(self, heap):
+        # Dijkstra from whatever is in the heap; only ever lowers distances
+        distance, parent = self.distance, self.parent
+        neighbours, passable, blocked = self.neighbours, self.passable, self.grid.blocked
+        while heap:
+            d, i = heapq.heappop(heap)
+            if d > distance[i]:
+                continue
+            for j, cost in neighbours(i):
+                if d + cost < distance[j] and not blocked[j] and passable(j, i):
+                    distance[j] = d + cost
+                    parent[j] = i
+                    heapq.heappush(heap, (d + cost, j))
+
+    def block(self, cells):
+        """Repair after cells became blocked: only the cells whose path went
+        through them (or cut one of their corners) are searched again."""
+        distance, parent = self.distance, self.parent
+        children = {}
+        for i, p in enumerate(parent):
+            if p >= 0 and p != i:
+                children.setdefault(p, []).append(i)
+
+        broken = list(cells)
+        for i in cells:
+            for j, _ in self.neighbours(i):
+                p = parent[j]
+                if p >= 0 and p != j and not self.passable(j, p):
+                    broken.append(j)
+        invalid = set()
+        while broken:
+            i = broken.pop()
+            if i not in invalid:
+                invalid.add(i)
+                broken.extend(children.get(i, ()))
+        for i in invalid:
+            distance[i] = INF
+            parent[i] = -1
+
+        # Start again from the best valid neighbour of every invalidated cell
+        heap = []
+        for i in invalid:
+            if self.grid.blocked[i]:
+                continue
+            for j, cost in self.neighbours(i):
+                if distance[j] + cost < distance[i] and self.passable(i, j):
+                    distance[i] = distance[j] + cost
+                    parent[i] = j
+            if distance[i] < INF:
+                heap.append((distance[i], i))
+        heapq.heapify(heap)
+        self.search(heap)
+        self.update_vectors()
+
+    def unblock(self, cells):
+        """Repair after cells became free: distances can only go down, so the
+        search continues from the freed cells and their neighbours."""
+        distance, parent = self.distance, self.parent
+        heap = []
+        for i in cells:
+            if i in self.goal:
+                distance[i] = 0
+                parent[i] = i
+                heap.append((0, i))
+            # Neighbours may now also step diagonally past the freed cell
+            for j, _ in self.neighbours(i):
+                if distance[j] < INF:
+                    heap.append((distance[j], j))
+        heapq.heapify(heap)
+        self.search(heap)
+        self.update_vectors()
+
+    def update_vectors(self):
+        grid = self.grid
+        cols = grid.cols
+        parent = np.array(self.parent)
+        # Units pushed into a blocked cell head for its closest free neighbour
+        for i in np.flatnonzero(np.frombuffer(grid.blocked, dtype=np.uint8)).tolist():
+            best = INF
+            for j, cost in self.neighbours(i):
+                if not grid.blocked[j] and self.distance[j] + cost < best:
+                    best = self.distance[j] + cost
+                    parent[i] = j
+        cells = np.arange(len(parent))
+        reachable = parent >= 0
+        dx = np.where(reachable, parent % cols - cells % cols, 0)
+        dy = np.where(reachable, parent // cols - cells // cols, 0)
+        length = np.maximum(1, np.hypot(dx, dy))
+        self.vectors = np.stack((dx / length, dy / length), axis=1).astype(np.float32)
+
+    @property
+    def integration(self):
+        """Distance to the goal in cells, as a (rows, cols) array (inf where unreachable)."""
+        return np.array(self.distance).reshape(self.grid.rows, self.grid.cols)
+
+    def lookup(self, x, y):
+        grid = self.grid
+        col = np.clip(np.asarray(x) // grid.cell, 0, grid.cols - 1).astype(np.intp)
+        row = np.clip(np.asarray(y) // grid.cell, 0, grid.rows - 1).astype(np.intp)
+        return self.vectors[row * grid.cols + col]
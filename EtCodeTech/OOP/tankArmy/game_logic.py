@@ -1,12 +1,22 @@
 # game_logic.py
 import sys
+import numpy as np
 import pygame as pg
 
 from game_objects import *
+from audio import AudioManager
+from ecs import World
+from flowfield import FlowFields
+
+# Keyboard layout of player 1 (WASD + SPACE) and player 2 (arrow keys + RETURN)
+PLAYER_CONTROLS = [
+    {"fire": pg.K_SPACE, "move": {pg.K_a: (-1, 0), pg.K_d: (1, 0), pg.K_w: (0, -1), pg.K_s: (0, 1)}},
+    {"fire": pg.K_RETURN, "move": {pg.K_LEFT: (-1, 0), pg.K_RIGHT: (1, 0), pg.K_UP: (0, -1), pg.K_DOWN: (0, 1)}},
+]
 
 
 class GameManager:
-    def __init__(self):
+    def __init__(self, mode=config.DUEL, players=None, seed=None):
         pg.init()
         pg.mixer.init()
 
@@ -20,17 +30,28 @@ class GameManager:
             print(f"Error loading icon: {e}")
 
         self.clock = pg.time.Clock()
-        self.tank1 = Tank(50, config.SCREEN_HEIGHT - 100, "assets/tanker64.png", 1)
-        self.tank2 = Tank(config.SCREEN_WIDTH - 150, config.SCREEN_HEIGHT - 100, "assets/tankers64.png", -1)
-
-        self.all_sprites = pg.sprite.Group(self.tank1, self.tank2)
-        self.bullets = pg.sprite.Group()
+        self.mode = mode
+        self.world = create_world(mode, seed)
+        # Tank index of each keyboard player: the first tank of their team
+        players = mode["players"] if players is None else players
+        self.players = [team * mode["tanks_per_team"] for team in range(players)]
+        self.world.tanks.ai[self.players] = False
 
-        self.sounds = {
-            'move': pg.mixer.Sound("assets/tank-move.mp3"),
-            'shoot': pg.mixer.Sound("assets/tank-shots.mp3"),
-            'explosion': pg.mixer.Sound("assets/tank-hits.mp3")  # Add explosion sound
-        }
+        try:
+            tank_images = [pg.image.load("assets/tanker64.png"), pg.image.load("assets/tankers64.png")]
+        except pg.error as e:
+            print(f"Error loading tank image: {e}")
+            raise
+        self.tank_images = [pg.transform.smoothscale(image, mode["tank_size"]).convert_alpha()
+                            for image in tank_images]
+        self.bullet_images = bullet_atlas.load(mode["bullet_size"])
+
+        # One reserved channel per player for the move sound; shots and hits
+        # share the rest, with hits first when channels run out
+        self.audio = AudioManager(reserved=2)
+        self.audio.add('move', pg.mixer.Sound("assets/tank-move.mp3"))
+        self.audio.add('shoot', pg.mixer.Sound("assets/tank-shots.mp3"), priority=1, voices=3, coalesce_ms=60)
+        self.audio.add('explosion', pg.mixer.Sound("assets/tank-hits.mp3"), priority=2, voices=3, coalesce_ms=100)
 
         self.font = pg.font.Font(None, 36)
         self.game_over = False
@@ -41,97 +62,77 @@ class GameManager:
                 return False
 
             if not self.game_over and event.type == pg.KEYDOWN:
-                # Tank 1 controls (WASD)
-                if event.key == pg.K_SPACE:
-                    self.sounds['shoot'].play()
-                    bullet = self.tank1.shoot()
-                    self.bullets.add(bullet)
-                    self.all_sprites.add(bullet)
+                for player, tank in enumerate(self.players):
+                    if event.key == PLAYER_CONTROLS[player]["fire"]:
+                        self.audio.play('shoot')
+                        self.world.tanks.trigger[tank] = True
 
-                self._handle_tank_movement(event, self.tank1, True)
-                self.sounds['move'].play()
-
-                # Tank 2 controls (Arrow keys)
-                if event.key == pg.K_RETURN:
-                    self.sounds['shoot'].play()
-                    bullet = self.tank2.shoot()
-                    self.bullets.add(bullet)
-                    self.all_sprites.add(bullet)
-
-                self._handle_tank_movement(event, self.tank2, True)
+                    self._handle_tank_movement(event, player, True)
 
             if event.type == pg.KEYUP:
-                self._handle_tank_movement(event, self.tank1, False)
-                self._handle_tank_movement(event, self.tank2, False)
-                self.sounds['shoot'].stop()
-                self.sounds['move'].stop()
+                for player in range(len(self.players)):
+                    self._handle_tank_movement(event, player, False)
+                self.audio.stop('shoot')
+
+        # The move sound loops for as long as a player's tank is moving
+        tanks = self.world.tanks
+        for player, tank in enumerate(self.players):
+            moving = not self.game_over and (tanks.vx[tank] != 0 or tanks.vy[tank] != 0)
+            self.audio.loop('move', player, moving)
 
         return True
 
-    def _handle_tank_movement(self, event, tank, is_keydown):
+    def _handle_tank_movement(self, event, player, is_keydown):
         speed = config.TANK_SPEED if is_keydown else 0
-        tank_controls = {
-            self.tank1: {pg.K_a: (-speed, 0), pg.K_d: (speed, 0), pg.K_w: (0, -speed), pg.K_s: (0, speed)},
-            self.tank2: {pg.K_LEFT: (-speed, 0), pg.K_RIGHT: (speed, 0), pg.K_UP: (0, -speed), pg.K_DOWN: (0, speed)}
-        }
-
-        for key, movement in tank_controls[tank].items():
-            if event.key == key:
-                if tank == self.tank1:
-                    tank.speed_x, tank.speed_y = movement
-                else:
-                    tank.speed_x, tank.speed_y = movement
+        movement = PLAYER_CONTROLS[player]["move"].get(event.key)
+        if movement is not None:
+            tanks, tank = self.world.tanks, self.players[player]
+            tanks.vx[tank] = movement[0] * speed
+            tanks.vy[tank] = movement[1] * speed
 
     def update(self):
         if self.game_over:
             return
 
-        self.tank1.move(self.tank1.speed_x, self.tank1.speed_y)
-        self.tank2.move(self.tank2.speed_x, self.tank2.speed_y)
-        self.bullets.update()
-
-        # Remove bullets that go off-screen and check for collisions
-        for bullet in list(self.bullets):
-            if bullet.rect.left < 0 or bullet.rect.right > config.SCREEN_WIDTH:
-                bullet.kill()
+        if self.world.update():
+            self.audio.play('explosion')
 
-            # Check collision with opposite tank
-            if bullet.direction > 0 and bullet.rect.colliderect(self.tank1.rect):
-                self.sounds['explosion'].play()
-                is_tank_destroyed = self.tank1.take_damage(bullet.damage)
-                self.tank2.score += 1
-                bullet.kill()
-
-                if is_tank_destroyed:
-                    self.game_over = True
-
-            elif bullet.direction < 0 and bullet.rect.colliderect(self.tank2.rect):
-                self.sounds['explosion'].play()
-                is_tank_destroyed = self.tank2.take_damage(bullet.damage)
-                self.tank1.score += 1
-                bullet.kill()
-
-                if is_tank_destroyed:
-                    self.game_over = True
+        # The battle ends as soon as a team has no tanks left
+        if any(self.world.alive_tanks(team) == 0 for team in range(self.world.teams)):
+            self.game_over = True
 
     def render(self):
         self.screen.fill(config.LIGHT_CORAL)
-        self.all_sprites.draw(self.screen)
-
-        # Render scores and health
-        tank1_score = self.font.render(f"Tank 1 Score: {self.tank1.score}", True, (0, 0, 0))
-        tank2_score = self.font.render(f"Tank 2 Score: {self.tank2.score}", True, (0, 0, 0))
-        
-        tank1_health = self.font.render(f"Tank 1 Health: {self.tank1.health}%", True, (0, 0, 0))
-        tank2_health = self.font.render(f"Tank 2 Health: {self.tank2.health}%", True, (0, 0, 0))
-
-        self.screen.blit(tank1_score, (10, 10))
-        self.screen.blit(tank2_score, (config.SCREEN_WIDTH - 200, 10))
-        self.screen.blit(tank1_health, (10, 50))
-        self.screen.blit(tank2_health, (config.SCREEN_WIDTH - 200, 50))
+        tanks, bullets = self.world.tanks, self.world.bullets
+        for wall in self.world.walls.tolist():
+            pg.draw.rect(self.screen, config.WALL_COLOR, wall)
+
+        # One blits() call per kind of entity, straight from the component columns
+        live = np.flatnonzero(tanks.alive[:tanks.count])
+        self.screen.blits(list(zip(
+            [self.tank_images[team] for team in tanks.team[live].tolist()],
+            zip(tanks.x[live].astype(int).tolist(), tanks.y[live].astype(int).tolist()),
+        )), False)
+        m = bullets.count
+        self.screen.blits(list(zip(
+            [self.bullet_images[color] for color in bullets.color[:m].tolist()],
+            zip(bullets.x[:m].astype(int).tolist(), bullets.y[:m].astype(int).tolist()),
+        )), False)
+
+        # Render scores and health (or tanks left, when a team has more than one)
+        names = self.mode["team_names"]
+        for team, x in ((0, 10), (1, config.SCREEN_WIDTH - 200)):
+            score = self.font.render(f"{names[team]} Score: {self.world.scores[team]}", True, (0, 0, 0))
+            if self.mode["tanks_per_team"] == 1:
+                status = f"{names[team]} Health: {int(tanks.health[team])}%"
+            else:
+                status = f"{names[team]} Tanks: {self.world.alive_tanks(team)}"
+            self.screen.blit(score, (x, 10))
+            self.screen.blit(self.font.render(status, True, (0, 0, 0)), (x, 50))
 
         if self.game_over:
-            winner_text = "Tank 2 Wins!" if self.tank1.health <= 0 else "Tank 1 Wins!"
+            standing = [team for team in range(self.world.teams) if self.world.alive_tanks(team)]
+            winner_text = f"{names[standing[0]]} Wins!" if standing else "Draw!"
             game_over_text = self.font.render(winner_text, True, (255, 0, 0))
             text_rect = game_over_text.get_rect(center=(config.SCREEN_WIDTH//2, config.SCREEN_HEIGHT//2))
             self.screen.blit(game_over_text, text_rect)
@@ -148,3 +149,32 @@ class GameManager:
 
         pg.quit()
         sys.exit()
+
+
+def create_world(mode, seed=None):
+    """Set up a battle for one of the modes in config: team 1 on the left facing
+    right, team 2 on the right facing left, every tank AI controlled."""
+    world = World(config.SCREEN_WIDTH, config.SCREEN_HEIGHT, mode["tank_size"], mode["bullet_size"],
+                  mode["bullet_speed"], config.BULLET_DAMAGE, palette=len(BULLET_COLORS), seed=seed)
+    if "goals" in mode:
+        world.flow = FlowFields(config.SCREEN_WIDTH, config.SCREEN_HEIGHT, config.FLOW_CELL, mode["tank_size"])
+        for team, goal in enumerate(mode["goals"]):
+            world.flow.set_goal(team, [goal])
+    for wall in mode.get("walls", ()):
+        world.add_wall(wall)
+    count = mode["tanks_per_team"]
+    width, height = mode["tank_size"]
+    if count == 1:
+        # Starting positions of the original two-player game
+        starts = [([50], [config.SCREEN_HEIGHT - 100]), ([config.SCREEN_WIDTH - 150], [config.SCREEN_HEIGHT - 100])]
+    else:
+        # Each army is spread over its own third of the battlefield
+        deploy = config.SCREEN_WIDTH // 3 - width
+        rng = world.rng
+        starts = [(rng.uniform(0, deploy, count), rng.uniform(0, config.SCREEN_HEIGHT - height, count)),
+                  (config.SCREEN_WIDTH - width - rng.uniform(0, deploy, count),
+                   rng.uniform(0, config.SCREEN_HEIGHT - height, count))]
+    for team, (x, y) in enumerate(starts):
+        world.add_tanks(x, y, team, facing=1 if team == 0 else -1, health=mode["health"],
+                        reload=mode["reload"], ai=True)
+    return world
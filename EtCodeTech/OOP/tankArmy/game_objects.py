@@ -41,30 +41,69 @@ class Tank(pg.sprite.Sprite):
         return Bullet(bullet_x, self.rect.centery, self.direction)
 
 
+# High-contrast colors for better visibility
+BULLET_COLORS = [
+    (255, 0, 0),    # Bright Red
+    (0, 255, 0),    # Bright Green
+    (0, 0, 255),    # Bright Blue
+    (255, 255, 0),  # Bright Yellow
+    (255, 0, 255),  # Magenta
+    (0, 255, 255)   # Cyan
+]
+
+
+def bullet_image(color, size=(30, 30)):
+    # Create a slightly larger surface with alpha channel for better transparency
+    image = pg.Surface(size, pg.SRCALPHA)
+    center = (size[0] // 2, size[1] // 2)
+    radius = min(center)
+
+    # Create a more complex, multi-layered bullet shape
+    pg.draw.circle(image, color, center, radius)
+    pg.draw.circle(image, (255, 255, 255, 200), center, radius * 4 // 5, max(1, radius // 5))  # bright White
+    return image
+
+
+class BulletAtlas:
+    """Pre-rendered bullet images, one per color in BULLET_COLORS and per size.
+
+    Every bullet of a color shares the same surface, so firing a bullet
+    does no allocation or drawing. Call load() once the display is set up,
+    so the images can be converted for fast alpha blits.
+    """
+
+    def __init__(self, colors=BULLET_COLORS):
+        self.colors = colors
+        self.images = {}  # size -> one image per color
+
+    def load(self, size=(30, 30)):
+        size = tuple(size)
+        images = self.images.get(size)
+        if images is None:
+            images = [bullet_image(color, size) for color in self.colors]
+            if pg.display.get_surface() is not None:
+                images = [image.convert_alpha() for image in images]
+            self.images[size] = images
+        return images
+
+    def clear(self):
+        self.images.clear()
+
+
+bullet_atlas = BulletAtlas()
+
+
 class Bullet(pg.sprite.Sprite):
     def __init__(self, x, y, direction):
         super().__init__()
         self.damage = 20  # Standard bullet damage
 
-        # High-contrast colors for better visibility
-        self.colors = [
-            (255, 0, 0),    # Bright Red
-            (0, 255, 0),    # Bright Green
-            (0, 0, 255),    # Bright Blue
-            (255, 255, 0),  # Bright Yellow
-            (255, 0, 255),  # Magenta
-            (0, 255, 255)   # Cyan
-        ]
-
-        # Create a slightly larger surface with alpha channel for better transparency
-        self.image = pg.Surface((30, 30), pg.SRCALPHA)
+        self.colors = BULLET_COLORS
 
         # Select random color with more vibrant options
-        self.base_color = random.choice(self.colors)
-
-        # Create a more complex, multi-layered bullet shape
-        pg.draw.circle(self.image, self.base_color, (15, 15), 15)
-        pg.draw.circle(self.image, (255, 255, 255, 200), (15, 15), 12, 3)  # bright White
+        self.color_index = random.randrange(len(self.colors))
+        self.base_color = self.colors[self.color_index]
+        self.image = bullet_atlas.load()[self.color_index]
 
         self.rect = self.image.get_rect()
         self.rect.centerx = x
@@ -1,9 +1,20 @@
 # main.py
+import argparse
+
+import config
 from game_logic import GameManager
 
 
 def main():
-    game = GameManager()
+    parser = argparse.ArgumentParser(description="Tank Battle")
+    parser.add_argument("--mode", choices=config.MODES, default="duel",
+                        help="duel: the original two-player game, army: AI armies of hundreds of tanks")
+    parser.add_argument("--players", type=int, choices=(0, 1, 2),
+                        help="keyboard players (default: 2 in duel, 0 in army)")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    game = GameManager(config.MODES[args.mode], args.players, args.seed)
     game.run()
 
 
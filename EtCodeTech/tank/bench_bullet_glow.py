@@ -0,0 +1,75 @@
+# bench_bullet_glow.py
+# Per-frame cost of glowing bullets in tank_oop.py: redrawing the glow of
+# every bullet each frame (as before) versus picking a pre-baked frame of
+# bullet_glow.
+#
+#   python bench_bullet_glow.py [--bullets 500] [--frames 300]
+import argparse
+import math
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg
+
+from tank_oop import Bullet, GameConfig, bullet_glow
+
+
+class RedrawnBullet(Bullet):
+    # The old bullet: its own surface, redrawn with a new color every frame
+    def _init_image(self, x, y):
+        self.image = pg.Surface((self.glow_radius * 2, self.glow_radius * 2), pg.SRCALPHA)
+        self.rect = self.image.get_rect(center=(x, y))
+
+    def _update_appearance(self):
+        frame = pg.time.get_ticks() // 50
+        intensity = abs(math.sin(frame / 10)) * 200 + 55
+        self.color = (int(intensity), random.randint(50, 255), random.randint(50, 255))
+        self.image.fill((0, 0, 0, 0))
+        pg.draw.circle(self.image, (*self.color, 100), (self.glow_radius, self.glow_radius), self.glow_radius)
+        pg.draw.circle(self.image, self.color, (self.glow_radius, self.glow_radius), self.radius)
+
+
+def run(screen, make, bullets, frames):
+    group = pg.sprite.Group()
+    appearance = draw = 0.0
+    for frame in range(frames):
+        while len(group) < bullets:
+            group.add(make(random.randrange(GameConfig.SCREEN_WIDTH), random.randrange(GameConfig.SCREEN_HEIGHT),
+                           random.choice((-1, 1))))
+        start = time.perf_counter()
+        for bullet in group:
+            bullet._update_appearance()
+        middle = time.perf_counter()
+        screen.fill((0, 0, 0))
+        group.draw(screen)
+        appearance += middle - start
+        draw += time.perf_counter() - middle
+        for bullet in group:
+            bullet._update_position()
+    return appearance / frames, draw / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark glowing bullets")
+    parser.add_argument("--bullets", type=int, default=500)
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+
+    pg.init()
+    screen = pg.display.set_mode((GameConfig.SCREEN_WIDTH, GameConfig.SCREEN_HEIGHT))
+    start = time.perf_counter()
+    bullet_glow.load()
+    print(f"glow frames baked in {(time.perf_counter() - start) * 1000:.1f} ms "
+          f"({bullet_glow.phases} phases x {len(bullet_glow.frames[0])} colors)")
+
+    for name, make in (("redraw per frame", RedrawnBullet), ("pre-baked frames", Bullet)):
+        appearance, draw = run(screen, make, args.bullets, args.frames)
+        print(f"{name:<18} appearance {appearance * 1000:6.3f} ms  draw {draw * 1000:6.3f} ms "
+              f"per frame for {args.bullets} bullets")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@ import pygame as pg
 import random
 import math
 import sys
+from collections import deque
 
 # constants.py
 class GameConfig:
@@ -12,11 +13,115 @@ class GameConfig:
     FPS = 60
 
 
+# audio.py
+class AudioManager:
+    """Plays sounds through a fixed budget of mixer channels.
+
+    Trimmed copy of tankArmy/audio.py, keeping what this game uses:
+    - Looping sounds (engines) get reserved channels that one-shot sounds
+      never take, and are only started or stopped when their state changes.
+    - Each one-shot sound has a voice cap: past it, its oldest voice restarts.
+    - When no channel is free, a sound takes the channel of the oldest sound
+      with a lower priority, or is dropped.
+    - Triggers of the same sound within coalesce_ms of the last one are merged.
+    - At most max_calls mixer calls are made per second, two per reserved
+      channel kept for the loops.
+    """
+
+    def __init__(self, channels=8, reserved=2, max_calls=40):
+        pg.mixer.set_num_channels(channels)
+        pg.mixer.set_reserved(reserved)
+        self.reserved = reserved
+        self.channels = [pg.mixer.Channel(i) for i in range(channels)]
+        self.max_calls = max_calls
+        self.sounds = {}  # name -> (sound, priority, voices, coalesce_ms)
+        self.playing = {}  # channel index -> (priority, started, name)
+        self.loops = {}  # reserved channel index -> name of the loop playing on it
+        self.last_trigger = {}
+        self.calls = deque()  # times of the mixer calls of the last second
+
+    def add(self, name, sound, priority=0, voices=2, coalesce_ms=50):
+        self.sounds[name] = (sound, priority, voices, coalesce_ms)
+
+    def _budget(self, now, limit):
+        while self.calls and now - self.calls[0] >= 1000:
+            self.calls.popleft()
+        return len(self.calls) < limit
+
+    def _pick_channel(self, name, priority, voices):
+        busy = []
+        free = None
+        for i in range(self.reserved, len(self.channels)):
+            if self.channels[i].get_busy():
+                busy.append(i)
+            else:
+                self.playing.pop(i, None)
+                if free is None:
+                    free = i
+
+        # Voice cap: restart the oldest voice of this sound
+        own = [i for i in busy if i in self.playing and self.playing[i][2] == name]
+        if len(own) >= voices:
+            return min(own, key=lambda i: self.playing[i][1])
+        if free is not None:
+            return free
+        # Take over the oldest sound of the lowest priority below this one
+        lower = [i for i in busy if self.playing.get(i, (priority,))[0] < priority]
+        if lower:
+            return min(lower, key=lambda i: self.playing[i][:2])
+        return None
+
+    def play(self, name, now=None):
+        """Trigger a one-shot sound. Returns whether the mixer was asked to play it."""
+        entry = self.sounds.get(name)
+        if entry is None or entry[0] is None:
+            return False
+        sound, priority, voices, coalesce_ms = entry
+        now = pg.time.get_ticks() if now is None else now
+        last = self.last_trigger.get(name)
+        if last is not None and now - last < coalesce_ms:
+            return False
+        self.last_trigger[name] = now
+
+        if not self._budget(now, self.max_calls - 2 * self.reserved):
+            return False
+        channel = self._pick_channel(name, priority, voices)
+        if channel is None:
+            return False
+        self.calls.append(now)
+        self.channels[channel].play(sound)
+        self.playing[channel] = (priority, now, name)
+        return True
+
+    def loop(self, name, voice, on, now=None):
+        """Keep the looping sound name playing on reserved channel voice while on is true."""
+        entry = self.sounds.get(name)
+        if entry is None or entry[0] is None or voice >= self.reserved:
+            return
+        if (self.loops.get(voice) == name) == bool(on):
+            return
+        now = pg.time.get_ticks() if now is None else now
+        if not self._budget(now, self.max_calls):
+            return  # tried again on the next call
+        self.calls.append(now)
+        channel = self.channels[voice]
+        if on:
+            channel.play(entry[0], loops=-1)
+            self.loops[voice] = name
+            self.playing[voice] = (entry[1], now, name)
+        else:
+            channel.stop()
+            del self.loops[voice]
+            self.playing.pop(voice, None)
+
+
 # assets.py
 class AssetManager:
     def __init__(self):
         self.sounds = {}
         self.images = {}
+        # One reserved channel per tank engine
+        self.audio = AudioManager(reserved=2)
 
     def load_sounds(self):
         sound_files = {
@@ -39,6 +144,10 @@ class AssetManager:
                 print(f"Missing sound: {path}")
                 self.sounds[key] = None
 
+        self.audio.add('engine', self.sounds.get('engine'))
+        self.audio.add('shoot', self.sounds.get('shoot'), priority=1, voices=3, coalesce_ms=60)
+        self.audio.add('explosion', self.sounds.get('explosion'), priority=2, voices=2, coalesce_ms=100)
+
     def load_images(self):
         try:
             self.images['tank1'] = pg.image.load("assets/tanker64.png").convert_alpha()
@@ -50,6 +159,7 @@ class AssetManager:
             )
         except FileNotFoundError as e:
             print(f"Missing image: {e}")
+        bullet_glow.load()
 
     def get_sound(self, key):
         return self.sounds.get(key)
@@ -59,7 +169,7 @@ class AssetManager:
 
 
 class Tank(pg.sprite.Sprite):
-    def __init__(self, x, y, image, direction, asset_manager):
+    def __init__(self, x, y, image, direction, asset_manager, engine_channel=0):
         super().__init__()
         self.image = image
         self.rect = self.image.get_rect()
@@ -70,7 +180,8 @@ class Tank(pg.sprite.Sprite):
         self.score = 0
         self.speed_x = 0
         self.speed_y = 0
-        self.move_sound = asset_manager.get_sound('engine')
+        self.audio = asset_manager.audio
+        self.engine_channel = engine_channel
 
     def move(self, dx, dy):
         self.rect.x += dx
@@ -83,8 +194,11 @@ class Tank(pg.sprite.Sprite):
         self.rect.y = max(0, min(self.rect.y, GameConfig.SCREEN_HEIGHT - self.rect.height))
 
     def _play_move_sound(self, dx, dy):
-        if (dx != 0 or dy != 0) and self.move_sound:
-            self.move_sound.play()
+        # The engine loops while the tank moves; the mixer is only called when that changes
+        self.audio.loop('engine', self.engine_channel, dx != 0 or dy != 0)
+
+    def stop_engine(self):
+        self.audio.loop('engine', self.engine_channel, False)
 
     def take_damage(self, damage):
         self.health = max(0, self.health - damage)
@@ -95,35 +209,67 @@ class Tank(pg.sprite.Sprite):
         return Bullet(bullet_x, self.rect.centery, self.direction)
 
 
+# effects.py
+class GlowAnimation:
+    """Pre-baked glow frames for bullets.
+
+    The red channel pulses with abs(sin(frame / 10)), where frame counts
+    steps of frame_ms; green and blue flicker between the levels of a small
+    palette. Every (phase, green, blue) combination is drawn once in load(),
+    so a bullet only picks one of the images each frame.
+    """
+
+    def __init__(self, radius=5, glow_radius=15, frame_ms=50, levels=(50, 118, 186, 255)):
+        self.radius = radius
+        self.glow_radius = glow_radius
+        self.frame_ms = frame_ms
+        self.levels = levels
+        # abs(sin(frame / 10)) repeats every 10 * pi frames
+        self.phases = round(10 * math.pi)
+        self.frames = []
+
+    def load(self):
+        if self.frames:
+            return self.frames
+        convert = pg.display.get_surface() is not None
+        for phase in range(self.phases):
+            intensity = int(abs(math.sin(phase / 10)) * 200 + 55)
+            images = []
+            for green in self.levels:
+                for blue in self.levels:
+                    image = self._draw((intensity, green, blue))
+                    images.append(image.convert_alpha() if convert else image)
+            self.frames.append(images)
+        return self.frames
+
+    def _draw(self, color):
+        image = pg.Surface((self.glow_radius * 2, self.glow_radius * 2), pg.SRCALPHA)
+        pg.draw.circle(image, (*color, 100), (self.glow_radius, self.glow_radius), self.glow_radius)
+        pg.draw.circle(image, color, (self.glow_radius, self.glow_radius), self.radius)
+        return image
+
+    def frame(self, ticks):
+        """A glow image for the time in ticks, with a random green and blue."""
+        images = self.load()[ticks // self.frame_ms % self.phases]
+        return images[random.randrange(len(images))]
+
+
+bullet_glow = GlowAnimation()
+
+
 class Bullet(pg.sprite.Sprite):
     def __init__(self, x, y, direction):
         super().__init__()
         self.direction = direction
         self.speed = GameConfig.BULLET_SPEED * direction
-        self.color = self._generate_random_color()
-        self.radius = 5
-        self.glow_radius = 15
+        self.radius = bullet_glow.radius
+        self.glow_radius = bullet_glow.glow_radius
         self._init_image(x, y)
 
     def _init_image(self, x, y):
-        self.image = pg.Surface((self.glow_radius * 2, self.glow_radius * 2), pg.SRCALPHA)
+        self.image = bullet_glow.frame(pg.time.get_ticks())
         self.rect = self.image.get_rect(center=(x, y))
 
-    def _generate_random_color(self):
-        return (
-            random.randint(50, 255),
-            random.randint(50, 255),
-            random.randint(50, 255)
-        )
-
-    def _update_color(self, frame):
-        intensity = abs(math.sin(frame / 10)) * 200 + 55
-        self.color = (
-            int(intensity),
-            random.randint(50, 255),
-            random.randint(50, 255)
-        )
-
     def update(self):
         self._update_position()
         self._update_appearance()
@@ -134,24 +280,7 @@ class Bullet(pg.sprite.Sprite):
             self.kill()
 
     def _update_appearance(self):
-        frame = pg.time.get_ticks() // 50
-        self._update_color(frame)
-        self._redraw_bullet()
-
-    def _redraw_bullet(self):
-        self.image.fill((0, 0, 0, 0))
-        pg.draw.circle(
-            self.image,
-            (*self.color, 100),
-            (self.glow_radius, self.glow_radius),
-            self.glow_radius
-        )
-        pg.draw.circle(
-            self.image,
-            self.color,
-            (self.glow_radius, self.glow_radius),
-            self.radius
-        )
+        self.image = bullet_glow.frame(pg.time.get_ticks())
 
 
 class UIManager:
@@ -209,7 +338,8 @@ class GameManager:
             GameConfig.SCREEN_HEIGHT - 100,
             self.asset_manager.get_image('tank2'),
             -1,
-            self.asset_manager
+            self.asset_manager,
+            engine_channel=1
         )
 
         self.all_sprites = pg.sprite.Group(self.tank1, self.tank2)
@@ -253,9 +383,7 @@ class GameManager:
             self._shoot(self.tank2)
 
     def _shoot(self, tank):
-        shoot_sound = self.asset_manager.get_sound('shoot')
-        if shoot_sound:
-            shoot_sound.play()
+        self.asset_manager.audio.play('shoot')
         bullet = tank.shoot()
         self.bullets.add(bullet)
         self.all_sprites.add(bullet)
@@ -301,9 +429,7 @@ class GameManager:
         shooter = self.tank1 if bullet.direction > 0 else self.tank2
 
         if bullet.rect.colliderect(target.rect):
-            explosion_sound = self.asset_manager.get_sound('explosion')
-            if explosion_sound:
-                explosion_sound.play()
+            self.asset_manager.audio.play('explosion')
 
             is_destroyed = target.take_damage(20)
             shooter.score += 1
@@ -312,6 +438,8 @@ class GameManager:
             if is_destroyed:
                 self.game_over = True
                 pg.mixer.music.stop()
+                self.tank1.stop_engine()
+                self.tank2.stop_engine()
 
     def render(self):
         self.screen.blit(self.asset_manager.get_image('background'), (0, 0))
@@ -0,0 +1,136 @@
+"""Run many headless SpaceImpact games in parallel for balance tuning.
+
+Every combination of the parameter lists is played --runs times with
+different seeds by a bot (or random input), spread over a
+ProcessPoolExecutor. Results are written as columns (one array per
+field) to an .npz file, which is rewritten as workers finish, so partial
+results can be read while the batch is still running.
+
+    python batch.py --runs 20 --spawn-delay 600,1000 --enemy-speed 3-6,4-8 \\
+                    --shoot-delay 150,250 --out balance.npz
+
+    >>> results = numpy.load('balance.npz')
+    >>> results['score'][results['spawn_delay'] == 600].mean()
+"""
+import argparse
+import itertools
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pygame
+from game import Game
+from player import UP, DOWN, SHOOT
+from timestep import TICK_RATE
+
+COLUMNS = ('seed', 'spawn_delay', 'enemy_speed_min', 'enemy_speed_max', 'shoot_delay',
+           'score', 'survival_ticks', 'survived', 'peak_sprites', 'peak_enemies', 'peak_bullets')
+
+screen = None
+
+
+def init_worker():
+    # Each worker process gets its own off-screen display
+    global screen
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    os.environ['SDL_AUDIODRIVER'] = 'dummy'
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+
+
+def bot_controls(game, rng):
+    """Aim at the nearest enemy in front of the player and keep shooting."""
+    player = game.player.rect
+    ahead = [enemy.rect for enemy in game.enemies if enemy.rect.right > player.left]
+    controls = SHOOT
+    if ahead:
+        target = min(ahead, key=lambda rect: rect.x)
+        if target.centery < player.centery - 5:
+            controls |= UP
+        elif target.centery > player.centery + 5:
+            controls |= DOWN
+    return controls
+
+
+def random_controls(game, rng):
+    return rng.randrange(8)
+
+
+CONTROLLERS = {'bot': bot_controls, 'random': random_controls}
+
+
+def simulate(seed, spawn_delay, enemy_speed, shoot_delay, ticks, controller):
+    game = Game(screen, seed=seed)
+    game.enemy_spawn_delay = spawn_delay
+    game.enemy_speed = enemy_speed
+    game.player.shoot_delay = shoot_delay
+    controls_for = CONTROLLERS[controller]
+    rng = random.Random(seed)
+    peak_sprites = peak_enemies = peak_bullets = 0
+    while game.running and game.tick < ticks:
+        game.update(controls_for(game, rng))
+        peak_sprites = max(peak_sprites, len(game.all_sprites))
+        peak_enemies = max(peak_enemies, len(game.enemies))
+        peak_bullets = max(peak_bullets, len(game.player_bullets))
+    return (seed, spawn_delay, enemy_speed[0], enemy_speed[1], shoot_delay,
+            game.score, game.tick, game.running, peak_sprites, peak_enemies, peak_bullets)
+
+
+def save(path, rows):
+    columns = {name: np.array(values) for name, values in zip(COLUMNS, zip(*rows))}
+    temp = path + '.tmp.npz'
+    np.savez(temp, **columns)
+    os.replace(temp, path)
+
+
+def int_list(text):
+    return [int(value) for value in text.split(',')]
+
+
+def range_list(text):
+    return [tuple(int(value) for value in item.split('-')) for item in text.split(',')]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=10, help='seeds per parameter set')
+    parser.add_argument('--spawn-delay', type=int_list, default=[1000], help='ms, comma separated')
+    parser.add_argument('--enemy-speed', type=range_list, default=[(3, 6)], help='min-max, comma separated')
+    parser.add_argument('--shoot-delay', type=int_list, default=[250], help='ms, comma separated')
+    parser.add_argument('--seconds', type=float, default=120, help='simulated seconds per game')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the first game; each game gets the next one')
+    parser.add_argument('--controller', choices=sorted(CONTROLLERS), default='bot')
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--out', default='balance.npz')
+    args = parser.parse_args()
+
+    ticks = int(args.seconds * TICK_RATE)
+    parameter_sets = itertools.product(args.spawn_delay, args.enemy_speed, args.shoot_delay)
+    jobs = [(args.seed + i, *parameters)
+            for i, parameters in enumerate(parameters
+                                           for parameters in parameter_sets
+                                           for _ in range(args.runs))]
+
+    rows = []
+    start = last_save = time.perf_counter()
+    with ProcessPoolExecutor(args.workers, initializer=init_worker) as executor:
+        futures = [executor.submit(simulate, *job, ticks, args.controller) for job in jobs]
+        for future in as_completed(futures):
+            rows.append(future.result())
+            # Rewrite the results at most once a second while the batch runs
+            if time.perf_counter() - last_save > 1:
+                save(args.out, rows)
+                last_save = time.perf_counter()
+                print(f'{len(rows)}/{len(jobs)} games done', flush=True)
+    save(args.out, rows)
+
+    elapsed = time.perf_counter() - start
+    simulated = sum(row[COLUMNS.index('survival_ticks')] for row in rows)
+    print(f'{len(rows)} games, {simulated} ticks in {elapsed:.1f} s with {args.workers} workers '
+          f'({simulated / elapsed:.0f} ticks/s) -> {args.out}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""Compare dirty-rect and full-redraw rendering with many enemies on screen.
+
+Reports the pixels passed to display.update() and the time per frame.
+
+    python bench_render.py [--enemies 500] [--frames 600]
+"""
+import argparse
+import os
+import random
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from game import Game
+from enemy import Enemy
+
+
+def fill_enemies(game, count):
+    # Keep the screen full: new enemies appear anywhere along the width
+    while len(game.enemies) < count:
+        enemy = Enemy(800, 600)
+        enemy.rect.x = random.randint(0, 800)
+        game.all_sprites.add(enemy)
+        game.enemies.add(enemy)
+
+
+def run(screen, full_redraw, enemies, frames):
+    random.seed(1)
+    game = Game(screen, full_redraw=full_redraw)
+    game.player.health = 10 ** 9
+    game.enemy_spawn_delay = 10 ** 9
+    pixels = 0
+    start = time.perf_counter()
+    for _ in range(frames):
+        fill_enemies(game, enemies)
+        game.update()
+        rects = game.draw()
+        pygame.display.update(rects)
+        pixels += sum(rect.w * rect.h for rect in rects)
+    elapsed = time.perf_counter() - start
+    return elapsed / frames, pixels / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--enemies', type=int, default=500)
+    parser.add_argument('--frames', type=int, default=600)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    for enemies in sorted({10, 50, args.enemies}):
+        for name, full_redraw in (('dirty rects', False), ('full redraw', True)):
+            frame_time, pixels = run(screen, full_redraw, enemies, args.frames)
+            print(f'{enemies:>4} enemies  {name:<12} {frame_time * 1000:6.3f} ms/frame  '
+                  f'{pixels:>9.0f} px/frame ({pixels / (800 * 600):6.1%} of screen)')
+
+
+if __name__ == '__main__':
+    main()
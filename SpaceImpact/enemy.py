@@ -1,17 +1,20 @@
 import pygame
 import random
 
-class Enemy(pygame.sprite.Sprite):
-    def __init__(self, width, height):
+class Enemy(pygame.sprite.DirtySprite):
+    _layer = 2
+
+    def __init__(self, width, height, rng=random, speed=(3, 6)):
         super().__init__()
         self.image = pygame.Surface((40, 25))
         self.image.fill((255, 0, 0))  # Temporary red rectangle
         self.rect = self.image.get_rect()
         self.rect.x = width
-        self.rect.y = random.randint(0, height - 25)
-        self.speed = random.randint(3, 6)
+        self.rect.y = rng.randint(0, height - 25)
+        self.speed = rng.randint(*speed)
 
     def update(self):
         self.rect.x -= self.speed
+        self.dirty = 1
         if self.rect.right < 0:
             self.kill()
\ No newline at end of file
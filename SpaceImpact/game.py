@@ -1,17 +1,46 @@
 import pygame
-from player import Player
+from player import Player, SHOOT, read_controls
 from enemy import Enemy
 from projectile import Projectile
+from hud import TextSprite
+from timestep import TICK_MS
 import random
 
+HUD_LAYER = 4
+
 class Game:
-    def __init__(self, screen):
+    def __init__(self, screen, full_redraw=False, seed=None):
         self.screen = screen
+        # All game randomness comes from this generator, so a seed plus the
+        # per-tick controls reproduce a whole session
+        self.seed = random.randrange(2 ** 32) if seed is None else seed
+        self.random = random.Random(self.seed)
         self.running = True
         self.score = 0
-        
-        # Create sprite groups
-        self.all_sprites = pygame.sprite.Group()
+        # Simulation clock in milliseconds, advanced by exactly TICK_MS per
+        # update() so the game plays the same at any render rate
+        self.time = 0
+        self.tick = 0
+        self.shoot_requested = False
+        self.controls = 0  # input used by the last update()
+        # Sprite positions before the last update(), for interpolation
+        self.previous = {}
+        # Full redraw repaints the whole screen every frame instead of
+        # only the rectangles that changed
+        self.full_redraw = full_redraw
+        self.font = pygame.font.Font(None, 36)
+
+        # Static background, drawn once and used to erase moved sprites
+        self.background = pygame.Surface(screen.get_size()).convert()
+        self.background.fill((0, 0, 0))
+        self.screen.blit(self.background, (0, 0))
+
+        # Create sprite groups. all_sprites draws by layer:
+        # projectiles (1) < enemies (2) < player (3) < HUD (4)
+        self.all_sprites = pygame.sprite.LayeredDirty()
+        self.all_sprites.clear(self.screen, self.background)
+        # Never let pygame silently fall back to full-screen updates
+        self.all_sprites.set_timing_threshold(float('inf'))
         self.enemies = pygame.sprite.Group()
         self.player_bullets = pygame.sprite.Group()
         self.enemy_bullets = pygame.sprite.Group()
@@ -19,29 +48,54 @@ class Game:
         # Create player
         self.player = Player()
         self.all_sprites.add(self.player)
+
+        # HUD
+        self.score_text = TextSprite(self.font, (10, 10))
+        self.health_text = TextSprite(self.font, (10, 40))
+        self.all_sprites.add(self.score_text, self.health_text, layer=HUD_LAYER)
         
         # Enemy spawn timer
-        self.last_enemy_spawn = pygame.time.get_ticks()
+        self.last_enemy_spawn = 0
         self.enemy_spawn_delay = 1000  # Spawn enemy every 1 second
+        self.enemy_speed = (3, 6)  # Range of Enemy.speed in pixels per tick
 
     def handle_input(self, event):
+        # Shots are applied on the next simulation tick, not between ticks
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_SPACE:
-                if self.player.shoot():
-                    bullet = Projectile(self.player.rect.right, 
-                                      self.player.rect.centery)
-                    self.all_sprites.add(bullet)
-                    self.player_bullets.add(bullet)
+                self.shoot_requested = True
+
+    def shoot(self):
+        if self.player.shoot(self.time):
+            bullet = Projectile(self.player.rect.right, 
+                              self.player.rect.centery)
+            self.all_sprites.add(bullet)
+            self.player_bullets.add(bullet)
 
     def spawn_enemy(self):
-        now = pygame.time.get_ticks()
+        now = self.time
         if now - self.last_enemy_spawn > self.enemy_spawn_delay:
-            enemy = Enemy(800, 600)
+            enemy = Enemy(800, 600, self.random, self.enemy_speed)
             self.all_sprites.add(enemy)
             self.enemies.add(enemy)
             self.last_enemy_spawn = now
 
-    def update(self):
+    def update(self, controls=None):
+        """Advance the simulation by one fixed tick of TICK_MS.
+
+        controls are the UP/DOWN/SHOOT bits for this tick; by default they
+        are read from the keyboard and the queued space-bar presses.
+        """
+        if controls is None:
+            controls = read_controls(self.shoot_requested)
+        self.shoot_requested = False
+        self.controls = controls
+        self.tick += 1
+        self.time = self.tick * TICK_MS
+        self.previous = {sprite: sprite.rect.topleft for sprite in self.all_sprites}
+        if controls & SHOOT:
+            self.shoot()
+        self.player.controls = controls
         self.all_sprites.update()
         self.spawn_enemy()
         
@@ -58,13 +112,30 @@ class Game:
             if self.player.health <= 0:
                 self.running = False
 
-    def draw(self):
-        self.all_sprites.draw(self.screen)
-        
-        # Draw score
-        font = pygame.font.Font(None, 36)
-        score_text = font.render(f'Score: {self.score}', True, (255, 255, 255))
-        health_text = font.render(f'Health: {self.player.health}', True, 
-                                (255, 255, 255))
-        self.screen.blit(score_text, (10, 10))
-        self.screen.blit(health_text, (10, 40))
\ No newline at end of file
+    def draw(self, alpha=1.0):
+        """Draw the frame and return the rectangles to pass to display.update().
+
+        Moving sprites are drawn at alpha (0..1) of the way from their
+        position before the last tick to their current one. Their rects
+        are put back afterwards, so collisions only see simulated positions.
+        """
+        self.score_text.set_text(f'Score: {self.score}')
+        self.health_text.set_text(f'Health: {self.player.health}')
+
+        moved = []
+        for sprite in self.all_sprites:
+            previous = self.previous.get(sprite)
+            current = sprite.rect.topleft
+            if previous is None or previous == current:
+                continue
+            moved.append((sprite, current))
+            sprite.rect.topleft = (round(previous[0] + (current[0] - previous[0]) * alpha),
+                                   round(previous[1] + (current[1] - previous[1]) * alpha))
+            sprite.dirty = 1
+
+        if self.full_redraw:
+            self.all_sprites.repaint_rect(self.screen.get_rect())
+        rects = self.all_sprites.draw(self.screen)
+        for sprite, current in moved:
+            sprite.rect.topleft = current
+        return rects
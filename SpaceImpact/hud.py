@@ -0,0 +1,21 @@
+import pygame
+
+
+class TextSprite(pygame.sprite.DirtySprite):
+    """HUD text that is only re-rendered (and redrawn) when it changes."""
+
+    def __init__(self, font, position, color=(255, 255, 255)):
+        super().__init__()
+        self.font = font
+        self.color = color
+        self.text = None
+        self.image = pygame.Surface((0, 0))
+        self.rect = self.image.get_rect(topleft=position)
+
+    def set_text(self, text):
+        if text == self.text:
+            return
+        self.text = text
+        self.image = self.font.render(text, True, self.color)
+        self.rect = self.image.get_rect(topleft=self.rect.topleft)
+        self.dirty = 1
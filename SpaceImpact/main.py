@@ -1,6 +1,19 @@
+import argparse
 import pygame
 import sys
 from game import Game
+from replay import Recording
+from timestep import FixedTimestep
+
+parser = argparse.ArgumentParser(description='Space Impact')
+parser.add_argument('--fps', type=int, default=60,
+                    help='render rate cap, 0 for uncapped; the simulation always runs at 60 ticks/s')
+parser.add_argument('--full-redraw', action='store_true',
+                    help='repaint the whole screen every frame')
+parser.add_argument('--record', metavar='PATH',
+                    help='save the session (seed and per-tick input) for replay.py')
+parser.add_argument('--seed', type=int, help='random seed, for reproducible sessions')
+args = parser.parse_args()
 
 pygame.init()
 
@@ -12,26 +25,33 @@ pygame.display.set_caption("Space Impact")
 
 # Initialize clock
 clock = pygame.time.Clock()
-FPS = 60
+FPS = args.fps
+timestep = FixedTimestep()
 
 # Create game instance
-game = Game(screen)
+game = Game(screen, full_redraw=args.full_redraw, seed=args.seed)
+recording = Recording(game.seed) if args.record else None
+clock.tick()
 
 # Game loop
 while True:
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
+            if recording is not None:
+                recording.finish(game)
+                recording.save(args.record)
             pygame.quit()
             sys.exit()
         game.handle_input(event)
     
-    # Update game state
-    game.update()
+    # Update game state in fixed ticks for the real time that has passed
+    for _ in range(timestep.advance(clock.get_time())):
+        game.update()
+        if recording is not None:
+            recording.record(game.controls)
     
-    # Draw everything
-    screen.fill((0, 0, 0))  # Fill screen with black
-    game.draw()
-    pygame.display.flip()
+    # Draw everything, pushing only the changed rectangles to the display
+    pygame.display.update(game.draw(timestep.alpha))
     
-    # Control game speed
+    # Limit the render rate
     clock.tick(FPS)
\ No newline at end of file
@@ -1,6 +1,25 @@
 import pygame
 
-class Player(pygame.sprite.Sprite):
+# Input state for one simulation tick, as bit flags
+UP = 1
+DOWN = 2
+SHOOT = 4
+
+
+def read_controls(shoot=False):
+    """Current keyboard state as UP/DOWN/SHOOT bits."""
+    keys = pygame.key.get_pressed()
+    controls = SHOOT if shoot else 0
+    if keys[pygame.K_UP]:
+        controls |= UP
+    if keys[pygame.K_DOWN]:
+        controls |= DOWN
+    return controls
+
+
+class Player(pygame.sprite.DirtySprite):
+    _layer = 3
+
     def __init__(self):
         super().__init__()
         self.image = pygame.Surface((50, 30))
@@ -11,17 +30,19 @@ class Player(pygame.sprite.Sprite):
         self.speed = 5
         self.health = 3
         self.shoot_delay = 250  # Milliseconds
-        self.last_shot = pygame.time.get_ticks()
+        self.last_shot = 0
+        self.controls = 0  # set by Game before every update
 
     def update(self):
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_UP]:
+        y = self.rect.y
+        if self.controls & UP:
             self.rect.y = max(0, self.rect.y - self.speed)
-        if keys[pygame.K_DOWN]:
+        if self.controls & DOWN:
             self.rect.y = min(570, self.rect.y + self.speed)
+        if self.rect.y != y:
+            self.dirty = 1
 
-    def shoot(self):
-        now = pygame.time.get_ticks()
+    def shoot(self, now):
         if now - self.last_shot > self.shoot_delay:
             self.last_shot = now
             return True
@@ -1,6 +1,8 @@
 import pygame
 
-class Projectile(pygame.sprite.Sprite):
+class Projectile(pygame.sprite.DirtySprite):
+    _layer = 1
+
     def __init__(self, x, y, is_player=True):
         super().__init__()
         self.image = pygame.Surface((10, 5))
@@ -13,5 +15,6 @@ class Projectile(pygame.sprite.Sprite):
 
     def update(self):
         self.rect.x += self.speed
+        self.dirty = 1
         if self.rect.left > 800 or self.rect.right < 0:
             self.kill()
\ No newline at end of file
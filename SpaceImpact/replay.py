@@ -0,0 +1,126 @@
+"""Record and replay SpaceImpact sessions.
+
+A recording holds the RNG seed and the UP/DOWN/SHOOT bits of every
+simulation tick, so replaying it reproduces the session exactly. It also
+stores a digest of the final game state, which the replay checks.
+
+Replays double as performance workloads:
+
+    python replay.py session.sirp [--draw] [--repeat 5]
+
+runs a recording headless at uncapped speed and reports ticks per second
+and peak sprite counts.
+"""
+import argparse
+import os
+import struct
+import time
+import zlib
+
+import pygame
+from game import Game
+from timestep import TICK_RATE
+
+MAGIC = b'SIRP'
+VERSION = 1
+# magic, version, tick rate, seed, ticks, final state digest
+HEADER = struct.Struct('<4sBHQII')
+
+
+def state_digest(game):
+    """CRC32 of everything the simulation decides: tick, score, health and sprite rects."""
+    crc = zlib.crc32(struct.pack('<Iqi', game.tick, game.score, game.player.health))
+    # Only simulated sprites: the HUD changes when drawing, not when updating
+    for group in (game.enemies, game.player_bullets, game.enemy_bullets):
+        for sprite in group:
+            crc = zlib.crc32(struct.pack('<4i', *sprite.rect), crc)
+    return zlib.crc32(struct.pack('<4i', *game.player.rect), crc)
+
+
+class Recording:
+    def __init__(self, seed, controls=None, tick_rate=TICK_RATE, digest=0):
+        self.seed = seed
+        self.controls = bytearray(controls or b'')
+        self.tick_rate = tick_rate
+        self.digest = digest
+
+    def __len__(self):
+        return len(self.controls)
+
+    def record(self, controls):
+        self.controls.append(controls)
+
+    def finish(self, game):
+        self.digest = state_digest(game)
+
+    def save(self, path):
+        # One byte per tick, zlib-compressed: held keys compress to almost nothing
+        with open(path, 'wb') as file:
+            file.write(HEADER.pack(MAGIC, VERSION, self.tick_rate, self.seed,
+                                   len(self.controls), self.digest))
+            file.write(zlib.compress(bytes(self.controls), 9))
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as file:
+            data = file.read()
+        magic, version, tick_rate, seed, ticks, digest = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f'{path} is not a SpaceImpact recording')
+        controls = zlib.decompress(data[HEADER.size:])
+        if len(controls) != ticks:
+            raise ValueError(f'{path} is truncated')
+        return cls(seed, controls, tick_rate, digest)
+
+
+def replay(recording, screen, draw=False):
+    """Run a recording as fast as possible. Returns the game and statistics."""
+    game = Game(screen, seed=recording.seed)
+    peak_sprites = peak_enemies = peak_bullets = 0
+    start = time.perf_counter()
+    for controls in recording.controls:
+        game.update(controls)
+        if draw:
+            game.draw()
+        peak_sprites = max(peak_sprites, len(game.all_sprites))
+        peak_enemies = max(peak_enemies, len(game.enemies))
+        peak_bullets = max(peak_bullets, len(game.player_bullets))
+    elapsed = time.perf_counter() - start
+    return game, {
+        'ticks': len(recording),
+        'seconds': elapsed,
+        'ticks_per_second': len(recording) / elapsed if elapsed else float('inf'),
+        'peak_sprites': peak_sprites,
+        'peak_enemies': peak_enemies,
+        'peak_bullets': peak_bullets,
+        'matches': state_digest(game) == recording.digest,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('recording')
+    parser.add_argument('--draw', action='store_true', help='also render every tick (off-screen)')
+    parser.add_argument('--repeat', type=int, default=1)
+    args = parser.parse_args()
+
+    # Set here rather than at import, so main.py can record with a real window
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    recording = Recording.load(args.recording)
+    print(f'{args.recording}: seed {recording.seed}, {len(recording)} ticks '
+          f'({len(recording) / recording.tick_rate:.1f} s of play)')
+    for run in range(args.repeat):
+        game, stats = replay(recording, screen, args.draw)
+        print(f'run {run + 1}: {stats["ticks_per_second"]:9.0f} ticks/s  '
+              f'peak sprites {stats["peak_sprites"]}  enemies {stats["peak_enemies"]}  '
+              f'bullets {stats["peak_bullets"]}  score {game.score}  '
+              f'{"matches recording" if stats["matches"] else "DIVERGED from recording"}')
+        if not stats['matches']:
+            raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
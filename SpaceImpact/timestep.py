@@ -0,0 +1,33 @@
+TICK_RATE = 60  # simulation ticks per second
+TICK_MS = 1000 / TICK_RATE
+
+
+class FixedTimestep:
+    """Accumulator that turns elapsed real time into whole simulation ticks.
+
+    advance() returns how many ticks to run this frame, at most max_steps.
+    When the game falls further behind than that, the extra time is
+    dropped instead of being caught up later (no spiral of death).
+    alpha is how far the render time is between the last two ticks.
+    """
+
+    def __init__(self, tick_ms=TICK_MS, max_steps=5):
+        self.tick_ms = tick_ms
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.dropped = 0  # ticks skipped because the game fell too far behind
+
+    def advance(self, elapsed_ms):
+        self.accumulator += elapsed_ms
+        steps = int(self.accumulator // self.tick_ms)
+        if steps > self.max_steps:
+            self.dropped += steps - self.max_steps
+            steps = self.max_steps
+            self.accumulator = self.accumulator % self.tick_ms
+        else:
+            self.accumulator -= steps * self.tick_ms
+        return steps
+
+    @property
+    def alpha(self):
+        return self.accumulator / self.tick_ms
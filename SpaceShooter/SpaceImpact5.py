@@ -1,8 +1,11 @@
 import pygame
 import random
-import math
 import sys
 
+from animation import atlas
+from levels import NO_PATTERN, RANDOM_Y, LevelStream, load_levels
+from movement import PatternMovers, load_patterns
+
 # Inisialisasi Pygame
 pygame.init()
 
@@ -39,6 +42,13 @@ enemy_bullet_img = pygame.image.load("missile-right.png")
 missile_img = pygame.image.load("missile-xright.png")
 explode_img = pygame.image.load("boom1.png")
 enemy_explode_img = pygame.image.load("boom2.png")
+# Frame ledakan dibuat sekali saat load, semua Explosion memakai frame yang sama
+explode_anim = atlas.burst("explode", explode_img, count=10)
+enemy_explode_anim = atlas.burst("enemy_explode", enemy_explode_img, count=10)
+
+# Pola gerak musuh, dihitung sekali jadi tabel offset per tick; semua musuh
+# berpola digerakkan bersama oleh pattern_movers
+pattern_movers = PatternMovers(load_patterns("patterns5.json"))
 
 # Suara
 shoot_sound = pygame.mixer.Sound("tank-shots.mp3")
@@ -86,9 +96,13 @@ class Enemy(pygame.sprite.Sprite):
         self.bullet_img = bullet_img
         self.last_shoot_time = 0
         self.timer = 0
+        self.phase = 0  # geser indeks tabel pola gerak
+        self.slot = None  # slot di pattern_movers kalau musuh ini berpola
 
     def update(self):
-        self.rect.x -= self.speed
+        # Musuh berpola sudah digerakkan pattern_movers.step()
+        if self.slot is None:
+            self.rect.x -= self.speed
         self.timer += 1
         self.move_pattern()
         current_time = pygame.time.get_ticks()
@@ -98,9 +112,22 @@ class Enemy(pygame.sprite.Sprite):
         if self.rect.right < 0:
             self.kill()
 
+    pattern = None  # nama pola di patterns5.json
+
     def move_pattern(self):
         pass
 
+    def start_pattern(self):
+        # Dipanggil setelah posisi muncul diatur
+        if self.pattern is not None:
+            self.slot = pattern_movers.add(self, self.pattern, self.speed, self.phase)
+
+    def kill(self):
+        if self.slot is not None:
+            pattern_movers.remove(self.slot)
+            self.slot = None
+        super().kill()
+
     def shoot(self):
         if self.bullet_img:
             player_pos = (player_ship.rect.centerx, player_ship.rect.centery)
@@ -119,29 +146,19 @@ class StraightEnemy(Enemy):
 
 
 class ZigzagEnemy(Enemy):
-    def __init__(self, image, speed, shoot_interval, bullet_img=None):
-        super().__init__(image, speed, shoot_interval, bullet_img)
-        self.direction = 1
-        self.zigzag_timer = 0
-        self.zigzag_speed = 2
-
-    def move_pattern(self):
-        self.zigzag_timer += 1
-        if self.zigzag_timer >= 30:
-            self.direction *= -1
-            self.zigzag_timer = 0
-        self.rect.y += self.direction * self.zigzag_speed
+    pattern = "zigzag"
 
 
 class SinusoidalEnemy(Enemy):
-    def __init__(self, image, speed, shoot_interval, bullet_img=None):
-        super().__init__(image, speed, shoot_interval, bullet_img)
-        self.initial_y = self.rect.y
-        self.amplitude = 50
-        self.frequency = 0.05
+    pattern = "sine"
 
-    def move_pattern(self):
-        self.rect.y = self.initial_y + self.amplitude * math.sin(self.frequency * self.timer)
+
+# Musuh dengan pola gerak apa saja dari patterns5.json, dipilih oleh event level
+class PatternEnemy(Enemy):
+    def __init__(self, image, speed, shoot_interval, bullet_img=None, pattern="sine", phase=0):
+        super().__init__(image, speed, shoot_interval, bullet_img)
+        self.pattern = pattern
+        self.phase = phase
 
 
 # Kelas baru untuk asteroid yang muncul di mana saja secara random
@@ -186,16 +203,21 @@ class Bullet(pygame.sprite.Sprite):
 
 
 class Explosion(pygame.sprite.Sprite):
-    def __init__(self, x, y, image):
+    duration = 30  # frame
+
+    def __init__(self, x, y, animation):
         super().__init__()
-        self.image = image
+        self.animation = animation
+        self.image = animation[0]
         self.rect = self.image.get_rect(center=(x, y))
         self.timer = 0
 
     def update(self):
         self.timer += 1
-        if self.timer >= 30:
+        if self.timer >= self.duration:
             self.kill()
+        else:
+            self.image = self.animation[self.timer * len(self.animation) // self.duration]
 
 
 # Grup sprite
@@ -209,15 +231,8 @@ explosions = pygame.sprite.Group()
 player_ship = PlayerShip()
 all_sprites.add(player_ship)
 
-# Level
-levels = [
-    {"enemies": [{"type": "spaceship", "count": 5}, {"type": "missile_craft", "count": 3},
-                 {"type": "asteroid", "count": 2}]},
-    {"enemies": [{"type": "spaceship", "count": 3}, {"type": "missile_craft", "count": 5},
-                 {"type": "asteroid", "count": 3}]},
-    {"enemies": [{"type": "spaceship", "count": 2}, {"type": "missile_craft", "count": 3},
-                 {"type": "asteroid", "count": 5}]},
-]
+# Level: event spawn dibaca sekali dari levels5.json ke array terurut waktu
+enemy_types, levels = load_levels("levels5.json", pattern_movers.names)
 
 # Variabel permainan
 current_level = 0
@@ -231,26 +246,36 @@ asteroid_spawn_timer = 0
 asteroid_spawn_interval = random.randint(3000, 5000)  # Interval acak antara 3-5 detik
 
 
+# Buat musuh dari satu event spawn, tepat saat akan masuk layar
+def spawn_enemy(enemy_type, y, pattern=NO_PATTERN, phase=0):
+    enemy_type = enemy_types[enemy_type]
+    if enemy_type == "spaceship":
+        stats = (enemy_spaceship_img, 3, 2000, enemy_bullet_img)
+        enemy_class = StraightEnemy
+    elif enemy_type == "missile_craft":
+        stats = (enemy_missile_craft_img, 3, 1500, missile_img)
+        enemy_class = ZigzagEnemy
+    else:
+        # Gunakan RandomAsteroid bukan SinusoidalEnemy; posisinya sudah acak
+        return RandomAsteroid(asteroid_img, 2)
+    if pattern == NO_PATTERN:
+        enemy = enemy_class(*stats)
+    else:
+        # Pola dari event level menggantikan gerak bawaan tipe musuh
+        enemy = PatternEnemy(*stats, pattern=pattern_movers.names[pattern], phase=phase)
+    enemy.rect.x = widthScreen
+    enemy.rect.y = random.randint(50, heightScreen - 50) if y == RANDOM_Y else y
+    return enemy
+
+
 # Fungsi untuk memulai level baru
 def start_level(level_index):
-    global enemies_to_spawn
-    level_data = levels[level_index]
-    enemies_to_spawn = []
-    for enemy_type in level_data["enemies"]:
-        for _ in range(enemy_type["count"]):
-            if enemy_type["type"] == "spaceship":
-                enemies_to_spawn.append(StraightEnemy(enemy_spaceship_img, 3, 2000, enemy_bullet_img))
-            elif enemy_type["type"] == "missile_craft":
-                enemies_to_spawn.append(ZigzagEnemy(enemy_missile_craft_img, 3, 1500, missile_img))
-            elif enemy_type["type"] == "asteroid":
-                # Gunakan RandomAsteroid bukan SinusoidalEnemy
-                enemies_to_spawn.append(RandomAsteroid(asteroid_img, 2))
+    global level_stream
+    level_stream = LevelStream(levels[level_index], pygame.time.get_ticks())
 
 
 # Mulai level pertama
 start_level(0)
-spawn_timer = 0
-spawn_interval = 2000  # milidetik
 
 # Loop utama
 running = True
@@ -279,14 +304,11 @@ while running:
 
         # Munculkan musuh dari level
         current_time = pygame.time.get_ticks()
-        if enemies_to_spawn and current_time - spawn_timer >= spawn_interval:
-            enemy = enemies_to_spawn.pop(0)
-            if not isinstance(enemy, RandomAsteroid):  # Jika bukan RandomAsteroid, atur posisi di kanan layar
-                enemy.rect.x = widthScreen
-                enemy.rect.y = random.randint(50, heightScreen - 50)
+        for enemy_type, y, pattern, phase in level_stream.due(current_time):
+            enemy = spawn_enemy(enemy_type, y, pattern, phase)
+            enemy.start_pattern()
             enemies.add(enemy)
             all_sprites.add(enemy)
-            spawn_timer = current_time
 
         # Munculkan asteroid secara acak
         asteroid_spawn_timer += clock.get_time()
@@ -297,21 +319,22 @@ while running:
             asteroid_spawn_timer = 0
             asteroid_spawn_interval = random.randint(3000, 5000)  # Interval acak baru
 
-        # Perbarui semua sprite
+        # Perbarui semua sprite; musuh berpola digerakkan sekaligus lebih dulu
+        pattern_movers.step()
         all_sprites.update()
 
         # Periksa tabrakan
         for bullet, enemies_hit in pygame.sprite.groupcollide(player_bullets, enemies, True, True).items():
             for enemy in enemies_hit:
                 score += 10
-                explosion = Explosion(enemy.rect.centerx, enemy.rect.centery, enemy_explode_img)
+                explosion = Explosion(enemy.rect.centerx, enemy.rect.centery, enemy_explode_anim)
                 all_sprites.add(explosion)
                 explosion_sound.play()
 
         if pygame.sprite.spritecollide(player_ship, enemy_bullets, True):
             lives -= 1
             if lives <= 0:
-                explosion = Explosion(player_ship.rect.centerx, player_ship.rect.centery, explode_img)
+                explosion = Explosion(player_ship.rect.centerx, player_ship.rect.centery, explode_anim)
                 all_sprites.add(explosion)
                 explosion_sound.play()
                 game_state = "game_over"
@@ -324,7 +347,7 @@ while running:
         if pygame.sprite.spritecollide(player_ship, enemies, True):
             lives -= 1
             if lives <= 0:
-                explosion = Explosion(player_ship.rect.centerx, player_ship.rect.centery, explode_img)
+                explosion = Explosion(player_ship.rect.centerx, player_ship.rect.centery, explode_anim)
                 all_sprites.add(explosion)
                 explosion_sound.play()
                 game_state = "game_over"
@@ -335,7 +358,7 @@ while running:
                 defeat_sound.play()
 
         # Periksa apakah level selesai
-        if not enemies_to_spawn and not enemies:
+        if level_stream.done and not enemies:
             if current_level < len(levels) - 1:
                 current_level += 1
                 start_level(current_level)
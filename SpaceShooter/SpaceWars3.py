@@ -2,6 +2,8 @@ import random
 import pygame
 import math
 
+from font_cache import fonts, text_cache
+
 
 class Display:
     widthScreen = 1600
@@ -28,7 +30,7 @@ class Display:
     index = 0
     background_timer = 0
 
-    font = pygame.font.Font("SHPinscher-Regular.otf", 35)
+    font = fonts.get(35)
 
     spaceship = pygame.image.load("space_ship.png")
     enemy_spaceship = pygame.image.load("enemy-spaceship.png")
@@ -52,8 +54,7 @@ class Text:
 
     def display(self):
         color = (255, 0, 0) if self.selected else (255, 255, 255)
-        font = pygame.font.Font("SHPinscher-Regular.otf", self.size)
-        return font.render(self.text, True, color)
+        return text_cache.render(self.text, self.size, color)
 
 
 class Menu:
@@ -504,11 +505,11 @@ class Objects:
                                   0] + Display.widthScreen
 
     def health_display(self):
-        health_text = Display.font.render(f"Health: {self.health}", True, (255, 255, 255))
+        health_text = text_cache.render(f"Health: {self.health}", 35, (255, 255, 255))
         Display.windows.blit(health_text, (10, 40))
 
     def score_board(self):
-        score_board = Display.font.render(f"Score: {self.score}", True, (255, 255, 255))
+        score_board = text_cache.render(f"Score: {self.score}", 35, (255, 255, 255))
         Display.windows.blit(score_board, (10, 0))
 
     def insert_laser(self):
@@ -2,6 +2,13 @@ import random
 import pygame
 import math
 
+from assets import AssetLoader, AssetManager
+from background import ScrollingBackground
+from font_cache import fonts, text_cache
+from profiler import profiler
+from projectiles import BULLET, MISSILE, ProjectilePool
+from spatial_hash import SpatialHash
+
 
 class Display:
     widthScreen = 1600
@@ -11,37 +18,116 @@ class Display:
     windows = pygame.display.set_mode((widthScreen, heightScreen))
     pygame.display.set_caption("Enhanced Space Shooter")
     clock = pygame.time.Clock()
+    # Sumber waktu game dalam ms, bisa diganti jam simulasi (lihat headless.py)
+    get_ticks = pygame.time.get_ticks
+
+    # Semua gambar di-convert ke format layar, hasil scale di-cache di disk
+    assets = AssetManager()
+
+    # Frame pertama menu cukup butuh background menu dan font
+    background = assets.image("background5.jpg", (widthScreen, heightScreen))
+    font = fonts.get(35)
+
+    # Sisanya dimuat di thread sementara menu sudah jalan (lihat Display.ready)
+    loader = AssetLoader(assets)
+    loader.image("spaceship", "space_ship.png", alpha=True)
+    loader.image("enemy_spaceship", "enemy-spaceship.png", alpha=True)
+    loader.image("enemy_missile_craft", "enemy-ship.png", alpha=True)
+    loader.image("laser", "torpedo-left.png", alpha=True)
+    loader.image("enemy_laser", "missile-right.png", alpha=True)
+    loader.image("missile", "missile-xright.png", alpha=True)
+
+    loader.sound("shoot_sound", "tank-shots.mp3")
+    loader.sound("enemy_shoot_sound", "tank-hits.mp3")
+    loader.sound("explosion_sound", "tank-explode.mp3")
+    loader.sound("background_music", "background1.mp3")
+
+    for i in range(6):
+        loader.image(f"background{i}", f"background{i}.jpg", (widthScreen, heightScreen))
+
+    loader.sound("victory_sound", "victory.mp3")  # Add victory sound
+    loader.sound("defeat_sound", "defeat.mp3")  # Add defeat sound
+    loader.start()
+
+    @classmethod
+    def ready(cls):
+        """Pasang aset yang sudah selesai dimuat; True kalau game sudah bisa dimulai."""
+        done = cls.loader.poll()
+        for name, value in cls.loader.loaded.items():
+            setattr(cls, name, value)
+        if done and not hasattr(cls, "projectiles"):
+            cls.setup()
+        return done
+
+    @classmethod
+    def wait(cls):
+        cls.loader.wait()
+        cls.ready()
+
+    @classmethod
+    def setup(cls):
+        cls.backgrounds = [cls.loader.loaded[f"background{i}"] for i in range(6)]
+        # Ganti background setiap 5 detik (300 frame pada 60 FPS) dengan crossfade
+        cls.scenery = ScrollingBackground(cls.backgrounds, hold=300)
+
+        # Ukuran sel grid tabrakan mengikuti sprite terbesar (pesawat musuh / laser)
+        cls.grid_cell = max(*cls.enemy_spaceship.get_size(), *cls.laser.get_size())
+
+        # Semua peluru dan misil musuh, index gambar sesuai BULLET / MISSILE
+        cls.projectile_images = [cls.enemy_laser, cls.missile]
+        cls.projectiles = ProjectilePool(
+            cls.widthScreen, cls.heightScreen,
+            [image.get_size() for image in cls.projectile_images],
+            cell_size=cls.grid_cell,
+        )
 
-    background = pygame.image.load("background5.jpg")
-    background = pygame.transform.scale(background, (widthScreen, heightScreen))
-
-    backgrounds = [
-        pygame.transform.scale(pygame.image.load("background0.jpg"), (widthScreen, heightScreen)),
-        pygame.transform.scale(pygame.image.load("background1.png"), (widthScreen, heightScreen)),
-        pygame.transform.scale(pygame.image.load("background2.jpg"), (widthScreen, heightScreen)),
-        pygame.transform.scale(pygame.image.load("background3.jpeg"), (widthScreen, heightScreen)),
-        pygame.transform.scale(pygame.image.load("background4.jpg"), (widthScreen, heightScreen)),
-        pygame.transform.scale(pygame.image.load("background5.jpg"), (widthScreen, heightScreen))
-    ]
-
-    index = 0
-    background_timer = 0
-
-    font = pygame.font.Font("SHPinscher-Regular.otf", 35)
-
-    spaceship = pygame.image.load("space_ship.png")
-    enemy_spaceship = pygame.image.load("enemy-spaceship.png")
-    enemy_missile_craft = pygame.image.load("enemy-ship.png")
-    laser = pygame.image.load("torpedo-left.png")
-    enemy_laser = pygame.image.load("missile-right.png")
-    missile = pygame.image.load("missile-xright.png")
 
-    shoot_sound = pygame.mixer.Sound("tank-shots.mp3")
-    enemy_shoot_sound = pygame.mixer.Sound("tank-hits.mp3")
-    explosion_sound = pygame.mixer.Sound("tank-explode.mp3")
-    background_music = pygame.mixer.Sound("background.mp3")
-    victory_sound = pygame.mixer.Sound("victory.mp3")  # Add victory sound
-    defeat_sound = pygame.mixer.Sound("defeat.mp3")  # Add defeat sound
+class Scene:
+    """Satu layar game. frame() memproses satu frame dan mengembalikan scene
+    berikutnya: self untuk tetap, scene lain untuk pindah, None untuk keluar."""
+    fps = 0  # 0 = tanpa clock.tick
+    wait_ms = 0  # > 0: tunggu input paling lama wait_ms sebelum frame berikutnya
+    dirty = None  # Rect yang berubah di frame ini, None = flip seluruh layar
+    drawn = None  # {key: (surface, rect)} yang sudah ada di layar
+
+    def frame(self, events):
+        return self
+
+    def draw_items(self, items):
+        """Gambar [(key, surface, posisi)] di atas Display.background.
+
+        Frame pertama menggambar semuanya; setelah itu hanya area item yang
+        berubah (surface lain atau pindah posisi) yang digambar ulang dan
+        dicatat di self.dirty untuk display.update().
+        """
+        windows = Display.windows
+        placed = {
+            key: (surface, pygame.Rect(position, surface.get_size()))
+            for key, surface, position in items
+        }
+        if self.drawn is None:
+            windows.blit(Display.background, (0, 0))
+            for surface, rect in placed.values():
+                windows.blit(surface, rect)
+            self.dirty = [windows.get_rect()]
+        else:
+            dirty = []
+            for key in placed.keys() | self.drawn.keys():
+                old, new = self.drawn.get(key), placed.get(key)
+                if old != new:
+                    for entry in (old, new):
+                        if entry and entry[1] not in dirty:
+                            dirty.append(entry[1])
+            # Item bisa bertumpuk, jadi area kotor digambar ulang dengan clip
+            for area in dirty:
+                windows.set_clip(area)
+                windows.blit(Display.background, (0, 0))
+                for surface, rect in placed.values():
+                    if rect.colliderect(area):
+                        windows.blit(surface, rect)
+            windows.set_clip(None)
+            self.dirty = dirty
+        self.drawn = placed
 
 
 class Text:
@@ -52,11 +138,13 @@ class Text:
 
     def display(self):
         color = (255, 0, 0) if self.selected else (255, 255, 255)
-        font = pygame.font.Font("SHPinscher-Regular.otf", self.size)
-        return font.render(self.text, True, color)
+        return text_cache.render(self.text, self.size, color)
+
 
+class Victory(Scene):
+    fps = 30
+    wait_ms = 500
 
-class Victory:
     def __init__(self, score, health, play_time):
         self.text_list = []
         self.selected = 0
@@ -65,6 +153,7 @@ class Victory:
         self.play_time = play_time
         pygame.mixer.stop()
         Display.victory_sound.play()
+        self.text(3)
 
     def text(self, code: int):
         options = ["Play Again  ", "  Exit"]
@@ -77,21 +166,20 @@ class Victory:
             self.text_list[0].selected = True
 
     def objects(self):
-        Display.windows.blit(Display.background, (0, 0))
-        Display.windows.blit(
-            self.text(1),
-            ((Display.windows.get_width() - self.text(1).get_width()) / 2, 70),
-        )
-        Display.windows.blit(
-            self.text(2),
-            ((Display.windows.get_width() - self.text(2).get_width()) / 2, 200),
-        )
-        for text in self.text_list:
-            if text == self.text_list[0]:
-                ops = (Display.windows.get_width() - text.display().get_width()) / 2 - 50
+        title = self.text(1)
+        stats = self.text(2)
+        items = [
+            ("title", title, ((Display.windows.get_width() - title.get_width()) / 2, 70)),
+            ("stats", stats, ((Display.windows.get_width() - stats.get_width()) / 2, 200)),
+        ]
+        for i, text in enumerate(self.text_list):
+            surface = text.display()
+            if i == 0:
+                ops = (Display.windows.get_width() - surface.get_width()) / 2 - 50
             else:
-                ops = (Display.windows.get_width() - text.display().get_width()) / 2 + 50
-            Display.windows.blit(text.display(), (ops, 250))
+                ops = (Display.windows.get_width() - surface.get_width()) / 2 + 50
+            items.append((i, surface, (ops, 250)))
+        self.draw_items(items)
 
     def controls(self, event: pygame.event):
         if event.type == pygame.KEYDOWN:
@@ -109,23 +197,27 @@ class Victory:
     def buttons_func(self, event: pygame.event):
         if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
             if self.selected == 0:
-                Start().execute()
+                return Start()
             else:
-                exit()
+                return None
+        return self
+
+    def frame(self, events):
+        for event in events:
+            if event.type == pygame.QUIT:
+                return None
+            self.controls(event)
+            next_scene = self.buttons_func(event)
+            if next_scene is not self:
+                return next_scene
+        self.objects()
+        return self
 
-    def execute(self):
-        self.text(3)
-        while True:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    exit()
-                self.controls(event)
-                self.buttons_func(event)
-            self.objects()
-            pygame.display.flip()
 
+class GameOver(Scene):
+    fps = 30
+    wait_ms = 500
 
-class GameOver:
     def __init__(self, score, health, play_time):
         self.text_list = []
         self.selected = 0
@@ -134,6 +226,7 @@ class GameOver:
         self.play_time = play_time
         pygame.mixer.stop()
         Display.defeat_sound.play()
+        self.text(3)
 
     def text(self, code: int):
         options = ["Try Again", "Exit"]
@@ -146,21 +239,20 @@ class GameOver:
             self.text_list[0].selected = True
 
     def objects(self):
-        Display.windows.blit(Display.background, (0, 0))
-        Display.windows.blit(
-            self.text(1),
-            ((Display.windows.get_width() - self.text(1).get_width()) / 2, 70),
-        )
-        Display.windows.blit(
-            self.text(2),
-            ((Display.windows.get_width() - self.text(2).get_width()) / 2, 200),
-        )
-        for text in self.text_list:
-            if text == self.text_list[0]:
-                ops = (Display.windows.get_width() - text.display().get_width()) / 2 - 50
+        title = self.text(1)
+        stats = self.text(2)
+        items = [
+            ("title", title, ((Display.windows.get_width() - title.get_width()) / 2, 70)),
+            ("stats", stats, ((Display.windows.get_width() - stats.get_width()) / 2, 200)),
+        ]
+        for i, text in enumerate(self.text_list):
+            surface = text.display()
+            if i == 0:
+                ops = (Display.windows.get_width() - surface.get_width()) / 2 - 50
             else:
-                ops = (Display.windows.get_width() - text.display().get_width()) / 2 + 50
-            Display.windows.blit(text.display(), (ops, 250))
+                ops = (Display.windows.get_width() - surface.get_width()) / 2 + 50
+            items.append((i, surface, (ops, 250)))
+        self.draw_items(items)
 
     def controls(self, event: pygame.event):
         if event.type == pygame.KEYDOWN:
@@ -178,32 +270,35 @@ class GameOver:
     def buttons_func(self, event: pygame.event):
         if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
             if self.selected == 0:
-                Start().execute()
+                return Start()
             else:
-                exit()
+                return None
+        return self
 
-    def execute(self):
-        self.text(3)
-        while True:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    exit()
-                self.controls(event)
-                self.buttons_func(event)
-            self.objects()
-            pygame.display.flip()
+    def frame(self, events):
+        for event in events:
+            if event.type == pygame.QUIT:
+                return None
+            self.controls(event)
+            next_scene = self.buttons_func(event)
+            if next_scene is not self:
+                return next_scene
+        self.objects()
+        return self
 
 
 class Enemies:
+    next_id = 0
+
     def __init__(self, player_x, player_y):
+        self.id = Enemies.next_id
+        Enemies.next_id += 1
         self.x = random.randint(Display.windows.get_width() // 3, Display.windows.get_height())
         self.y = random.randint(
             0,
             Display.windows.get_height() - Display.enemy_spaceship.get_height() + 1,
         )
         self.type = random.choice([1, 2])
-        self.bullets_list = []
-        self.missiles_list = []
         self.alive = True
         self.shoot_cooldown = 0
         self.player_x = player_x
@@ -249,45 +344,50 @@ class Enemies:
             muzzle_x = self.x
             muzzle_y = self.y + (Display.enemy_spaceship.get_height() // 2)  # Center vertically
 
-            if len(self.bullets_list) < 2:
+            if Display.projectiles.count(self.id, BULLET) < 2:
                 trajectory_x, trajectory_y = self.calculate_trajectory(
                     muzzle_x, muzzle_y,
                     player_x, player_y + Display.spaceship.get_height() // 2,
                     5
                 )
 
-                self.bullets_list.append({
-                    'x': muzzle_x,
-                    'y': muzzle_y - (Display.enemy_laser.get_height() // 2),  # Adjust for laser height
-                    'vel_x': trajectory_x,
-                    'vel_y': trajectory_y
-                })
+                Display.projectiles.spawn(
+                    muzzle_x,
+                    muzzle_y - (Display.enemy_laser.get_height() // 2),  # Adjust for laser height
+                    trajectory_x, trajectory_y,
+                    BULLET, self.id
+                )
                 Display.enemy_shoot_sound.play()
 
         elif self.type == 2:  # enemy_missile_craft
             muzzle_x = self.x
             muzzle_y = self.y + (Display.enemy_missile_craft.get_height() // 2)  # Center vertically
 
-            if len(self.missiles_list) < 1:
+            if Display.projectiles.count(self.id, MISSILE) < 1:
                 trajectory_x, trajectory_y = self.calculate_trajectory(
                     muzzle_x, muzzle_y,
                     player_x, player_y,
                     2
                 )
 
-                self.missiles_list.append({
-                    'x': muzzle_x,
-                    'y': muzzle_y - (Display.missile.get_height() // 2),  # Adjust for missile height
-                    'vel_x': trajectory_x,
-                    'vel_y': trajectory_y
-                })
+                Display.projectiles.spawn(
+                    muzzle_x,
+                    muzzle_y - (Display.missile.get_height() // 2),  # Adjust for missile height
+                    trajectory_x, trajectory_y,
+                    MISSILE, self.id
+                )
                 Display.shoot_sound.play()
 
 
-class Menu:
+class Menu(Scene):
+    fps = 30
+    wait_ms = 100  # Cukup sering untuk menggerakkan loading bar
+
     def __init__(self):
         self.text_list = []
         self.selected = 1
+        self.bar = None
+        self.text()
 
     def text(self):
         text_list = ["Space Wars", "Start", "Exit"]
@@ -313,30 +413,47 @@ class Menu:
     def buttons_function(self, event: pygame.event):
         if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
             if self.selected == 1:
-                Start().execute()
+                # Tunggu sisa aset kalau pemain menekan Start sebelum selesai dimuat
+                Display.wait()
+                return Start()
             if self.selected == 2:
-                exit()
+                return None
+        return self
 
     def objects(self):
         spacing = 50
-        Display.windows.blit(Display.background, (0, 0))
-        for text in self.text_list:
-            Display.windows.blit(
-                text.display(),
-                ((Display.windows.get_width() - text.display().get_width()) / 2, spacing),
-            )
+        items = []
+        for i, text in enumerate(self.text_list):
+            surface = text.display()
+            items.append((i, surface, ((Display.windows.get_width() - surface.get_width()) / 2, spacing)))
             spacing += 100
-
-    def execute(self):
-        self.text()
-        while True:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    exit()
-                self.controls(event)
-                self.buttons_function(event)
-            self.objects()
-            pygame.display.flip()
+        if not Display.ready():
+            items.append(("loading", *self.loading_bar()))
+        self.draw_items(items)
+
+    def loading_bar(self):
+        width, height = 400, 20
+        progress = Display.loader.progress
+        # Surface bar baru hanya dibuat kalau progress berubah
+        if self.bar is None or self.bar[0] != progress:
+            bar = pygame.Surface((width, height), pygame.SRCALPHA)
+            pygame.draw.rect(bar, (255, 255, 255), (0, 0, width, height), 2)
+            pygame.draw.rect(bar, (255, 255, 255), (0, 0, width * progress, height))
+            self.bar = (progress, bar)
+        x = (Display.windows.get_width() - width) / 2
+        y = Display.windows.get_height() - 100
+        return self.bar[1], (x, y)
+
+    def frame(self, events):
+        for event in events:
+            if event.type == pygame.QUIT:
+                return None
+            self.controls(event)
+            next_scene = self.buttons_function(event)
+            if next_scene is not self:
+                return next_scene
+        self.objects()
+        return self
 
 
 class Objects:
@@ -345,8 +462,9 @@ class Objects:
         self.y = (Display.windows.get_height() - Display.spaceship.get_width()) / 2
         self.laser_list = []
         self.enemies_list = []
+        self.enemy_grid = SpatialHash(Display.grid_cell)
         self.enemy_count = random.randint(1, 3)
-        self.background_list = [[0, 0], [Display.widthScreen, 0]]
+        self.background_x = 0
         self.score = 0
         self.condition = 20
         self.health = 1000
@@ -358,25 +476,27 @@ class Objects:
         # Add auto-firing variables
         self.last_shot_time = 0
         self.firing_delay = 200  # Delay between shots in milliseconds
+        # Scene Victory / GameOver berikutnya, diambil Start di akhir frame
+        self.outcome = None
+        Display.projectiles.clear()
 
     def check_victory(self):
         # Check if there are no enemies or enemy projectiles on screen
         no_enemies = len([e for e in self.enemies_list if e.alive]) == 0
-        no_enemy_projectiles = all(len(e.bullets_list) == 0 and len(e.missiles_list) == 0
-                                   for e in self.enemies_list)
+        no_enemy_projectiles = Display.projectiles.count() == 0
 
-        if no_enemies and no_enemy_projectiles:
+        if no_enemies and no_enemy_projectiles and self.outcome is None:
             self.victory_condition = True
-            play_time = (pygame.time.get_ticks() - self.start_time) / 1000 if self.start_time else 0
-            Victory(self.score, self.health, play_time).execute()
+            play_time = (Display.get_ticks() - self.start_time) / 1000 if self.start_time else 0
+            self.outcome = Victory(self.score, self.health, play_time)
 
     def check_defeat(self):
-        if self.health <= 0:
-            play_time = (pygame.time.get_ticks() - self.start_time) / 1000 if self.start_time else 0
-            GameOver(self.score, self.health, play_time).execute()
+        if self.health <= 0 and self.outcome is None:
+            play_time = (Display.get_ticks() - self.start_time) / 1000 if self.start_time else 0
+            self.outcome = GameOver(self.score, self.health, play_time)
 
     def auto_fire(self):
-        current_time = pygame.time.get_ticks()
+        current_time = Display.get_ticks()
         if current_time - self.last_shot_time >= self.firing_delay:
             self.insert_laser()
             self.last_shot_time = current_time
@@ -384,16 +504,24 @@ class Objects:
     # [Rest of the Objects class methods remain the same]
     # Include all other methods from the original Objects class here
     def objects(self):
-        Display.windows.fill((0, 0, 0))
-        self.background()
-        self.collision_box()
-        Display.windows.blit(Display.spaceship, (self.x, self.y))
+        # Tiap fase diukur kalau profiler aktif (SPACEWARS_PROFILE=1)
+        with profiler.phase("background"):
+            self.background()
+        with profiler.phase("collision_box"):
+            self.collision_box()
+            Display.windows.blit(Display.spaceship, (self.x, self.y))
         # Add auto-firing
-        self.auto_fire()
-        self.fire_laser()
-        self.enemies_movement()
-        self.score_board()
-        self.health_display()
+        with profiler.phase("auto_fire"):
+            self.auto_fire()
+        with profiler.phase("fire_laser"):
+            self.fire_laser()
+        with profiler.phase("enemies"):
+            self.enemies_movement()
+        with profiler.phase("score_board"):
+            self.score_board()
+        with profiler.phase("health"):
+            self.health_display()
+        profiler.overlay(Display.windows)
 
     def place_enemies(self):
         # Bersihkan musuh yang sudah mati dari daftar
@@ -446,59 +574,22 @@ class Objects:
                     enemies.firing(self.x, self.y)
                     enemies.shoot_cooldown = 0
 
-            # Render and move enemy bullets and missiles
-            self.render_enemy_bullets(enemies)
-
-    def render_enemy_bullets(self, enemy):
-        # Only render projectiles if enemy is alive
-        if not enemy.alive:
-            enemy.bullets_list.clear()
-            enemy.missiles_list.clear()
-            return
+            # Proyektil musuh yang mati ikut hilang
+            if not enemies.alive:
+                Display.projectiles.kill_owner(enemies.id)
 
-        # Render and move laser bullets
-        for bullet in enemy.bullets_list[:]:
-            Display.windows.blit(
-                Display.enemy_laser,
-                (bullet['x'], bullet['y'])
-            )
-            bullet['x'] += bullet['vel_x']
-            bullet['y'] += bullet['vel_y']
-
-            # Remove bullets that are out of screen
-            if (bullet['x'] < 0 or bullet['x'] > Display.windows.get_width() or
-                    bullet['y'] < 0 or bullet['y'] > Display.windows.get_height()):
-                enemy.bullets_list.remove(bullet)
-
-            # Check collision with player
-            bullet_rect = pygame.Rect(
-                bullet['x'], bullet['y'],
-                Display.enemy_laser.get_width(), Display.enemy_laser.get_height()
-            )
-            self.player_hit(bullet_rect)
+        # Render and move enemy bullets and missiles
+        self.render_enemy_bullets()
 
-        # Render and move missiles
-        for missile in enemy.missiles_list[:]:
-            Display.windows.blit(
-                Display.missile,
-                (missile['x'], missile['y'])
-            )
-            missile['x'] += missile['vel_x']
-            missile['y'] += missile['vel_y']
-
-            # Remove missiles that are out of screen
-            if (missile['x'] < 0 or missile['x'] > Display.windows.get_width() or
-                    missile['y'] < 0 or missile['y'] > Display.windows.get_height()):
-                enemy.missiles_list.remove(missile)
-
-            # Check collision with player
-            missile_rect = pygame.Rect(
-                missile['x'], missile['y'],
-                Display.missile.get_width(), Display.missile.get_height()
-            )
-            self.player_hit(missile_rect)
+    def render_enemy_bullets(self):
+        # Move, cull and player-test every enemy projectile in one step
+        draws, hits = Display.projectiles.step(self.collision_box())
+        ProjectilePool.draw(Display.windows, Display.projectile_images, draws)
+        if hits:
+            self.player_hit(hits)
 
     def fire_laser(self):
+        self.sync_enemy_grid()
         for location in self.laser_list[:]:
             rect = pygame.Rect(
                 (location[0], location[1] + 15),
@@ -512,8 +603,17 @@ class Objects:
                     self.laser_list.remove(location)
             location[0] += 5
 
+    def sync_enemy_grid(self):
+        # Musuh bergerak atau muncul sejak frame lalu, perbarui posisinya di grid
+        for enemy in self.enemies_list:
+            if enemy.alive:
+                self.enemy_grid.update(enemy, enemy.collision_box())
+            else:
+                self.enemy_grid.remove(enemy)
+
     def laser_collision(self, rect: pygame.Rect, laser: list):
-        for enemy in self.enemies_list[:]:
+        # Hanya musuh di sel yang sama yang dicek, urut seperti di enemies_list
+        for enemy in sorted(self.enemy_grid.query(rect), key=lambda e: e.id):
             # Check collision with enemy
             if enemy.alive:
                 collision = rect.colliderect(enemy.collision_box())
@@ -524,33 +624,13 @@ class Objects:
                     self.reset_enemies(enemy, False)
                     self.score += 5
 
-            # Check collision with enemy lasers
-            for bullet in enemy.bullets_list[:]:
-                bullet_rect = pygame.Rect(
-                    bullet['x'], bullet['y'],
-                    Display.enemy_laser.get_width(), Display.enemy_laser.get_height()
-                )
-                if rect.colliderect(bullet_rect):
-                    Display.explosion_sound.play()
-                    if laser in self.laser_list:
-                        self.laser_list.remove(laser)
-                    if bullet in enemy.bullets_list:
-                        enemy.bullets_list.remove(bullet)
-                    self.score += 5
-
-            # Check collision with enemy missiles
-            for missile in enemy.missiles_list[:]:
-                missile_rect = pygame.Rect(
-                    missile['x'], missile['y'],
-                    Display.missile.get_width(), Display.missile.get_height()
-                )
-                if rect.colliderect(missile_rect):
-                    Display.explosion_sound.play()
-                    if laser in self.laser_list:
-                        self.laser_list.remove(laser)
-                    if missile in enemy.missiles_list:
-                        enemy.missiles_list.remove(missile)
-                    self.score += 5
+        # Check collision with enemy lasers and missiles
+        for index in Display.projectiles.collide_rect(rect):
+            Display.explosion_sound.play()
+            if laser in self.laser_list:
+                self.laser_list.remove(laser)
+            Display.projectiles.kill(index)
+            self.score += 5
 
     def collision_box(self):
         return pygame.Rect(
@@ -559,33 +639,16 @@ class Objects:
         )
 
     def background(self):
-        # Increment background change timer
-        Display.background_timer += 1
-
-        # Change background every 5 seconds (approximately 300 frames at 60 FPS)
-        if Display.background_timer >= 300:
-            Display.index = (Display.index + 1) % len(Display.backgrounds)
-            Display.background_timer = 0
-
-        # Use current background image
-        current_background = Display.backgrounds[Display.index]
-
-        for location in self.background_list:
-            Display.windows.blit(current_background, (location[0], location[1]))
-            location[0] -= 2
-
-            # When first background completely leaves screen, reset its position
-            if location[0] + Display.widthScreen <= 0:
-                # Place it after the last background
-                location[0] = self.background_list[(self.background_list.index(location) + 1) % 2][
-                                  0] + Display.widthScreen
+        # Background menutupi seluruh layar, jadi tidak perlu fill hitam dulu
+        Display.scenery.draw(Display.windows, self.background_x)
+        self.background_x = (self.background_x + 2) % Display.widthScreen
 
     def health_display(self):
-        health_text = Display.font.render(f"Health: {self.health}", True, (255, 255, 255))
+        health_text = text_cache.render(f"Health: {self.health}", 35, (255, 255, 255))
         Display.windows.blit(health_text, (10, 40))
 
     def score_board(self):
-        score_board = Display.font.render(f"Score: {self.score}", True, (255, 255, 255))
+        score_board = text_cache.render(f"Score: {self.score}", 35, (255, 255, 255))
         Display.windows.blit(score_board, (10, 0))
 
     def insert_laser(self):
@@ -603,6 +666,7 @@ class Objects:
 
     def reset_enemies(self, enemies: 'Enemies', condition: bool):
         enemies.alive = False
+        self.enemy_grid.remove(enemies)
         if condition:
             if enemies in self.enemies_list:
                 self.enemies_list.remove(enemies)
@@ -630,19 +694,21 @@ class Objects:
                 else:
                     new_enemy.type = 1
                 self.enemies_list.append(new_enemy)
+                self.enemy_grid.insert(new_enemy, new_enemy.collision_box())
                 self.enemy_count += 1
 
-    def player_hit(self, collision: pygame.Rect):
-        hit = collision.colliderect(self.collision_box())
-        if hit:
+    def player_hit(self, hits: int):
+        for _ in range(hits):
             self.health -= 1
             self.score -= 1
             if self.health <= 0:
-                play_time = (pygame.time.get_ticks() - self.start_time) / 1000 if self.start_time else 0
-                GameOver(self.score, self.health, play_time).execute()
+                self.check_defeat()
+                break
 
 
-class Start:
+class Start(Scene):
+    fps = 60
+
     def __init__(self):
         self.object = Objects()
         self.up = False
@@ -658,12 +724,12 @@ class Start:
             if event.key == pygame.K_w:
                 self.up = True
                 if not self.object.game_started:
-                    self.object.start_time = pygame.time.get_ticks()
+                    self.object.start_time = Display.get_ticks()
                     self.object.game_started = True
             if event.key == pygame.K_s:
                 self.down = True
                 if not self.object.game_started:
-                    self.object.start_time = pygame.time.get_ticks()
+                    self.object.start_time = Display.get_ticks()
                     self.object.game_started = True
 
         if event.type == pygame.KEYUP:
@@ -683,25 +749,61 @@ class Start:
         if self.down and self.object.y + Display.spaceship.get_height() <= Display.windows.get_height():
             self.object.y += 5
 
-    def execute(self):
-        while True:
-            self.object.place_enemies()
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    exit()
-                self.controls(event)
-
-            self.movements()
-            self.object.objects()
-            self.object.add_enemies()
-
-            # Check victory and defeat conditions
-            self.object.check_victory()
-            self.object.check_defeat()
-
+    def frame(self, events):
+        self.object.place_enemies()
+        for event in events:
+            if event.type == pygame.QUIT:
+                return None
+            self.controls(event)
+
+        self.movements()
+        self.object.objects()
+        self.object.add_enemies()
+
+        # Check victory and defeat conditions
+        self.object.check_victory()
+        self.object.check_defeat()
+        return self.object.outcome or self
+
+
+class Scenes:
+    """Satu-satunya game loop: menjalankan scene aktif dan pindah ke scene berikutnya.
+
+    Scene lama dilepas saat pindah, jadi restart tidak menumpuk loop baru di
+    call stack dan Objects dari ronde sebelumnya bisa dibuang.
+    """
+
+    def __init__(self, scene: Scene):
+        self.scene = scene
+
+    def step(self, events):
+        self.scene = self.scene.frame(events)
+        return self.scene is not None
+
+    def events(self):
+        scene = self.scene
+        # Layar menu yang sudah tergambar cukup menunggu input, CPU bisa istirahat
+        if scene.wait_ms and scene.drawn is not None:
+            event = pygame.event.wait(scene.wait_ms)
+            if event.type == pygame.NOEVENT:
+                return []
+            return [event] + pygame.event.get()
+        return pygame.event.get()
+
+    def present(self):
+        if self.scene.dirty is None:
             pygame.display.flip()
-            Display.clock.tick(60)
+        elif self.scene.dirty:
+            pygame.display.update(self.scene.dirty)
+            self.scene.dirty = []
+
+    def run(self):
+        while self.step(self.events()):
+            self.present()
+            if self.scene.fps:
+                Display.clock.tick(self.scene.fps)
+        pygame.quit()
 
 
 if __name__ == "__main__":
-    Menu().execute()
+    Scenes(Menu()).run()
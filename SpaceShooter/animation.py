@@ -0,0 +1,93 @@
+# animation.py
+import pygame
+
+
+class Animation:
+    """Frame animasi yang sudah di-convert, dipakai bersama oleh semua instance.
+
+    Semua frame berukuran sama dengan isi di tengah, jadi sprite cukup
+    mengganti image tanpa menghitung ulang rect.
+    """
+
+    def __init__(self, frames, frame_ms: int = 50):
+        self.frames = frames
+        self.frame_ms = frame_ms  # lama tiap frame dalam milidetik
+        self.size = frames[0].get_size()
+
+    def __len__(self):
+        return len(self.frames)
+
+    def __getitem__(self, index):
+        return self.frames[index]
+
+    @property
+    def duration(self):
+        return self.frame_ms * len(self.frames)
+
+    def frame_at(self, elapsed_ms: int):
+        """Frame untuk waktu `elapsed_ms` sejak animasi mulai, None kalau sudah selesai."""
+        index = elapsed_ms // self.frame_ms
+        return self.frames[index] if index < len(self.frames) else None
+
+
+def slice_sheet(sheet: pygame.Surface, frame_size, count: int = None):
+    # Potong sprite sheet baris demi baris, kiri ke kanan
+    width, height = frame_size
+    columns = sheet.get_width() // width
+    rows = sheet.get_height() // height
+    count = columns * rows if count is None else count
+    frames = []
+    for i in range(count):
+        area = pygame.Rect(i % columns * width, i // columns * height, width, height)
+        frames.append(sheet.subsurface(area).convert_alpha())
+    return frames
+
+
+def burst_frames(image: pygame.Surface, count: int = 9, start_scale: float = 0.4,
+                 end_scale: float = 1.3, fade_from: float = 0.5):
+    """Frame ledakan dari satu gambar: membesar dari start_scale ke end_scale,
+    lalu memudar setelah fade_from (0..1) dari panjang animasi."""
+    width, height = image.get_size()
+    canvas = (round(width * max(start_scale, end_scale)), round(height * max(start_scale, end_scale)))
+    image = image.convert_alpha()
+    frames = []
+    for i in range(count):
+        t = i / max(count - 1, 1)
+        scale = start_scale + (end_scale - start_scale) * t
+        scaled = pygame.transform.smoothscale(
+            image, (max(1, round(width * scale)), max(1, round(height * scale)))
+        )
+        frame = pygame.Surface(canvas, pygame.SRCALPHA)
+        frame.blit(scaled, scaled.get_rect(center=(canvas[0] // 2, canvas[1] // 2)))
+        if t > fade_from:
+            # Alpha dikalikan langsung ke piksel, jadi blit tiap frame tetap blit biasa
+            alpha = round(255 * (1 - t) / (1 - fade_from))
+            frame.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+        frames.append(frame.convert_alpha())
+    return frames
+
+
+class AnimationAtlas:
+    """Cache animasi per nama; frame dibuat sekali saat load, bukan per instance."""
+
+    def __init__(self):
+        self.animations = {}
+
+    def get(self, name: str):
+        return self.animations[name]
+
+    def sheet(self, name: str, sheet: pygame.Surface, frame_size, frame_ms: int = 50, count: int = None):
+        if name not in self.animations:
+            self.animations[name] = Animation(slice_sheet(sheet, frame_size, count), frame_ms)
+        return self.animations[name]
+
+    def burst(self, name: str, image: pygame.Surface, frame_ms: int = 50, count: int = 9, **ramp):
+        if name not in self.animations:
+            self.animations[name] = Animation(burst_frames(image, count, **ramp), frame_ms)
+        return self.animations[name]
+
+    def clear(self):
+        self.animations = {}
+
+
+atlas = AnimationAtlas()
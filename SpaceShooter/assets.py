@@ -0,0 +1,145 @@
+# assets.py
+import hashlib
+import mmap
+import os
+import queue
+import struct
+import threading
+
+import pygame
+
+CACHE_DIR = ".asset_cache"
+HEADER = struct.Struct("<II")  # lebar, tinggi
+
+
+class AssetManager:
+    """Memuat gambar sekali, sudah di-scale dan di-convert ke format display.
+
+    Hasil scale disimpan di CACHE_DIR sebagai byte pixel mentah dengan nama
+    dari hash isi file, jadi start berikutnya cukup memetakan (mmap) byte itu
+    kembali ke surface tanpa decode JPEG/PNG dan tanpa transform.scale.
+    File yang isinya berubah otomatis mendapat hash baru.
+    """
+
+    def __init__(self, cache_dir: str = CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.images = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def image(self, path: str, size=None, alpha: bool = False):
+        key = (path, size, alpha)
+        surface = self.images.get(key)
+        if surface is None:
+            surface = self.convert(path, size, alpha, self.load_raw(path, size, alpha))
+        return surface
+
+    def convert(self, path: str, size, alpha: bool, raw: pygame.Surface):
+        # convert() menyamakan format pixel dengan layar supaya blit tidak konversi tiap frame
+        surface = raw.convert_alpha() if alpha else raw.convert()
+        self.images[(path, size, alpha)] = surface
+        return surface
+
+    def cache_path(self, path: str, size, alpha: bool):
+        with open(path, "rb") as file:
+            digest = hashlib.sha1(file.read()).hexdigest()
+        mode = "RGBA" if alpha else "RGB"
+        scale = f"{size[0]}x{size[1]}" if size else "orig"
+        return os.path.join(self.cache_dir, f"{digest}-{scale}-{mode}.raw")
+
+    def load_raw(self, path: str, size, alpha: bool):
+        mode = "RGBA" if alpha else "RGB"
+        cached = self.cache_path(path, size, alpha)
+        if os.path.exists(cached):
+            self.cache_hits += 1
+            return self.read_cache(cached, mode)
+
+        self.cache_misses += 1
+        surface = pygame.image.load(path)
+        if size:
+            surface = pygame.transform.scale(surface, size)
+        self.write_cache(cached, surface, mode)
+        return surface
+
+    def read_cache(self, cached: str, mode: str):
+        with open(cached, "rb") as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        width, height = HEADER.unpack_from(buffer)
+        # Surface ini memakai memori mmap langsung; convert() di image() yang menyalinnya
+        return pygame.image.frombuffer(memoryview(buffer)[HEADER.size:], (width, height), mode)
+
+    def write_cache(self, cached: str, surface: pygame.Surface, mode: str):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temp = cached + ".tmp"
+        with open(temp, "wb") as file:
+            file.write(HEADER.pack(*surface.get_size()))
+            file.write(pygame.image.tobytes(surface, mode))
+        os.replace(temp, cached)
+
+
+class AssetLoader:
+    """Memuat aset di thread terpisah sementara layar menu sudah digambar.
+
+    Thread hanya decode, scale dan membaca file suara; convert() ke format
+    layar tetap dikerjakan di thread utama saat poll() dipanggil. Aset
+    dimuat sesuai urutan didaftarkan.
+    """
+
+    def __init__(self, assets: AssetManager):
+        self.assets = assets
+        self.jobs = []
+        self.results = queue.Queue()
+        self.loaded = {}
+        self.thread = None
+
+    def image(self, name: str, path: str, size=None, alpha: bool = False):
+        self.jobs.append((name, "image", (path, size, alpha)))
+
+    def sound(self, name: str, path: str):
+        self.jobs.append((name, "sound", (path,)))
+
+    def start(self):
+        self.thread = threading.Thread(target=self.work, daemon=True)
+        self.thread.start()
+
+    def work(self):
+        for name, kind, args in self.jobs:
+            try:
+                if kind == "image" and args in self.assets.images:
+                    value = None  # Sudah dimuat langsung di thread utama
+                elif kind == "image":
+                    value = self.assets.load_raw(*args)
+                else:
+                    value = pygame.mixer.Sound(*args)
+            except (pygame.error, OSError) as e:
+                value = e
+            self.results.put((name, kind, args, value))
+
+    def install(self, name, kind, args, value):
+        if isinstance(value, Exception):
+            raise value
+        if kind == "image":
+            value = self.assets.images.get(args) or self.assets.convert(*args, value)
+        self.loaded[name] = value
+
+    def poll(self):
+        """Pasang aset yang sudah selesai dimuat; True kalau semuanya sudah siap."""
+        while True:
+            try:
+                result = self.results.get_nowait()
+            except queue.Empty:
+                break
+            self.install(*result)
+        return self.done
+
+    def wait(self):
+        while not self.done:
+            self.install(*self.results.get())
+
+    @property
+    def done(self):
+        return len(self.loaded) == len(self.jobs)
+
+    @property
+    def progress(self):
+        return len(self.loaded) / len(self.jobs) if self.jobs else 1.0
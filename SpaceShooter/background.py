@@ -0,0 +1,86 @@
+# background.py
+import pygame
+
+
+class ScrollingBackground:
+    """Background bergulir yang berganti gambar dengan crossfade halus.
+
+    Tiap frame cukup satu atau dua blit area dari satu gambar selebar layar
+    (potongan kanan lalu sambungan kirinya), tanpa fill dan tanpa alpha
+    blending per frame. Frame crossfade ke background berikutnya dibuat
+    sebelum transisi dimulai, sepotong (satu pita horizontal) per panggilan
+    draw(), jadi biayanya tersebar di antara pergantian background.
+
+    Tiap gambar campuran adalah surface selayar penuh (6.4 MB pada 1600x1000),
+    jadi fade_steps dijaga kecil: 4 langkah = 25.6 MB, masih lebih kecil dari
+    strip 2x untuk enam background (38.4 MB) yang tidak dibuat.
+    """
+
+    def __init__(self, images, hold: int = 300, fade_frames: int = 30, fade_steps: int = 4, bands: int = 8):
+        self.images = images
+        self.width, self.height = images[0].get_size()
+        self.hold = hold  # frame sebelum crossfade dimulai
+        self.fade_frames = fade_frames  # lama crossfade dalam frame
+        self.fade_steps = fade_steps  # jumlah gambar campuran yang disiapkan
+        self.bands = bands  # jumlah pita per gambar campuran
+        self.index = 0
+        self.timer = 0
+        self.fade = []  # gambar campuran index -> index + 1 yang sudah jadi
+        self.pending = None  # (gambar campuran yang sedang dibuat, pita berikutnya)
+        # Surface untuk gambar campuran dibuat sekali dan dipakai ulang tiap transisi
+        self.buffers = [
+            pygame.Surface((self.width, self.height)).convert() for _ in range(fade_steps)
+        ]
+
+    @property
+    def next_index(self):
+        return (self.index + 1) % len(self.images)
+
+    def prepare_fade(self):
+        # Satu langkah persiapan: campurkan satu pita dari gambar campuran berikutnya
+        if self.pending is None:
+            self.pending = (self.buffers[len(self.fade)], 0)
+        frame, band = self.pending
+        step = len(self.fade) + 1
+        top = self.height * band // self.bands
+        area = pygame.Rect(0, top, self.width, self.height * (band + 1) // self.bands - top)
+
+        current, upcoming = self.images[self.index], self.images[self.next_index]
+        frame.blit(current, area, area)
+        upcoming.set_alpha(round(255 * step / (self.fade_steps + 1)))
+        frame.blit(upcoming, area, area)
+        upcoming.set_alpha(None)
+
+        if band + 1 == self.bands:
+            self.fade.append(frame)
+            self.pending = None
+        else:
+            self.pending = (frame, band + 1)
+
+    def current(self):
+        if self.timer < self.hold:
+            if len(self.fade) < self.fade_steps:
+                self.prepare_fade()
+            return self.images[self.index]
+        # Kalau hold terlalu pendek untuk persiapan bertahap, selesaikan sekarang
+        while len(self.fade) < self.fade_steps:
+            self.prepare_fade()
+        step = (self.timer - self.hold) * self.fade_steps // self.fade_frames
+        return self.fade[step]
+
+    def advance(self):
+        self.timer += 1
+        if self.timer >= self.hold + self.fade_frames:
+            self.index = self.next_index
+            self.timer = 0
+            self.fade = []
+            self.pending = None
+
+    def draw(self, surface: pygame.Surface, offset: int):
+        """Gambar background yang sudah bergeser `offset` piksel ke kiri."""
+        image = self.current()
+        offset %= self.width
+        surface.blit(image, (0, 0), (offset, 0, self.width - offset, self.height))
+        if offset:
+            surface.blit(image, (self.width - offset, 0), (0, 0, offset, self.height))
+        self.advance()
@@ -0,0 +1,98 @@
+# bench_animation.py
+# 200 ledakan serentak: frame dibuat per instance (scale + alpha tiap
+# frame, seperti tanpa atlas) dibanding frame bersama dari AnimationAtlas.
+#
+#   python bench_animation.py [--explosions 200] [--rounds 20]
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from animation import atlas
+
+SIZE = (1600, 1000)
+
+
+class AtlasExplosion(pygame.sprite.Sprite):
+    def __init__(self, x, y, animation):
+        super().__init__()
+        self.animation = animation
+        self.image = animation[0]
+        self.rect = self.image.get_rect(center=(x, y))
+        self.frame = 0
+
+    def update(self):
+        self.frame += 1
+        if self.frame >= len(self.animation):
+            self.kill()
+        else:
+            self.image = self.animation[self.frame]
+
+
+class ScaledExplosion(pygame.sprite.Sprite):
+    # Animasi yang sama, tapi tiap instance membuat surface sendiri per frame
+    def __init__(self, x, y, image, count):
+        super().__init__()
+        self.source = image
+        self.count = count
+        self.center = (x, y)
+        self.frame = 0
+        self.render()
+
+    def render(self):
+        t = self.frame / (self.count - 1)
+        width, height = self.source.get_size()
+        scale = 0.4 + 0.9 * t
+        self.image = pygame.transform.smoothscale(self.source, (round(width * scale), round(height * scale)))
+        if t > 0.5:
+            self.image.set_alpha(round(255 * (1 - t) / 0.5))
+        self.rect = self.image.get_rect(center=self.center)
+
+    def update(self):
+        self.frame += 1
+        if self.frame >= self.count:
+            self.kill()
+        else:
+            self.render()
+
+
+def run(screen, make, explosions, rounds):
+    group = pygame.sprite.Group()
+    frames = 0
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for i in range(explosions):
+            group.add(make(100 + i * 37 % 1400, 100 + i * 53 % 800))
+        while group:
+            group.update()
+            group.draw(screen)
+            frames += 1
+    return (time.perf_counter() - start) / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark animasi ledakan")
+    parser.add_argument("--explosions", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode(SIZE)
+    boom = pygame.transform.scale(pygame.image.load("boom2.png"), (60, 60)).convert_alpha()
+    start = time.perf_counter()
+    animation = atlas.burst("enemy_explosion", boom)
+    print(f"atlas build          {(time.perf_counter() - start) * 1000:6.3f} ms ({len(animation)} frames)")
+
+    for name, make in (
+        ("per-instance frames", lambda x, y: ScaledExplosion(x, y, boom, len(animation))),
+        ("shared atlas", lambda x, y: AtlasExplosion(x, y, animation)),
+    ):
+        mean = run(screen, make, args.explosions, args.rounds)
+        print(f"{name:<20} {mean * 1000:6.3f} ms/frame for {args.explosions} explosions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# bench_assets.py
+# Waktu muat aset SpaceWars5 (tanpa cache, cache dingin, cache hangat) dan
+# waktu blit background per frame sebelum dan sesudah convert().
+#
+#   python bench_assets.py [--frames 300]
+import argparse
+import os
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from assets import AssetManager
+
+SIZE = (1600, 1000)
+BACKGROUNDS = [f"background{i}.jpg" for i in range(6)]
+SPRITES = ["space_ship.png", "enemy-spaceship.png", "enemy-ship.png",
+           "torpedo-left.png", "missile-right.png", "missile-xright.png"]
+
+
+def load_plain():
+    # Cara lama di Display: load + scale, tanpa convert
+    backgrounds = [pygame.transform.scale(pygame.image.load(path), SIZE) for path in BACKGROUNDS]
+    sprites = [pygame.image.load(path) for path in SPRITES]
+    return backgrounds, sprites
+
+
+def load_managed(cache_dir):
+    assets = AssetManager(cache_dir)
+    backgrounds = [assets.image(path, SIZE) for path in BACKGROUNDS]
+    sprites = [assets.image(path, alpha=True) for path in SPRITES]
+    return backgrounds, sprites
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def blit_time(screen, backgrounds, frames):
+    # Seperti Objects.background(): dua background penuh layar per frame
+    start = time.perf_counter()
+    for frame in range(frames):
+        image = backgrounds[(frame // 300) % len(backgrounds)]
+        offset = -(frame * 2) % SIZE[0]
+        screen.blit(image, (offset, 0))
+        screen.blit(image, (offset - SIZE[0], 0))
+    return (time.perf_counter() - start) / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pipeline aset SpaceWars5")
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode(SIZE)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        plain_time, (plain_backgrounds, _) = timed(load_plain)
+        cold_time, _ = timed(load_managed, cache_dir)
+        warm_time, (converted_backgrounds, _) = timed(load_managed, cache_dir)
+
+    print(f"startup  plain load+scale: {plain_time * 1000:8.1f} ms")
+    print(f"startup  cache cold:       {cold_time * 1000:8.1f} ms")
+    print(f"startup  cache warm:       {warm_time * 1000:8.1f} ms")
+
+    before = blit_time(screen, plain_backgrounds, args.frames)
+    after = blit_time(screen, converted_backgrounds, args.frames)
+    print(f"blit/frame  before convert: {before * 1000:6.3f} ms")
+    print(f"blit/frame  after convert:  {after * 1000:6.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# bench_background.py
+# Biaya background per frame pada 1600x1000: cara lama Objects.background()
+# (fill hitam + dua blit penuh) dibanding ScrollingBackground dengan crossfade.
+#
+#   python bench_background.py [--frames 1800]
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from assets import AssetManager
+from background import ScrollingBackground
+
+SIZE = (1600, 1000)
+
+
+def old_background(screen, backgrounds, frames):
+    background_list = [[0, 0], [SIZE[0], 0]]
+    index = timer = 0
+    worst = 0.0
+    start = time.perf_counter()
+    for _ in range(frames):
+        frame_start = time.perf_counter()
+        screen.fill((0, 0, 0))
+        timer += 1
+        if timer >= 300:
+            index = (index + 1) % len(backgrounds)
+            timer = 0
+        for location in background_list:
+            screen.blit(backgrounds[index], location)
+            location[0] -= 2
+            if location[0] + SIZE[0] <= 0:
+                location[0] = background_list[(background_list.index(location) + 1) % 2][0] + SIZE[0]
+        worst = max(worst, time.perf_counter() - frame_start)
+    return (time.perf_counter() - start) / frames, worst
+
+
+def new_background(screen, backgrounds, frames):
+    scenery = ScrollingBackground(backgrounds)
+    offset = 0
+    worst = 0.0
+    start = time.perf_counter()
+    for _ in range(frames):
+        frame_start = time.perf_counter()
+        scenery.draw(screen, offset)
+        offset = (offset + 2) % SIZE[0]
+        worst = max(worst, time.perf_counter() - frame_start)
+    return (time.perf_counter() - start) / frames, worst
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark background SpaceWars5")
+    parser.add_argument("--frames", type=int, default=1800)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode(SIZE)
+    assets = AssetManager()
+    backgrounds = [assets.image(f"background{i}.jpg", SIZE) for i in range(6)]
+
+    for name, bench in (("old fill + 2 blits", old_background), ("scrolling + crossfade", new_background)):
+        mean, worst = bench(screen, backgrounds, args.frames)
+        print(f"{name:<22} mean {mean * 1000:6.3f} ms/frame  worst {worst * 1000:6.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
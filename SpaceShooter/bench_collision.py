@@ -0,0 +1,148 @@
+# bench_collision.py
+# Membandingkan tes tabrakan laser pada jumlah entitas 1x, 10x dan 100x:
+#   per-rect  loop asli SpaceWars: satu pygame.Rect + colliderect per musuh/proyektil
+#   vektor    semua proyektil di pool dites sekaligus dengan NumPy
+#   grid      hanya kandidat dari grid SpatialHash yang dites
+# Hasil tabrakan ketiganya harus sama.
+#
+#   python bench_collision.py [--ticks 120] [--seed 1]
+import argparse
+import random
+import time
+
+import pygame
+
+from projectiles import ProjectilePool
+from spatial_hash import SpatialHash
+
+WIDTH, HEIGHT = 1600, 1000
+BASE_LASERS = 10
+BASE_ENEMIES = 10
+BASE_PROJECTILES = 20
+
+
+class Enemy:
+    def __init__(self, id, x, y, size):
+        self.id = id
+        self.x = x
+        self.y = y
+        self.size = size
+
+    def collision_box(self):
+        return pygame.Rect((self.x, self.y), self.size)
+
+
+def laser_rect(laser, laser_size):
+    # Sama seperti Objects.fire_laser: kotak laser dipotong 15 px atas-bawah
+    return pygame.Rect((laser[0], laser[1] + 15), (laser_size[0], laser_size[1] - 30))
+
+
+def per_rect(rect, enemies, projectiles, projectile_sizes):
+    # Seperti laser_collision asli: Rect baru untuk tiap peluru/misil
+    enemy_hits = [e.id for e in enemies if rect.colliderect(e.collision_box())]
+    projectile_hits = [i for i, x, y, kind in projectiles
+                       if rect.colliderect(pygame.Rect((x, y), projectile_sizes[kind]))]
+    return enemy_hits, projectile_hits
+
+
+def vectorized(rect, enemies, pool):
+    enemy_hits = [e.id for e in enemies if rect.colliderect(e.collision_box())]
+    projectile_hits = pool.collide_rect(rect, pool.live()).tolist()
+    return enemy_hits, projectile_hits
+
+
+def broadphase(rect, grid, pool):
+    candidates = sorted(grid.query(rect), key=lambda e: e.id)
+    enemy_hits = [e.id for e in candidates if rect.colliderect(e.collision_box())]
+    projectile_hits = pool.collide_rect(rect).tolist()
+    return enemy_hits, projectile_hits
+
+
+def run(scale, ticks, seed, sizes):
+    rng = random.Random(seed)
+    enemy_size, laser_size, projectile_sizes = sizes
+    cell = max(*enemy_size, *laser_size)
+
+    enemies = [
+        Enemy(i, rng.randint(WIDTH // 2, WIDTH - enemy_size[0]), rng.randint(0, HEIGHT - enemy_size[1]), enemy_size)
+        for i in range(BASE_ENEMIES * scale)
+    ]
+    lasers = [[rng.randint(0, WIDTH), rng.randint(0, HEIGHT)] for _ in range(BASE_LASERS * scale)]
+    pool = ProjectilePool(WIDTH, HEIGHT, projectile_sizes, cell_size=cell)
+    for _ in range(BASE_PROJECTILES * scale):
+        pool.spawn(rng.uniform(0, WIDTH), rng.uniform(0, HEIGHT), rng.uniform(-5, 0), rng.uniform(-2, 2),
+                   rng.randint(0, 1), 0)
+    grid = SpatialHash(cell)
+
+    rect_time = vector_time = grid_time = 0.0
+    total_hits = 0
+    for _ in range(ticks):
+        # Bagian "rebuild incremental" ikut dihitung sebagai biaya grid
+        start = time.perf_counter()
+        for enemy in enemies:
+            grid.update(enemy, enemy.collision_box())
+        pool.sync_grid(pool.live())
+        grid_time += time.perf_counter() - start
+
+        rects = [laser_rect(laser, laser_size) for laser in lasers]
+        # Daftar proyektil gaya lama (list of dict di game asli) tidak ikut dihitung
+        live = pool.live()
+        projectiles = list(zip(live.tolist(), pool.x[live].tolist(), pool.y[live].tolist(), pool.kind[live].tolist()))
+
+        start = time.perf_counter()
+        expected = [per_rect(rect, enemies, projectiles, projectile_sizes) for rect in rects]
+        rect_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        vector = [vectorized(rect, enemies, pool) for rect in rects]
+        vector_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        found = [broadphase(rect, grid, pool) for rect in rects]
+        grid_time += time.perf_counter() - start
+
+        assert vector == expected, "tes vektor tidak sama dengan per-rect"
+        assert found == expected, "broadphase tidak sama dengan per-rect"
+        total_hits += sum(len(e) + len(p) for e, p in found)
+
+        # Gerakkan semuanya; laser keluar layar muncul lagi di kiri
+        for laser in lasers:
+            laser[0] = laser[0] + 5 if laser[0] < WIDTH else 0
+        for enemy in enemies:
+            enemy.x = enemy.x - 2 if enemy.x > 0 else WIDTH - enemy_size[0]
+        pool.x[:pool.top] += pool.vx[:pool.top]
+        pool.y[:pool.top] += pool.vy[:pool.top]
+        pool.x[:pool.top] %= WIDTH
+        pool.y[:pool.top] %= HEIGHT
+
+    return rect_time, vector_time, grid_time, total_hits
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark broadphase tabrakan laser SpaceWars")
+    parser.add_argument("--ticks", type=int, default=120)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    enemy_size = pygame.image.load("enemy-spaceship.png").get_size()
+    laser_size = pygame.image.load("torpedo-left.png").get_size()
+    projectile_sizes = [
+        pygame.image.load("missile-right.png").get_size(),
+        pygame.image.load("missile-xright.png").get_size(),
+    ]
+    sizes = (enemy_size, laser_size, projectile_sizes)
+
+    print(f"{'scale':>5} {'lasers':>7} {'enemies':>8} {'proj':>6} {'rect ms':>9} {'vector ms':>10} {'grid ms':>9} "
+          f"{'vector':>7} {'grid':>7} {'hits':>7}")
+    for scale in (1, 10, 100):
+        rect, vector, grid, hits = run(scale, args.ticks, args.seed, sizes)
+        rect_ms = rect / args.ticks * 1000
+        vector_ms = vector / args.ticks * 1000
+        grid_ms = grid / args.ticks * 1000
+        print(f"{scale:>4}x {BASE_LASERS * scale:>7} {BASE_ENEMIES * scale:>8} {BASE_PROJECTILES * scale:>6} "
+              f"{rect_ms:>9.3f} {vector_ms:>10.3f} {grid_ms:>9.3f} "
+              f"{rect_ms / vector_ms:>6.1f}x {rect_ms / grid_ms:>6.1f}x {hits:>7}")
+
+
+if __name__ == "__main__":
+    main()
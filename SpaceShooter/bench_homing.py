@@ -0,0 +1,100 @@
+# bench_homing.py
+# Misil pengejar space_impact4: update() per sprite (math.sqrt per misil)
+# dibanding HomingSwarm yang menggerakkan semua misil dalam satu langkah NumPy.
+#
+#   python bench_homing.py [--missiles 5000] [--frames 300] [--turn-rate 0.05]
+import argparse
+import math
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from homing import HomingSwarm
+
+SIZE = (1600, 1000)
+MISSILE_SIZE = (25, 15)
+BUDGET_MS = 1000 / 60
+
+
+class Target(pygame.sprite.Sprite):
+    def __init__(self):
+        super().__init__()
+        self.rect = pygame.Rect(50, SIZE[1] // 2, 60, 40)
+
+
+class OldMissile(pygame.sprite.Sprite):
+    # Salinan HomingMissile.update() sebelum HomingSwarm
+    def __init__(self, x, y, player):
+        super().__init__()
+        self.rect = pygame.Rect(x, y, *MISSILE_SIZE)
+        self.speed = 5
+        self.player = player
+
+    def update(self):
+        target_x = self.player.rect.centerx
+        target_y = self.player.rect.centery
+        dx = target_x - self.rect.centerx
+        dy = target_y - self.rect.centery
+        distance = max(1, math.sqrt(dx ** 2 + dy ** 2))
+        dx = dx / distance
+        dy = dy / distance
+        self.rect.x -= self.speed * 0.8
+        self.rect.x += dx * self.speed * 0.2
+        self.rect.y += dy * self.speed * 0.5
+
+
+class SwarmMissile(pygame.sprite.Sprite):
+    def __init__(self):
+        super().__init__()
+        self.rect = pygame.Rect(0, 0, *MISSILE_SIZE)
+
+
+def positions(count):
+    rng = random.Random(1)
+    return [(rng.randint(SIZE[0], SIZE[0] * 4), rng.randint(0, SIZE[1])) for _ in range(count)]
+
+
+def bench_old(count, frames):
+    player = Target()
+    group = pygame.sprite.Group(OldMissile(x, y, player) for x, y in positions(count))
+    start = time.perf_counter()
+    for _ in range(frames):
+        group.update()
+    return (time.perf_counter() - start) / frames
+
+
+def bench_swarm(count, frames, turn_rate, with_sprites):
+    player = Target()
+    swarm = HomingSwarm(MISSILE_SIZE, capacity=count, turn_rate=turn_rate)
+    for x, y in positions(count):
+        swarm.spawn(x, y, SwarmMissile() if with_sprites else None)
+    start = time.perf_counter()
+    for _ in range(frames):
+        swarm.step(player.rect.center)
+    return (time.perf_counter() - start) / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark misil pengejar")
+    parser.add_argument("--missiles", type=int, default=5000)
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--turn-rate", type=float, default=0.05)
+    args = parser.parse_args()
+
+    results = (
+        ("sprite update()", bench_old(args.missiles, args.frames)),
+        ("swarm, arrays only", bench_swarm(args.missiles, args.frames, None, False)),
+        ("swarm + rect sync", bench_swarm(args.missiles, args.frames, None, True)),
+        ("swarm + turn limit", bench_swarm(args.missiles, args.frames, args.turn_rate, True)),
+    )
+    for name, mean in results:
+        print(f"{name:<20} {mean * 1000:7.3f} ms/frame ({mean * 1000 / BUDGET_MS:5.1%} of a 60 FPS frame)"
+              f" for {args.missiles} missiles")
+
+
+if __name__ == "__main__":
+    main()
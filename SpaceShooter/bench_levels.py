@@ -0,0 +1,61 @@
+# bench_levels.py
+# Level panjang (default 100000 spawn) untuk loader SpaceImpact5: waktu
+# parse, ukuran array event, biaya due() per frame dan jumlah musuh yang
+# hidup bersamaan (dibatasi musuh di layar, bukan panjang level).
+#
+#   python bench_levels.py [--spawns 100000] [--every 20]
+import argparse
+import json
+import os
+import tempfile
+import time
+from collections import deque
+
+from levels import LevelStream, load_levels
+
+FRAME_MS = 1000 / 60
+SCREEN_MS = 1600 / 3 * FRAME_MS  # lama musuh kecepatan 3 melintasi layar 1600 px
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark loader level SpaceImpact5")
+    parser.add_argument("--spawns", type=int, default=100000)
+    parser.add_argument("--every", type=int, default=20, help="ms antar spawn")
+    args = parser.parse_args()
+
+    types = ["spaceship", "missile_craft", "asteroid"]
+    waves = [{"type": types[i % 3], "count": 100, "every": args.every} for i in range(args.spawns // 100)]
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as file:
+        json.dump({"enemy_types": types, "levels": [{"spawns": waves}]}, file)
+    try:
+        start = time.perf_counter()
+        _, levels = load_levels(file.name)
+        parse = time.perf_counter() - start
+    finally:
+        os.remove(file.name)
+    events = levels[0]
+    print(f"parse       {parse * 1000:8.1f} ms for {len(events)} spawns, "
+          f"{events.nbytes / 1024:.0f} KiB of events")
+
+    # Musuh hanya berupa waktu keluar layar; yang dihitung adalah berapa yang hidup sekaligus
+    stream = LevelStream(events, 0)
+    alive = deque()  # waktu keluar layar, terurut karena kecepatannya sama
+    peak = 0
+    frames = 0
+    now = 0.0
+    start = time.perf_counter()
+    while not stream.done or alive:
+        now += FRAME_MS
+        frames += 1
+        for _ in stream.due(int(now)):
+            alive.append(now + SCREEN_MS)
+        while alive and alive[0] <= now:
+            alive.popleft()
+        peak = max(peak, len(alive))
+    elapsed = time.perf_counter() - start
+    print(f"play        {elapsed / frames * 1e6:8.2f} us/frame over {frames} frames, "
+          f"peak {peak} enemies alive")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# bench_sprite_pool.py
+# Sesi auto-fire 10 menit (36000 tick pada 60 FPS) ala space_impact4:
+# sprite baru + kill() tiap tembakan dibanding SpritePool.
+# Dilaporkan jumlah sprite yang dibuat, jumlah dan lama pause GC.
+#
+#   python bench_sprite_pool.py [--minutes 10] [--shots-per-tick 3]
+import argparse
+import gc
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from sprite_pool import PooledSprite, SpritePool
+
+WIDTH_SCREEN = 1600
+FPS = 60
+IMAGE = pygame.Surface((20, 10))
+
+
+class Bullet(pygame.sprite.Sprite):
+    # Sama seperti PlayerBullet sebelum memakai pool
+    created = 0
+
+    def __init__(self, x, y):
+        super().__init__()
+        Bullet.created += 1
+        self.image = IMAGE
+        self.rect = self.image.get_rect()
+        self.rect.x = x
+        self.rect.y = y
+        self.speed = 10
+
+    def update(self):
+        self.rect.x += self.speed
+        if self.rect.left > WIDTH_SCREEN:
+            self.kill()
+
+
+class PooledBullet(PooledSprite):
+    def __init__(self, x, y):
+        super().__init__()
+        self.image = IMAGE
+        self.rect = self.image.get_rect()
+        self.speed = 10
+        self.reset(x, y)
+
+    def reset(self, x, y):
+        self.rect.x = x
+        self.rect.y = y
+
+    def update(self):
+        if not self.active:
+            return
+        self.rect.x += self.speed
+        if self.rect.left > WIDTH_SCREEN:
+            self.kill()
+
+
+class GCTimer:
+    def __init__(self):
+        self.pauses = []
+        self.start = 0
+
+    def __call__(self, phase, info):
+        if phase == "start":
+            self.start = time.perf_counter()
+        else:
+            self.pauses.append(time.perf_counter() - self.start)
+
+
+def session(ticks, shots_per_tick, pooled):
+    all_sprites = pygame.sprite.Group()
+    bullets = pygame.sprite.Group()
+    pool = SpritePool(PooledBullet, all_sprites, bullets)
+    Bullet.created = 0
+
+    timer = GCTimer()
+    gc.collect()
+    gc.callbacks.append(timer)
+    start = time.perf_counter()
+    try:
+        for tick in range(ticks):
+            for shot in range(shots_per_tick):
+                y = (tick * 7 + shot * 97) % 1000
+                if pooled:
+                    pool.acquire(50, y)
+                else:
+                    bullet = Bullet(50, y)
+                    all_sprites.add(bullet)
+                    bullets.add(bullet)
+            all_sprites.update()
+    finally:
+        gc.callbacks.remove(timer)
+    elapsed = time.perf_counter() - start
+    created = pool.created if pooled else Bullet.created
+    return elapsed, created, timer.pauses, pool.stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark SpritePool space_impact4")
+    parser.add_argument("--minutes", type=float, default=10)
+    parser.add_argument("--shots-per-tick", type=int, default=3)
+    args = parser.parse_args()
+
+    ticks = int(args.minutes * 60 * FPS)
+    for name, pooled in (("new sprite + kill()", False), ("SpritePool", True)):
+        elapsed, created, pauses, stats = session(ticks, args.shots_per_tick, pooled)
+        print(f"{name:<20} {elapsed:6.2f}s  sprites created {created:>7}  "
+              f"gc runs {len(pauses):>5}  gc total {sum(pauses) * 1000:7.1f} ms  "
+              f"max pause {max(pauses, default=0) * 1000:5.2f} ms")
+        if pooled:
+            print(f"{'':<20} pool: {stats}")
+
+
+if __name__ == "__main__":
+    main()
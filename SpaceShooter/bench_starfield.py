@@ -0,0 +1,76 @@
+# bench_starfield.py
+# Background cadangan space_impact4 saat background{i}.jpg tidak ada:
+# 50 pygame.draw.circle tiap start dibanding StarfieldGenerator (pertama kali
+# dibuat, lalu dibaca dari cache disk), plus biaya gambar parallax per frame.
+#
+#   python bench_starfield.py [--backgrounds 6] [--frames 600]
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from assets import AssetManager
+from starfield import StarfieldGenerator
+
+SIZE = (1600, 1000)
+
+
+def old_fallback(count):
+    backgrounds = []
+    for _ in range(count):
+        bg = pygame.Surface(SIZE)
+        bg.fill((0, 0, 0))
+        for _ in range(50):
+            x = random.randint(0, SIZE[0])
+            y = random.randint(0, SIZE[1])
+            radius = random.randint(1, 3)
+            pygame.draw.circle(bg, (255, 255, 255), (x, y), radius)
+        backgrounds.append(bg)
+    return backgrounds
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark starfield prosedural")
+    parser.add_argument("--backgrounds", type=int, default=6)
+    parser.add_argument("--frames", type=int, default=600)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode(SIZE)
+    cache_dir = tempfile.mkdtemp(prefix="starfield-")
+    try:
+        def load(generator):
+            return [generator.background(seed, SIZE) for seed in range(args.backgrounds)]
+
+        old, _ = timed(old_fallback, args.backgrounds)
+        cold_generator = StarfieldGenerator(AssetManager(cache_dir))
+        cold, _ = timed(load, cold_generator)
+        warm_generator = StarfieldGenerator(AssetManager(cache_dir))
+        warm, backgrounds = timed(load, warm_generator)
+        print(f"old 50 circles       {old * 1000:8.1f} ms for {args.backgrounds} backgrounds (1 layer)")
+        print(f"starfield, generate  {cold * 1000:8.1f} ms ({cold_generator.generated} layers generated)")
+        print(f"starfield, cache     {warm * 1000:8.1f} ms ({warm_generator.cache_hits} layers read)")
+
+        start = time.perf_counter()
+        for frame in range(args.frames):
+            backgrounds[0].draw(screen, frame * 2)
+        mean = (time.perf_counter() - start) / args.frames
+        print(f"parallax draw        {mean * 1000:8.3f} ms/frame ({len(backgrounds[0].layers)} layers)")
+    finally:
+        shutil.rmtree(cache_dir)
+
+
+if __name__ == "__main__":
+    main()
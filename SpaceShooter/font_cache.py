@@ -0,0 +1,86 @@
+# font_cache.py
+from collections import OrderedDict
+
+import pygame
+
+FONT_PATH = "SHPinscher-Regular.otf"
+
+
+class FontRegistry:
+    """Satu objek pygame.font.Font per (path, size), dimuat sekali dari disk."""
+
+    def __init__(self):
+        self.fonts = {}
+        self.loads = 0
+
+    def get(self, size: int, path: str = FONT_PATH):
+        key = (path, size)
+        font = self.fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(path, size)
+            self.fonts[key] = font
+            self.loads += 1
+        return font
+
+
+class TextCache:
+    """LRU cache surface hasil render, key (text, size, color, antialias).
+
+    Ukuran cache dibatasi dengan byte_budget (perkiraan byte pixel tiap surface).
+    """
+
+    def __init__(self, fonts: FontRegistry, byte_budget: int = 8 * 1024 * 1024):
+        self.fonts = fonts
+        self.byte_budget = byte_budget
+        self.entries = OrderedDict()
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, text: str, size: int, color, antialias: bool = True, path: str = FONT_PATH):
+        key = (text, size, tuple(color), antialias, path)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self.fonts.get(size, path).render(text, antialias, color)
+        self.entries[key] = surface
+        self.bytes_used += self.surface_bytes(surface)
+        self.evict()
+        return surface
+
+    def evict(self):
+        # Buang entry paling lama dipakai sampai kembali di bawah budget,
+        # tapi selalu sisakan entry terbaru supaya render tetap bisa dipakai
+        while self.bytes_used > self.byte_budget and len(self.entries) > 1:
+            _, old = self.entries.popitem(last=False)
+            self.bytes_used -= self.surface_bytes(old)
+
+    def set_budget(self, byte_budget: int):
+        self.byte_budget = byte_budget
+        self.evict()
+
+    def clear(self):
+        self.entries.clear()
+        self.bytes_used = 0
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self.entries),
+            "bytes": self.bytes_used,
+            "font_loads": self.fonts.loads,
+        }
+
+    @staticmethod
+    def surface_bytes(surface: pygame.Surface):
+        return surface.get_pitch() * surface.get_height()
+
+
+# Dipakai bersama oleh semua class layar (Menu, GameOver, Victory, HUD)
+fonts = FontRegistry()
+text_cache = TextCache(fonts)
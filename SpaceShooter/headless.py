@@ -0,0 +1,190 @@
+# headless.py
+# Menjalankan logika SpaceWars5 tanpa jendela, tanpa suara dan tanpa batas FPS
+# untuk mengukur seberapa cepat game loop berjalan.
+#
+#   python headless.py [--ticks 3600] [--seed 1] [--script scripted_input.txt]
+#   python headless.py --restarts 10000
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+# Driver SDL dummy harus dipasang sebelum pygame membuka display / mixer
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+import SpaceWars5 as game
+from profiler import profiler
+
+STEP_MS = 1000 / 60  # Satu tick simulasi = satu frame pada 60 FPS
+# Batas pertumbuhan memori setelah warmup di restart_check (test_headless.py)
+MAX_RESTART_GROWTH = 1024 * 1024
+
+# Pola input bawaan: naik-turun terus, seperti pemain yang menghindar
+DEFAULT_SCRIPT = [
+    (0, pygame.KEYDOWN, pygame.K_w),
+    (40, pygame.KEYUP, pygame.K_w),
+    (40, pygame.KEYDOWN, pygame.K_s),
+    (120, pygame.KEYUP, pygame.K_s),
+    (120, pygame.KEYDOWN, pygame.K_w),
+    (160, pygame.KEYUP, pygame.K_w),
+]
+DEFAULT_PERIOD = 160
+
+
+class ScriptedInput:
+    """Daftar event keyboard (tick, tipe, key) yang diulang setiap `period` tick."""
+
+    def __init__(self, script, period: int = 0):
+        self.period = period
+        self.by_tick = {}
+        for tick, event_type, key in script:
+            self.by_tick.setdefault(tick, []).append(pygame.event.Event(event_type, key=key))
+
+    @classmethod
+    def load(cls, path: str):
+        # Format file: baris "tick down|up w|s", baris "period N" untuk pengulangan
+        script, period = [], 0
+        with open(path) as file:
+            for line in file:
+                parts = line.split()
+                if not parts or parts[0].startswith("#"):
+                    continue
+                if parts[0] == "period":
+                    period = int(parts[1])
+                    continue
+                event_type = pygame.KEYDOWN if parts[1] == "down" else pygame.KEYUP
+                script.append((int(parts[0]), event_type, pygame.key.key_code(parts[2])))
+        return cls(script, period)
+
+    def events(self, tick: int):
+        if self.period:
+            tick %= self.period
+        return self.by_tick.get(tick, [])
+
+
+class Simulation:
+    PHASES = ["place_enemies", "controls", "movements", "objects", "add_enemies", "check_victory", "check_defeat"]
+
+    def __init__(self, seed: int, inputs: ScriptedInput):
+        self.seed = seed
+        self.inputs = inputs
+        self.now = 0.0
+        self.phase_time = dict.fromkeys(self.PHASES, 0.0)
+        self.victories = 0
+        self.defeats = 0
+        game.Display.wait()
+        random.seed(seed)
+        # Jam game mengikuti tick simulasi, bukan jam dinding
+        game.Display.get_ticks = lambda: int(self.now)
+        self.start = game.Start()
+
+    def timed(self, phase: str, function, *args):
+        start = time.perf_counter()
+        function(*args)
+        self.phase_time[phase] += time.perf_counter() - start
+
+    def tick(self, tick: int):
+        start = self.start
+        self.timed("place_enemies", start.object.place_enemies)
+        for event in self.inputs.events(tick):
+            self.timed("controls", start.controls, event)
+        self.timed("movements", start.movements)
+        self.timed("objects", start.object.objects)
+        self.timed("add_enemies", start.object.add_enemies)
+        self.timed("check_victory", start.object.check_victory)
+        self.timed("check_defeat", start.object.check_defeat)
+
+        outcome = start.object.outcome
+        if outcome is not None:
+            if isinstance(outcome, game.Victory):
+                self.victories += 1
+            else:
+                self.defeats += 1
+            # Ganti layar akhir dengan ronde baru supaya simulasi terus berjalan
+            self.start = game.Start()
+        self.now += STEP_MS
+
+    def run(self, ticks: int):
+        start = time.perf_counter()
+        for tick in range(ticks):
+            self.tick(tick)
+        return time.perf_counter() - start
+
+
+def restart_check(restarts: int, seed: int, warmup: int = 100):
+    """Restart berulang lewat Scenes.
+
+    Mengembalikan (scene terakhir, jumlah Objects yang masih hidup,
+    pertumbuhan memori dalam byte sejak warmup). Keduanya harus tetap datar;
+    test_headless.py memeriksanya.
+    """
+    game.Display.wait()
+    random.seed(seed)
+    game.Display.get_ticks = lambda: 0
+    scenes = game.Scenes(game.Menu())
+    enter = [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN)]
+
+    tracemalloc.start()
+    baseline = None
+    for restart in range(restarts):
+        scenes.step(enter)  # Menu / GameOver -> Start
+        scenes.scene.object.health = 0  # Kalah di frame berikutnya
+        scenes.step([])  # Start -> GameOver
+        if restart == warmup:
+            gc.collect()
+            baseline = tracemalloc.get_traced_memory()[0]
+    gc.collect()
+    final = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    rounds = sum(isinstance(obj, game.Objects) for obj in gc.get_objects())
+    growth = final - (baseline or final)
+    return scenes.scene, rounds, growth
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulasi headless SpaceWars5 tanpa batas FPS")
+    parser.add_argument("--ticks", type=int, default=3600)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--script", help="file input terjadwal (default: pola naik-turun)")
+    parser.add_argument("--restarts", type=int, help="cek memori setelah N kali restart lewat Scenes")
+    parser.add_argument("--profile", metavar="TRACE", help="profil fase Objects.objects() dan simpan Chrome trace")
+    args = parser.parse_args()
+
+    if args.profile:
+        profiler.enable(args.profile)
+
+    if args.restarts:
+        scene, rounds, growth = restart_check(args.restarts, args.seed)
+        print(f"restarts: {args.restarts}  scene: {type(scene).__name__}  live Objects: {rounds}  "
+              f"memory growth after warmup: {growth / 1024:.1f} KiB")
+        sys.exit(0 if rounds == 0 and growth < MAX_RESTART_GROWTH else 1)
+
+    if args.script:
+        inputs = ScriptedInput.load(args.script)
+    else:
+        inputs = ScriptedInput(DEFAULT_SCRIPT, DEFAULT_PERIOD)
+
+    simulation = Simulation(args.seed, inputs)
+    elapsed = simulation.run(args.ticks)
+
+    print(f"ticks: {args.ticks}  seed: {args.seed}  wall: {elapsed:.3f}s  "
+          f"ticks/s: {args.ticks / elapsed:.1f}")
+    print(f"victories: {simulation.victories}  defeats: {simulation.defeats}  "
+          f"score: {simulation.start.object.score}  health: {simulation.start.object.health}")
+    for phase in Simulation.PHASES:
+        total = simulation.phase_time[phase]
+        print(f"  {phase:<14} {total * 1000:>9.1f} ms  {total / args.ticks * 1e6:>8.1f} us/tick  "
+              f"{total / elapsed * 100:>5.1f}%")
+    for name, (p50, p95, p99) in profiler.report().items():
+        print(f"    objects.{name:<14} p50 {p50:.3f}  p95 {p95:.3f}  p99 {p99:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
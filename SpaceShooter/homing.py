@@ -0,0 +1,98 @@
+# homing.py
+import numpy as np
+
+from pool import Column, SlotPool
+
+
+class HomingSwarm(SlotPool):
+    """Semua misil pengejar dalam array NumPy, digerakkan sekaligus di step().
+
+    Model kemudi: tiap frame misil bergerak ke kiri sebesar speed * left_bias,
+    ditambah arah ke target (sudah dinormalisasi) dikali speed * pursuit_x dan
+    speed * pursuit_y; tanpa target misil lurus ke kiri sebesar speed. Kalau
+    turn_rate diisi (radian per frame), arah gerak hanya boleh berbelok
+    sebesar itu menuju arah yang diinginkan.
+
+    Sprite (opsional) hanya dipakai untuk gambar dan tabrakan: rect-nya
+    disalin dari array sekali per step(), bukan dihitung oleh sprite sendiri.
+    """
+
+    COLUMNS = {
+        "x": Column(np.float64),
+        "y": Column(np.float64),
+        "vx": Column(np.float64),
+        "vy": Column(np.float64),
+    }
+    SPRITES = True
+
+    def __init__(self, size, capacity: int = 256, speed: float = 5, left_bias: float = 0.8,
+                 pursuit_x: float = 0.2, pursuit_y: float = 0.5, turn_rate: float = None):
+        self.width, self.height = size  # ukuran misil, untuk culling di kiri layar
+        self.speed = speed
+        self.left_bias = left_bias
+        self.pursuit_x = pursuit_x
+        self.pursuit_y = pursuit_y
+        self.turn_rate = turn_rate
+        self.allocate(capacity)
+
+    def spawn(self, x, y, sprite=None):
+        i = self.take(sprite)
+        self.x[i] = x
+        self.y[i] = y
+        # Arah awal: lurus ke kiri
+        self.vx[i] = -self.speed
+        self.vy[i] = 0
+        return i
+
+    def kill(self, i: int):
+        self.release(i)
+
+    def steer(self, live, target):
+        # Kecepatan yang diinginkan untuk semua misil hidup; tanpa target
+        # misil terbang lurus ke kiri dengan kecepatan penuh
+        vx = np.full(len(live), -float(self.speed))
+        vy = np.zeros(len(live))
+        if target is not None:
+            vx *= self.left_bias
+            dx = target[0] - (self.x[live] + self.width / 2)
+            dy = target[1] - (self.y[live] + self.height / 2)
+            distance = np.maximum(1, np.hypot(dx, dy))
+            vx += dx / distance * self.speed * self.pursuit_x
+            vy += dy / distance * self.speed * self.pursuit_y
+        if self.turn_rate is None:
+            return vx, vy
+
+        # Batasi belokan: putar arah lama menuju arah baru paling banyak turn_rate
+        heading = np.arctan2(self.vy[live], self.vx[live])
+        turn = (np.arctan2(vy, vx) - heading + np.pi) % (2 * np.pi) - np.pi
+        heading += np.clip(turn, -self.turn_rate, self.turn_rate)
+        speed = np.hypot(vx, vy)
+        return np.cos(heading) * speed, np.sin(heading) * speed
+
+    def step(self, target=None):
+        """Gerakkan semua misil ke arah target (titik pusat, atau None) dan
+        sinkronkan rect sprite. Mengembalikan sprite yang keluar di kiri layar."""
+        live = self.live()
+        if len(live) == 0:
+            return []
+        vx, vy = self.steer(live, target)
+        self.vx[live] = vx
+        self.vy[live] = vy
+        self.x[live] += vx
+        self.y[live] += vy
+
+        sprites = self.sprites
+        for i, x, y in zip(live.tolist(), self.x[live].astype(np.int64).tolist(),
+                           self.y[live].astype(np.int64).tolist()):
+            sprite = sprites[i]
+            if sprite is not None:
+                sprite.rect.topleft = (x, y)
+
+        gone = []
+        for i in live[self.x[live] + self.width < 0].tolist():
+            if sprites[i] is None:
+                self.kill(i)
+            else:
+                # kill() milik sprite yang melepas slot-nya di sini
+                gone.append(sprites[i])
+        return gone
@@ -0,0 +1,83 @@
+# levels.py
+import json
+
+import numpy as np
+
+# Satu event spawn: waktu (ms sejak level mulai), tipe musuh, posisi y (-1 = acak),
+# pola gerak (indeks di daftar pola, -1 = gerak bawaan tipe) dan fase pola
+EVENT = np.dtype([("time", "<i4"), ("type", "u1"), ("y", "<i2"), ("pattern", "i1"), ("phase", "<i2")])
+RANDOM_Y = -1
+NO_PATTERN = -1
+
+
+def parse_level(level, enemy_types, patterns=()):
+    """Ubah deskripsi level jadi array event yang terurut waktu.
+
+    "spawns" berisi gelombang {"type", "count", "every", "y"?, "at"?,
+    "pattern"?, "phase"?}; "pattern" adalah nama pola di patterns (daftar
+    nama dari patterns5.json), tanpa itu musuh memakai gerak bawaan tipenya. Tanpa
+    "at", gelombang dimulai setelah gelombang sebelumnya selesai, dan musuh
+    pertama muncul "every" ms setelah itu (sama seperti spawn_interval lama).
+    Event tunggal cukup ditulis dengan "count": 1 dan "at".
+    """
+    count = sum(spawn.get("count", 1) for spawn in level["spawns"])
+    events = np.zeros(count, dtype=EVENT)
+    clock = 0
+    i = 0
+    for spawn in level["spawns"]:
+        every = spawn.get("every", 0)
+        start = spawn.get("at", clock)
+        n = spawn.get("count", 1)
+        events["time"][i:i + n] = start + every * np.arange(1, n + 1)
+        events["type"][i:i + n] = enemy_types.index(spawn["type"])
+        events["y"][i:i + n] = spawn.get("y", RANDOM_Y)
+        events["pattern"][i:i + n] = patterns.index(spawn["pattern"]) if "pattern" in spawn else NO_PATTERN
+        events["phase"][i:i + n] = spawn.get("phase", 0)
+        clock = start + every * n
+        i += n
+    # Stabil, jadi event dengan waktu sama tetap sesuai urutan di file
+    return events[np.argsort(events["time"], kind="stable")]
+
+
+def load_levels(path, patterns=()):
+    """Baca file level sekali; hasilnya (daftar tipe musuh, array event per level)."""
+    with open(path) as file:
+        data = json.load(file)
+    enemy_types = data["enemy_types"]
+    patterns = list(patterns)
+    return enemy_types, [parse_level(level, enemy_types, patterns) for level in data["levels"]]
+
+
+class LevelStream:
+    """Membaca array event level secara berurutan.
+
+    Musuh baru dibuat saat event-nya jatuh tempo, jadi yang hidup di memori
+    hanya musuh di layar, bukan seluruh isi level.
+    """
+
+    def __init__(self, events, start_time: int):
+        self.events = events
+        self.start_time = start_time
+        self.cursor = 0
+        self.next_time = int(events["time"][0]) if len(events) else 0
+
+    @property
+    def done(self):
+        return self.cursor >= len(self.events)
+
+    @property
+    def remaining(self):
+        return len(self.events) - self.cursor
+
+    def due(self, now: int):
+        """Event (tipe, y, pola, fase) yang waktunya sudah lewat sejak panggilan sebelumnya."""
+        elapsed = now - self.start_time
+        # Jalur cepat untuk kebanyakan frame: event berikutnya belum waktunya
+        if self.done or elapsed < self.next_time:
+            return ()
+        end = int(np.searchsorted(self.events["time"], elapsed, side="right"))
+        due = self.events[self.cursor:end]
+        self.cursor = end
+        if not self.done:
+            self.next_time = int(self.events["time"][end])
+        return zip(due["type"].tolist(), due["y"].tolist(), due["pattern"].tolist(), due["phase"].tolist())
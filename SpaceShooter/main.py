@@ -1,6 +1,8 @@
 import pygame
 import random
 
+from font_cache import fonts, text_cache
+
 
 class Display:
     pygame.init()
@@ -9,7 +11,7 @@ class Display:
     clock = pygame.time.Clock()
 
     background = pygame.image.load("background.png")
-    font = pygame.font.Font("SHPinscher-Regular.otf", 35)
+    font = fonts.get(35)
 
     spaceship = pygame.image.load("spaceship.png")
     enemy_spaceship = pygame.image.load("enemy spaceship.png")
@@ -28,8 +30,7 @@ class Text:
     def display(self):
         # Change the color if selected
         color = (255, 0, 0) if self.selected else (255, 255, 255)
-        font = pygame.font.Font("SHPinscher-Regular.otf", self.size)
-        return font.render(self.text, True, color)
+        return text_cache.render(self.text, self.size, color)
 
 
 class Menu:
@@ -297,9 +298,7 @@ class Objects:
 
     def score_board(self):
         # Display the scoreboard
-        score_board = Display().font.render(
-            f"Score: {self.score}", True, (255, 255, 255)
-        )
+        score_board = text_cache.render(f"Score: {self.score}", 35, (255, 255, 255))
         Display().windows.blit(score_board, (10, 0))
 
     def insert_laser(self):
@@ -0,0 +1,132 @@
+# movement.py
+import json
+import math
+
+import numpy as np
+
+from pool import Column, SlotPool
+
+
+class MovementTable:
+    """Offset (dx, dy) per tick sejak musuh muncul, dihitung sekali per pola.
+
+    Pola periodik diulang (indeks modulo panjang tabel); pola lain berhenti
+    di offset terakhirnya.
+    """
+
+    def __init__(self, dx, dy, periodic: bool = True):
+        self.dx = np.rint(dx).astype(np.int64).tolist()
+        self.dy = np.rint(dy).astype(np.int64).tolist()
+        self.periodic = periodic
+        self.length = len(self.dx)
+
+    def offset(self, age: int):
+        if self.periodic:
+            i = age % self.length
+        else:
+            i = min(age, self.length - 1)
+        return self.dx[i], self.dy[i]
+
+
+def zigzag(step, half_period):
+    # Sama seperti ZigzagEnemy lama: arah dibalik tiap half_period tick
+    t = np.arange(1, 2 * half_period + 1)
+    direction = np.where((t // half_period) % 2 == 0, 1, -1)
+    dy = np.concatenate(([0], np.cumsum(step * direction)[:-1]))
+    return MovementTable(np.zeros_like(dy), dy)
+
+
+def sine(amplitude, frequency):
+    # Panjang tabel dibulatkan ke periode utuh dalam tick
+    period = max(1, round(2 * math.pi / frequency))
+    t = np.arange(period)
+    return MovementTable(np.zeros(period), amplitude * np.sin(2 * math.pi * t / period))
+
+
+def spiral(radius, period):
+    angle = 2 * math.pi * np.arange(period) / period
+    return MovementTable(radius * (np.cos(angle) - 1), radius * np.sin(angle))
+
+
+def bezier(points, duration):
+    # Kurva Bezier kubik dari offset (0, 0); tidak diulang
+    p0, p1, p2, p3 = (np.array(point, dtype=np.float64) for point in points)
+    t = np.linspace(0, 1, duration)[:, None]
+    curve = ((1 - t) ** 3) * p0 + 3 * ((1 - t) ** 2) * t * p1 + 3 * (1 - t) * (t ** 2) * p2 + (t ** 3) * p3
+    return MovementTable(curve[:, 0], curve[:, 1], periodic=False)
+
+
+KINDS = {"zigzag": zigzag, "sine": sine, "spiral": spiral, "bezier": bezier}
+
+
+def load_patterns(path):
+    """Baca pola gerak dari file JSON: nama -> {"kind", parameter...}.
+
+    Pola baru cukup ditambahkan di file selama jenisnya (kind) sudah ada.
+    """
+    with open(path) as file:
+        data = json.load(file)
+    patterns = {}
+    for name, spec in data.items():
+        spec = dict(spec)
+        patterns[name] = KINDS[spec.pop("kind")](**spec)
+    return patterns
+
+
+class PatternMovers(SlotPool):
+    """Semua musuh berpola digerakkan sekaligus dari tabel bersama.
+
+    Tabel semua pola ditumpuk jadi satu array (diisi offset terakhir sampai
+    sama panjang), lalu tiap step() posisi semua musuh dihitung dengan satu
+    lookup NumPy: titik muncul, geser ke kiri speed per tick, ditambah
+    offset tabel pada indeks umur + fase. Rect sprite disalin dari hasilnya.
+    """
+
+    COLUMNS = {
+        "anchor_x": Column(np.int64),
+        "anchor_y": Column(np.int64),
+        "speed": Column(np.int64),
+        "age": Column(np.int64),
+        "phase": Column(np.int64),
+        "pattern": Column(np.int64),
+    }
+    SPRITES = True
+
+    def __init__(self, patterns, capacity: int = 256):
+        self.names = list(patterns)
+        tables = [patterns[name] for name in self.names]
+        width = max(table.length for table in tables)
+        self.dx = np.array([table.dx + table.dx[-1:] * (width - table.length) for table in tables])
+        self.dy = np.array([table.dy + table.dy[-1:] * (width - table.length) for table in tables])
+        self.length = np.array([table.length for table in tables])
+        self.periodic = np.array([table.periodic for table in tables])
+        self.allocate(capacity)
+
+    def add(self, sprite, pattern: str, speed: int, phase: int = 0):
+        """Daftarkan sprite mulai dari posisi rect-nya sekarang; mengembalikan slot."""
+        i = self.take(sprite)
+        self.anchor_x[i], self.anchor_y[i] = sprite.rect.topleft
+        self.speed[i] = speed
+        self.age[i] = 0
+        self.phase[i] = phase
+        self.pattern[i] = self.names.index(pattern)
+        return i
+
+    def remove(self, i: int):
+        self.release(i)
+
+    def step(self):
+        live = self.live()
+        if len(live) == 0:
+            return
+        self.age[live] += 1
+        age = self.age[live]
+        pattern = self.pattern[live]
+        length = self.length[pattern]
+        index = age + self.phase[live]
+        index = np.where(self.periodic[pattern], index % length, np.minimum(index, length - 1))
+        xs = self.anchor_x[live] - self.speed[live] * age + self.dx[pattern, index]
+        ys = self.anchor_y[live] + self.dy[pattern, index]
+        sprites = self.sprites
+        for i, x, y in zip(live.tolist(), xs.tolist(), ys.tolist()):
+            sprites[i].rect.topleft = (x, y)
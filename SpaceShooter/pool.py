@@ -0,0 +1,88 @@
+# pool.py
+from collections import namedtuple
+
+import numpy as np
+
+# Satu kolom array per slot; width diisi untuk kolom 2D (mis. rentang sel grid)
+Column = namedtuple("Column", ["dtype", "width", "fill"], defaults=(None, 0))
+
+
+class SlotPool:
+    """Alokator slot untuk pool struct-of-arrays.
+
+    Subclass mendaftarkan kolomnya di COLUMNS (nama -> Column); array-nya
+    dibuat sebagai atribut dengan nama yang sama. Kolom alive, free list,
+    kapasitas yang digandakan saat penuh dan top (slot setelah slot
+    tertinggi yang pernah dipakai) diurus di sini. Kalau SPRITES True, tiap
+    slot juga punya tempat di list sprites.
+    """
+
+    COLUMNS = {}
+    SPRITES = False
+
+    def allocate(self, capacity: int):
+        self.capacity = capacity
+        for name, column in self.COLUMNS.items():
+            shape = capacity if column.width is None else (capacity, column.width)
+            setattr(self, name, np.full(shape, column.fill, dtype=column.dtype))
+        self.alive = np.zeros(capacity, dtype=bool)
+        if self.SPRITES:
+            self.sprites = [None] * capacity
+        self.free = []
+        self.top = 0
+
+    def grow(self):
+        names = [*self.COLUMNS, "alive"]
+        old = [getattr(self, name) for name in names]
+        sprites = self.sprites if self.SPRITES else None
+        free, top = self.free, self.top
+        self.allocate(self.capacity * 2)
+        for name, column in zip(names, old):
+            getattr(self, name)[:top] = column[:top]
+        if self.SPRITES:
+            self.sprites[:top] = sprites[:top]
+        self.free, self.top = free, top
+
+    def clear(self):
+        for name, column in self.COLUMNS.items():
+            getattr(self, name)[:] = column.fill
+        self.alive[:] = False
+        if self.SPRITES:
+            self.sprites = [None] * self.capacity
+        self.free = []
+        self.top = 0
+
+    def take(self, sprite=None):
+        """Ambil slot kosong (dari free list, atau slot baru di top) dan tandai hidup."""
+        if self.free:
+            i = self.free.pop()
+        else:
+            if self.top == self.capacity:
+                self.grow()
+            i = self.top
+            self.top += 1
+        self.alive[i] = True
+        if self.SPRITES:
+            self.sprites[i] = sprite
+        return i
+
+    def release(self, indices):
+        """Kembalikan slot ke free list; slot yang sudah mati dilewati.
+
+        Mengembalikan index yang benar-benar dilepas.
+        """
+        indices = np.atleast_1d(indices)
+        indices = indices[self.alive[indices]]
+        self.alive[indices] = False
+        released = indices.tolist()
+        if self.SPRITES:
+            for i in released:
+                self.sprites[i] = None
+        self.free.extend(released)
+        return indices
+
+    def count(self):
+        return int(np.count_nonzero(self.alive[:self.top]))
+
+    def live(self):
+        return np.flatnonzero(self.alive[:self.top])
@@ -0,0 +1,145 @@
+# profiler.py
+import atexit
+import json
+import os
+import time
+
+import numpy as np
+import pygame
+
+from font_cache import fonts
+
+
+class NullPhase:
+    """Context manager kosong, dipakai saat profiler mati supaya overhead-nya hampir nol."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_PHASE = NullPhase()
+
+
+class Phase:
+    def __init__(self, profiler: "FrameProfiler", name: str, id: int):
+        self.profiler = profiler
+        self.name = name
+        self.id = id
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self, self.start, time.perf_counter_ns() - self.start)
+        return False
+
+
+class FrameProfiler:
+    """Mencatat durasi tiap fase frame ke ring buffer berukuran tetap.
+
+    Aktifkan dengan SPACEWARS_PROFILE=1 (trace disimpan ke SPACEWARS_TRACE,
+    default spacewars-trace.json) atau enable(). Selama mati, phase()
+    hanya mengembalikan NULL_PHASE.
+    """
+
+    def __init__(self, samples: int = 600, events: int = 16384):
+        self.enabled = False
+        self.samples = samples
+        self.durations = {}  # nama fase -> ring buffer durasi (ns)
+        self.counts = {}
+        self.phases = {}  # nama fase -> Phase, dipakai ulang tiap frame
+        self.names = []
+        # Timeline untuk Chrome trace: ring buffer (fase, mulai, durasi)
+        self.event_phase = np.zeros(events, dtype=np.int32)
+        self.event_start = np.zeros(events, dtype=np.int64)
+        self.event_duration = np.zeros(events, dtype=np.int64)
+        self.event_count = 0
+        self.trace_path = None
+        # Overlay dihitung ulang paling sering tiap overlay_interval detik;
+        # di antaranya surface teks yang sama di-blit lagi
+        self.overlay_interval = 0.25
+        self.overlay_time = None
+        self.overlay_lines = []
+
+    def enable(self, trace_path: str = None):
+        self.enabled = True
+        if trace_path and self.trace_path is None:
+            atexit.register(self.dump_trace, trace_path)
+        self.trace_path = trace_path
+
+    def phase(self, name: str):
+        if not self.enabled:
+            return NULL_PHASE
+        phase = self.phases.get(name)
+        if phase is None:
+            phase = self.phases[name] = Phase(self, name, len(self.names))
+            self.durations[name] = np.zeros(self.samples, dtype=np.int64)
+            self.counts[name] = 0
+            self.names.append(name)
+        return phase
+
+    def record(self, phase: Phase, start: int, duration: int):
+        count = self.counts[phase.name]
+        self.durations[phase.name][count % self.samples] = duration
+        self.counts[phase.name] = count + 1
+
+        i = self.event_count % len(self.event_start)
+        self.event_phase[i] = phase.id
+        self.event_start[i] = start
+        self.event_duration[i] = duration
+        self.event_count += 1
+
+    def percentiles(self, name: str):
+        """(p50, p95, p99) dalam milidetik dari sampel terakhir di ring buffer."""
+        filled = self.durations[name][:min(self.counts[name], self.samples)]
+        if len(filled) == 0:
+            return 0.0, 0.0, 0.0
+        return tuple(np.percentile(filled, (50, 95, 99)) / 1e6)
+
+    def report(self):
+        return {name: self.percentiles(name) for name in self.names}
+
+    def overlay(self, surface: pygame.Surface, position=(10, 90)):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self.overlay_time is None or now - self.overlay_time >= self.overlay_interval:
+            self.overlay_time = now
+            font = fonts.get(20)
+            lines = ["phase            p50     p95     p99 ms"]
+            for name in self.names:
+                p50, p95, p99 = self.percentiles(name)
+                lines.append(f"{name:<14} {p50:>7.3f} {p95:>7.3f} {p99:>7.3f}")
+            self.overlay_lines = [font.render(line, True, (255, 255, 0)) for line in lines]
+        x, y = position
+        surface.blits([(line, (x, y + 20 * i)) for i, line in enumerate(self.overlay_lines)], False)
+
+    def dump_trace(self, path: str):
+        """Simpan timeline sebagai Chrome trace JSON (buka di chrome://tracing atau Perfetto)."""
+        total = len(self.event_start)
+        count = min(self.event_count, total)
+        first = self.event_count - count
+        order = [(first + i) % total for i in range(count)]
+        events = [
+            {
+                "name": self.names[self.event_phase[i]],
+                "ph": "X",
+                "ts": int(self.event_start[i]) / 1000,
+                "dur": int(self.event_duration[i]) / 1000,
+                "pid": os.getpid(),
+                "tid": 0,
+            }
+            for i in order
+        ]
+        with open(path, "w") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
+
+
+profiler = FrameProfiler()
+if os.environ.get("SPACEWARS_PROFILE") == "1":
+    profiler.enable(os.environ.get("SPACEWARS_TRACE", "spacewars-trace.json"))
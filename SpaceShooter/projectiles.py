@@ -0,0 +1,141 @@
+# projectiles.py
+import numpy as np
+import pygame
+
+from pool import Column, SlotPool
+from spatial_hash import SpatialHash
+
+BULLET = 0
+MISSILE = 1
+
+# Nilai rentang sel untuk slot yang belum terdaftar di grid
+UNPLACED = np.iinfo(np.int64).min
+
+
+class ProjectilePool(SlotPool):
+    """Semua peluru dan misil musuh dalam array NumPy (struct-of-arrays).
+
+    Slot yang kosong dipakai ulang lewat free list, jadi menembak tidak
+    membuat objek baru. Gerak, culling di luar layar dan tes tabrakan
+    dengan pemain dikerjakan sekaligus untuk semua proyektil di step().
+    Posisi proyektil juga dicatat di SpatialHash supaya tes laser pemain
+    cukup memeriksa proyektil di sel terdekat.
+    """
+
+    COLUMNS = {
+        "x": Column(np.float64),
+        "y": Column(np.float64),
+        "vx": Column(np.float64),
+        "vy": Column(np.float64),
+        "kind": Column(np.int8),
+        "owner": Column(np.int64),
+        # Rentang sel grid (x0, y0, x1, y1) per slot
+        "span": Column(np.int64, 4, UNPLACED),
+    }
+
+    def __init__(self, width: int, height: int, sizes, capacity: int = 4096, cell_size: int = 64):
+        self.width = width
+        self.height = height
+        # sizes[kind] = (lebar, tinggi) gambar proyektil
+        self.kind_w = np.array([w for w, _ in sizes], dtype=np.int64)
+        self.kind_h = np.array([h for _, h in sizes], dtype=np.int64)
+        self.grid = SpatialHash(cell_size)
+        self.allocate(capacity)
+
+    def clear(self):
+        super().clear()
+        self.grid.clear()
+
+    def spawn(self, x, y, vx, vy, kind: int, owner: int):
+        i = self.take()
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.kind[i] = kind
+        self.owner[i] = owner
+        self.sync_grid(np.array([i]))
+        return i
+
+    def kill(self, indices):
+        indices = self.release(indices)
+        self.span[indices] = UNPLACED
+        for i in indices.tolist():
+            self.grid.remove(i)
+
+    def kill_owner(self, owner: int):
+        top = self.top
+        self.kill(np.flatnonzero(self.alive[:top] & (self.owner[:top] == owner)))
+
+    def count(self, owner: int = None, kind: int = None):
+        top = self.top
+        mask = self.alive[:top]
+        if owner is not None:
+            mask = mask & (self.owner[:top] == owner)
+        if kind is not None:
+            mask = mask & (self.kind[:top] == kind)
+        return int(np.count_nonzero(mask))
+
+    def rects(self, indices):
+        # Sama seperti pygame.Rect(x, y, w, h): koordinat float dipotong ke int
+        kind = self.kind[indices]
+        left = np.trunc(self.x[indices]).astype(np.int64)
+        top = np.trunc(self.y[indices]).astype(np.int64)
+        return left, top, self.kind_w[kind], self.kind_h[kind]
+
+    def sync_grid(self, indices):
+        # Hitung rentang sel untuk semua index sekaligus, lalu pindahkan di
+        # grid hanya proyektil yang rentang selnya berubah
+        if len(indices) == 0:
+            return
+        left, top, w, h = self.rects(indices)
+        size = self.grid.cell_size
+        span = np.stack((left // size, top // size, (left + w - 1) // size, (top + h - 1) // size), axis=1)
+        changed = np.any(span != self.span[indices], axis=1)
+        moved = indices[changed]
+        self.span[moved] = span[changed]
+        for i, cell_span in zip(moved.tolist(), span[changed].tolist()):
+            self.grid.move(i, tuple(cell_span))
+
+    def nearby(self, rect: pygame.Rect):
+        """Index proyektil hidup di sel grid yang sama dengan rect, urut index."""
+        return np.array(sorted(self.grid.query(rect)), dtype=np.int64)
+
+    def collide_rect(self, rect: pygame.Rect, indices=None):
+        """Index proyektil hidup yang bertabrakan dengan rect (semantik colliderect)."""
+        if indices is None:
+            indices = self.nearby(rect)
+        if rect.width <= 0 or rect.height <= 0 or len(indices) == 0:
+            return indices[:0]
+        left, top, w, h = self.rects(indices)
+        hit = ((left < rect.right) & (rect.x < left + w) &
+               (top < rect.bottom) & (rect.y < top + h))
+        return indices[hit]
+
+    def step(self, player: pygame.Rect):
+        """Gerakkan semua proyektil satu frame.
+
+        Mengembalikan (draws, hits): draws berisi (kind, x, y) posisi sebelum
+        bergerak untuk digambar, hits jumlah proyektil yang mengenai pemain.
+        """
+        live = self.live()
+        draws = (self.kind[live], self.x[live], self.y[live])
+
+        self.x[live] += self.vx[live]
+        self.y[live] += self.vy[live]
+
+        hits = len(self.collide_rect(player, live))
+
+        x, y = self.x[live], self.y[live]
+        out = (x < 0) | (x > self.width) | (y < 0) | (y > self.height)
+        self.kill(live[out])
+        self.sync_grid(live[~out])
+        return draws, hits
+
+    @staticmethod
+    def draw(surface: pygame.Surface, images, draws):
+        kinds, xs, ys = draws
+        surface.blits(
+            [(images[k], (x, y)) for k, x, y in zip(kinds.tolist(), xs.tolist(), ys.tolist())],
+            doreturn=False,
+        )
@@ -3,6 +3,11 @@ import random
 import math
 import sys
 
+from animation import atlas
+from homing import HomingSwarm
+from sprite_pool import PooledSprite, SpritePool
+from starfield import ParallaxBackground, StarfieldGenerator
+
 # Initialize Pygame
 pygame.init()
 
@@ -17,22 +22,17 @@ FPS = 60
 clock = pygame.time.Clock()
 
 # Load assets
-# Backgrounds
+# Backgrounds: gambar yang hilang diganti starfield prosedural (seed = nomor
+# background) yang dibuat sekali lalu dibaca dari cache disk
+starfield = StarfieldGenerator()
 backgrounds = []
 for i in range(6):
     try:
         bg = pygame.image.load(f"background{i}.jpg")
-        backgrounds.append(pygame.transform.scale(bg, (WIDTH_SCREEN, HEIGHT_SCREEN)))
+        bg = pygame.transform.scale(bg, (WIDTH_SCREEN, HEIGHT_SCREEN)).convert()
+        backgrounds.append(ParallaxBackground([bg]))
     except:
-        # Fallback to creating a background if images not found
-        bg = pygame.Surface((WIDTH_SCREEN, HEIGHT_SCREEN))
-        bg.fill((0, 0, 0))
-        for _ in range(50):
-            x = random.randint(0, WIDTH_SCREEN)
-            y = random.randint(0, HEIGHT_SCREEN)
-            radius = random.randint(1, 3)
-            pygame.draw.circle(bg, (255, 255, 255), (x, y), radius)
-        backgrounds.append(bg)
+        backgrounds.append(starfield.background(i, (WIDTH_SCREEN, HEIGHT_SCREEN)))
 
 # Try to load font, use default if not found
 try:
@@ -64,6 +64,14 @@ player_explosion = load_image("boom1.png", (60, 60), (255, 255, 0))
 enemy_explosion = load_image("boom2.png", (60, 60), (255, 100, 0))
 asteroid_img = load_image("asteroid.png", (40, 40), (150, 150, 150))
 
+# Frame ledakan dibuat sekali di sini dan dipakai bersama semua Explosion
+player_explosion_anim = atlas.burst("player_explosion", player_explosion, frame_ms=50)
+enemy_explosion_anim = atlas.burst("enemy_explosion", enemy_explosion, frame_ms=50)
+
+# Semua misil pengejar digerakkan sekaligus; turn_rate (radian per frame)
+# bisa diisi untuk membatasi belokan
+homing_swarm = HomingSwarm(missile.get_size(), speed=5, left_bias=0.8, pursuit_x=0.2, pursuit_y=0.5)
+
 
 # Try to load sounds, use empty sounds if not found
 def load_sound(name):
@@ -138,9 +146,7 @@ class Player(pygame.sprite.Sprite):
         current_time = pygame.time.get_ticks()
         if current_time - self.last_shot > self.shot_delay:
             self.last_shot = current_time
-            bullet = PlayerBullet(self.rect.right, self.rect.centery)
-            all_sprites.add(bullet)
-            player_bullets.add(bullet)
+            player_bullet_pool.acquire(self.rect.right, self.rect.centery)
             shoot_sound.play()
 
 
@@ -202,97 +208,95 @@ class Enemy(pygame.sprite.Sprite):
 
     def shoot(self):
         if self.enemy_type == "spaceship":
-            bullet = EnemyBullet(self.rect.left, self.rect.centery)
+            enemy_bullet_pool.acquire(self.rect.left, self.rect.centery)
         else:  # missile_craft uses missiles
-            bullet = HomingMissile(self.rect.left, self.rect.centery)
-
-        all_sprites.add(bullet)
-        enemy_bullets.add(bullet)
+            missile_pool.acquire(self.rect.left, self.rect.centery)
         enemy_shoot_sound.play()
 
 
-class PlayerBullet(pygame.sprite.Sprite):
+class PlayerBullet(PooledSprite):
     def __init__(self, x, y):
         super().__init__()
         self.image = player_bullet
         self.rect = self.image.get_rect()
+        self.speed = 10
+        self.reset(x, y)
+
+    def reset(self, x, y):
         self.rect.x = x
         self.rect.y = y
-        self.speed = 10
 
     def update(self):
+        if not self.active:
+            return
         self.rect.x += self.speed
         if self.rect.left > WIDTH_SCREEN:
             self.kill()
 
 
-class EnemyBullet(pygame.sprite.Sprite):
+class EnemyBullet(PooledSprite):
     def __init__(self, x, y):
         super().__init__()
         self.image = enemy_bullet
         self.rect = self.image.get_rect()
+        self.speed = 7
+        self.reset(x, y)
+
+    def reset(self, x, y):
         self.rect.x = x
         self.rect.y = y
-        self.speed = 7
 
     def update(self):
+        if not self.active:
+            return
         self.rect.x -= self.speed
         if self.rect.right < 0:
             self.kill()
 
 
-class HomingMissile(pygame.sprite.Sprite):
+class HomingMissile(PooledSprite):
+    # Posisi dan kemudi ada di homing_swarm; sprite ini hanya untuk gambar dan tabrakan
     def __init__(self, x, y):
         super().__init__()
         self.image = missile
         self.rect = self.image.get_rect()
+        self.slot = None
+        self.reset(x, y)
+
+    def reset(self, x, y):
         self.rect.x = x
         self.rect.y = y
-        self.speed = 5
-
-    def update(self):
-        # Basic homing behavior towards player
-        if player.sprite:
-            target_x = player.sprite.rect.centerx
-            target_y = player.sprite.rect.centery
-
-            dx = target_x - self.rect.centerx
-            dy = target_y - self.rect.centery
+        self.slot = homing_swarm.spawn(x, y, self)
 
-            # Normalize
-            distance = max(1, math.sqrt(dx ** 2 + dy ** 2))
-            dx = dx / distance
-            dy = dy / distance
+    def kill(self):
+        if self.active:
+            homing_swarm.kill(self.slot)
+        super().kill()
 
-            # Move towards player, but primarily leftward
-            self.rect.x -= self.speed * 0.8
-            self.rect.x += dx * self.speed * 0.2
-            self.rect.y += dy * self.speed * 0.5
-        else:
-            # If player doesn't exist, just move left
-            self.rect.x -= self.speed
 
-        if self.rect.right < 0:
-            self.kill()
-
-
-class Explosion(pygame.sprite.Sprite):
+class Explosion(PooledSprite):
     def __init__(self, x, y, is_player=False):
         super().__init__()
-        self.image = player_explosion if is_player else enemy_explosion
+        self.reset(x, y, is_player)
+
+    def reset(self, x, y, is_player=False):
+        self.animation = player_explosion_anim if is_player else enemy_explosion_anim
+        self.image = self.animation[0]
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
         self.frame = 0
         self.last_update = pygame.time.get_ticks()
-        self.frame_rate = 50  # how fast the animation plays
 
     def update(self):
+        if not self.active:
+            return
         now = pygame.time.get_ticks()
-        if now - self.last_update > self.frame_rate:
+        if now - self.last_update > self.animation.frame_ms:
             self.frame += 1
-            if self.frame > 8:  # Assume 8 frames of animation
+            if self.frame >= len(self.animation):
                 self.kill()
             else:
+                self.image = self.animation[self.frame]
                 self.last_update = now
 
 
@@ -304,6 +308,13 @@ player_bullets = pygame.sprite.Group()
 enemy_bullets = pygame.sprite.Group()
 explosions = pygame.sprite.Group()
 
+# Pool per tipe sprite: peluru dan ledakan dipakai ulang, tidak dibuat baru tiap tembakan
+player_bullet_pool = SpritePool(PlayerBullet, all_sprites, player_bullets)
+enemy_bullet_pool = SpritePool(EnemyBullet, all_sprites, enemy_bullets)
+missile_pool = SpritePool(HomingMissile, all_sprites, enemy_bullets)
+explosion_pool = SpritePool(Explosion, all_sprites, explosions)
+sprite_pools = [player_bullet_pool, enemy_bullet_pool, missile_pool, explosion_pool]
+
 # Create player
 player_ship_sprite = Player()
 player.add(player_ship_sprite)
@@ -390,6 +401,9 @@ def reset_game():
     player_bullets.empty()
     enemy_bullets.empty()
     explosions.empty()
+    for pool in sprite_pools:
+        pool.clear()
+    homing_swarm.clear()
 
     # Reset variables
     score = 0
@@ -443,6 +457,9 @@ while running:
     if game_state == "playing":
         # Update
         all_sprites.update()
+        target = player.sprite.rect.center if player.sprite else None
+        for gone in homing_swarm.step(target):
+            gone.kill()
 
         # Spawn enemies
         current_time = pygame.time.get_ticks()
@@ -467,9 +484,7 @@ while running:
                 score += enemy.points
                 enemies_defeated += 1
                 explosion_sound.play()
-                explosion = Explosion(enemy.rect.center[0], enemy.rect.center[1])
-                explosions.add(explosion)
-                all_sprites.add(explosion)
+                explosion_pool.acquire(enemy.rect.center[0], enemy.rect.center[1])
                 enemy.kill()
 
                 # Level up every 10 enemies defeated
@@ -483,9 +498,7 @@ while running:
             if hits:
                 player.sprite.lives -= 1
                 explosion_sound.play()
-                explosion = Explosion(player.sprite.rect.center[0], player.sprite.rect.center[1], True)
-                explosions.add(explosion)
-                all_sprites.add(explosion)
+                explosion_pool.acquire(player.sprite.rect.center[0], player.sprite.rect.center[1], True)
 
                 if player.sprite.lives <= 0:
                     player.sprite.kill()
@@ -496,9 +509,7 @@ while running:
             if hits:
                 player.sprite.lives -= 1
                 explosion_sound.play()
-                explosion = Explosion(player.sprite.rect.center[0], player.sprite.rect.center[1], True)
-                explosions.add(explosion)
-                all_sprites.add(explosion)
+                explosion_pool.acquire(player.sprite.rect.center[0], player.sprite.rect.center[1], True)
 
                 if player.sprite.lives <= 0:
                     player.sprite.kill()
@@ -513,10 +524,7 @@ while running:
     bg_index = (level - 1) % len(backgrounds)
 
     # Create a scrolling effect
-    rel_x = bg_scroll % WIDTH_SCREEN
-    screen.blit(backgrounds[bg_index], (rel_x - WIDTH_SCREEN, 0))
-    if rel_x < WIDTH_SCREEN:
-        screen.blit(backgrounds[bg_index], (rel_x, 0))
+    backgrounds[bg_index].draw(screen, bg_scroll)
     bg_scroll += bg_speed
 
     # Draw all sprites
@@ -0,0 +1,85 @@
+# spatial_hash.py
+from collections import defaultdict
+
+import pygame
+
+
+class SpatialHash:
+    """Grid seragam untuk broadphase tabrakan.
+
+    Setiap key disimpan di semua sel yang disentuh rect-nya. update() hanya
+    memindahkan key kalau rentang selnya berubah, jadi objek yang bergerak
+    pelan di dalam sel yang sama hampir tidak ada biayanya.
+    """
+
+    def __init__(self, cell_size: int):
+        self.cell_size = cell_size
+        self.cells = defaultdict(set)
+        self.spans = {}
+
+    def span(self, rect: pygame.Rect):
+        # Sel pertama dan terakhir yang disentuh rect (piksel kanan/bawah = right - 1)
+        size = self.cell_size
+        return (
+            rect.left // size,
+            rect.top // size,
+            (rect.right - 1) // size,
+            (rect.bottom - 1) // size,
+        )
+
+    def insert(self, key, rect: pygame.Rect):
+        self.place(key, self.span(rect))
+
+    def update(self, key, rect: pygame.Rect):
+        self.move(key, self.span(rect))
+
+    def move(self, key, span):
+        old = self.spans.get(key)
+        if old == span:
+            return
+        if old is not None:
+            self.unplace(key, old)
+        self.place(key, span)
+
+    def remove(self, key):
+        old = self.spans.pop(key, None)
+        if old is not None:
+            self.unplace(key, old)
+
+    def clear(self):
+        self.cells.clear()
+        self.spans.clear()
+
+    def query(self, rect: pygame.Rect):
+        """Semua key yang berbagi sel dengan rect (kandidat, belum tentu bertabrakan)."""
+        x0, y0, x1, y1 = self.span(rect)
+        found = set()
+        cells = self.cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found |= bucket
+        return found
+
+    def __contains__(self, key):
+        return key in self.spans
+
+    def __len__(self):
+        return len(self.spans)
+
+    def place(self, key, span):
+        x0, y0, x1, y1 = span
+        self.spans[key] = span
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                self.cells[(cx, cy)].add(key)
+
+    def unplace(self, key, span):
+        x0, y0, x1, y1 = span
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = self.cells[(cx, cy)]
+                bucket.discard(key)
+                if not bucket:
+                    del self.cells[(cx, cy)]
@@ -0,0 +1,80 @@
+# sprite_pool.py
+import pygame
+
+# Posisi parkir sprite yang sedang tidak dipakai: jauh di luar layar, jadi
+# tidak pernah bertabrakan dan blit-nya langsung ter-clip
+PARKED = (-10000, -10000)
+
+
+class PooledSprite(pygame.sprite.Sprite):
+    """Sprite yang dipakai ulang lewat SpritePool.
+
+    Subclass mengisi state di reset(*args) (dipanggil juga saat pertama
+    dibuat) dan mengecek self.active di update(). kill() tidak mengeluarkan
+    sprite dari group, tapi mengembalikannya ke pool.
+    """
+
+    pool = None
+    active = False
+
+    def reset(self, *args):
+        pass
+
+    def kill(self):
+        if self.pool is not None:
+            self.pool.release(self)
+        else:
+            super().kill()
+
+
+class SpritePool:
+    """Free list per tipe sprite; sprite tetap jadi anggota group-nya."""
+
+    def __init__(self, sprite_class, *groups):
+        self.sprite_class = sprite_class
+        self.groups = groups
+        self.free = []
+        self.in_use = 0
+        self.high_water = 0
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, *args):
+        if self.free:
+            sprite = self.free.pop()
+            sprite.reset(*args)
+            self.reused += 1
+        else:
+            sprite = self.sprite_class(*args)
+            sprite.pool = self
+            self.created += 1
+        # Hanya ditambahkan ke group kalau sempat dikosongkan (mis. reset game)
+        if not sprite.alive():
+            sprite.add(*self.groups)
+        sprite.active = True
+        self.in_use += 1
+        self.high_water = max(self.high_water, self.in_use)
+        return sprite
+
+    def release(self, sprite: PooledSprite):
+        if not sprite.active:
+            return
+        sprite.active = False
+        sprite.rect.topleft = PARKED
+        self.free.append(sprite)
+        self.in_use -= 1
+
+    def clear(self):
+        # Dipakai setelah group di-empty(): lepaskan semua instance lama
+        self.free = []
+        self.in_use = 0
+
+    def stats(self):
+        return {
+            "in_use": self.in_use,
+            "free": len(self.free),
+            "size": self.in_use + len(self.free),
+            "high_water": self.high_water,
+            "created": self.created,
+            "reused": self.reused,
+        }
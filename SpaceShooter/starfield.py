@@ -0,0 +1,138 @@
+# starfield.py
+import os
+
+import numpy as np
+import pygame
+
+from assets import AssetManager
+
+# Hitam murni dipakai sebagai colorkey lapisan bintang
+TRANSPARENT = (0, 0, 0)
+
+
+def periodic_noise(rng, width: int, height: int, cells: int):
+    """Value noise halus (0..1) berukuran (width, height) yang menyambung di kiri-kanan."""
+    grid_w, grid_h = cells, max(2, cells * height // width)
+    grid = rng.random((grid_w, grid_h + 1))
+    grid = np.vstack((grid, grid[:1]))  # kolom pertama diulang di akhir supaya bisa di-tile
+    # Interpolasi smoothstep, dipisah per sumbu: dulu sepanjang x pada grid
+    # kecil, baru sepanjang y pada ukuran penuh
+    columns = smooth_lerp(grid, width, axis=0)
+    return smooth_lerp(columns, height, axis=1)
+
+
+def smooth_lerp(grid, length: int, axis: int):
+    points = grid.shape[axis] - 1
+    t = np.linspace(0, points, length, endpoint=False)
+    i = t.astype(np.int64)
+    f = t - i
+    f = f * f * (3 - 2 * f)
+    if axis == 0:
+        return grid[i] * (1 - f[:, None]) + grid[i + 1] * f[:, None]
+    return grid[:, i] * (1 - f[None, :]) + grid[:, i + 1] * f[None, :]
+
+
+def nebula_pixels(rng, width: int, height: int):
+    # Kepadatan awan dari beberapa oktaf noise; hanya bagian yang padat yang
+    # terlihat, sisanya tetap gelap supaya bintang terlihat. Noise kedua
+    # mencampur dua warna awan.
+    density = np.zeros((width, height), dtype=np.float32)
+    for octave, cells in enumerate((4, 8, 16, 32)):
+        density += periodic_noise(rng, width, height, cells) * 0.5 ** octave
+    density = np.clip((density / 1.875 - 0.45) / 0.4, 0, 1)
+    density *= np.sqrt(density)  # kontras ** 1.5
+    mix = periodic_noise(rng, width, height, 3).astype(np.float32)
+    first, second = rng.uniform(40, 200, (2, 3)).astype(np.float32)
+    pixels = np.empty((width, height, 3), dtype=np.uint8)
+    for channel in range(3):
+        pixels[:, :, channel] = density * (first[channel] + (second[channel] - first[channel]) * mix)
+    return pixels
+
+
+def star_pixels(rng, width: int, height: int, count: int, radius: int, brightness):
+    pixels = np.zeros((width, height, 3), dtype=np.uint8)
+    xs = rng.integers(0, width, count)
+    ys = rng.integers(0, height, count)
+    # Kecerahan minimal di atas 0 supaya bintang tidak pernah sama dengan colorkey
+    values = rng.integers(brightness[0], brightness[1], count).astype(np.uint8)
+    color = np.stack((values, values, np.minimum(255, values.astype(np.int64) + 20).astype(np.uint8)), axis=1)
+    for dx in range(radius):
+        for dy in range(radius):
+            pixels[(xs + dx) % width, np.minimum(ys + dy, height - 1)] = color
+    return pixels
+
+
+class StarfieldGenerator:
+    """Background luar angkasa dari seed: lapisan 0 nebula, lapisan 1.. bintang.
+
+    Pixel dibuat sekaligus dengan NumPy lalu disalin lewat surfarray, dan
+    hasilnya disimpan ke cache disk dengan kunci (seed, ukuran, lapisan).
+    Start berikutnya cukup membaca cache tanpa membuat ulang.
+    """
+
+    # (jumlah bintang per 1600x1000, radius, rentang kecerahan) untuk lapisan jauh -> dekat
+    STAR_LAYERS = [(900, 1, (40, 140)), (250, 2, (120, 220)), (60, 3, (200, 256))]
+
+    def __init__(self, assets: AssetManager = None):
+        self.assets = assets or AssetManager()
+        self.generated = 0
+        self.cache_hits = 0
+
+    @property
+    def layers(self):
+        return 1 + len(self.STAR_LAYERS)
+
+    def cache_path(self, seed: int, size, layer: int):
+        return os.path.join(self.assets.cache_dir, f"starfield-{seed}-{size[0]}x{size[1]}-{layer}.raw")
+
+    def generate(self, seed: int, size, layer: int):
+        width, height = size
+        # Tiap lapisan punya generator sendiri, jadi hasilnya tidak bergantung urutan pembuatan
+        rng = np.random.default_rng((seed, layer))
+        if layer == 0:
+            # Nebula hanya berisi frekuensi rendah: dibuat setengah ukuran lalu di-smoothscale
+            half = (max(1, width // 2), max(1, height // 2))
+            surface = pygame.Surface(half, depth=24)
+            pygame.surfarray.blit_array(surface, nebula_pixels(rng, *half))
+            return pygame.transform.smoothscale(surface, size)
+        count, radius, brightness = self.STAR_LAYERS[layer - 1]
+        count = count * width * height // (1600 * 1000)
+        surface = pygame.Surface(size, depth=24)
+        pygame.surfarray.blit_array(surface, star_pixels(rng, width, height, count, radius, brightness))
+        return surface
+
+    def layer(self, seed: int, size, layer: int):
+        cached = self.cache_path(seed, size, layer)
+        if os.path.exists(cached):
+            self.cache_hits += 1
+            raw = self.assets.read_cache(cached, "RGB")
+        else:
+            self.generated += 1
+            raw = self.generate(seed, size, layer)
+            self.assets.write_cache(cached, raw, "RGB")
+        surface = raw.convert()
+        if layer > 0:
+            surface.set_colorkey(TRANSPARENT, pygame.RLEACCEL)
+        return surface
+
+    def background(self, seed: int, size, speeds=(0.25, 0.5, 1.0, 1.75)):
+        return ParallaxBackground([self.layer(seed, size, i) for i in range(self.layers)], speeds)
+
+
+class ParallaxBackground:
+    """Lapisan background yang bergulir dengan kecepatan berbeda.
+
+    Tiap lapisan cukup dua blit per frame; tidak ada pembuatan pixel saat main.
+    """
+
+    def __init__(self, layers, speeds=(1.0,)):
+        self.layers = layers
+        self.speeds = speeds
+        self.width = layers[0].get_width()
+
+    def draw(self, surface: pygame.Surface, scroll: float):
+        for layer, speed in zip(self.layers, self.speeds):
+            offset = int(scroll * speed) % self.width
+            surface.blit(layer, (offset, 0))
+            if offset:
+                surface.blit(layer, (offset - self.width, 0))
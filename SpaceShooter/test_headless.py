@@ -0,0 +1,19 @@
+# test_headless.py
+# Regresi restart SpaceWars5: restart berulang tidak boleh menumpuk Objects
+# atau memori. Dijalankan dengan driver SDL dummy (dipasang oleh headless.py).
+#
+#   python -m pytest SpaceShooter/test_headless.py
+import os
+
+# Aset SpaceWars5 dibaca relatif terhadap folder ini
+os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+# headless dulu: ia memasang driver SDL dummy sebelum SpaceWars5 membuka mixer
+from headless import MAX_RESTART_GROWTH, game, restart_check
+
+
+def test_restarts_do_not_leak():
+    scene, rounds, growth = restart_check(restarts=500, seed=1)
+    assert isinstance(scene, game.GameOver)
+    assert rounds == 0
+    assert growth < MAX_RESTART_GROWTH